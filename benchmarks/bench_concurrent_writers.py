@@ -0,0 +1,77 @@
+"""
+benchmarks/bench_concurrent_writers.py
+
+Stress test for multi-process JSONStorage writes. N processes share one tasks.json,
+each loads it once and then inserts tasks one at a time from that copy. Reports
+throughput, and verifies that no update was lost, for both the snapshot-rewriting
+and the journaled mode.
+
+Usage:
+    python -m benchmarks.bench_concurrent_writers --tasks 20000 --writers 8 --writes 50
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+from benchmarks.dataset import make_dataset
+from task_manager_pro.storage.json_storage import JSONStorage
+
+
+def writer(path: str, journaled: bool, index: int, writes: int, start) -> None:
+    """
+    Loads the file once, then inserts `writes` tasks through insert_task().
+    """
+    storage = JSONStorage(path, journaled=journaled)
+    data = storage.load_data()
+    start.wait()
+    for i in range(writes):
+        task = {"id": f"bench-{index}-{i}", "title": f"Concurrent {i}", "description": "",
+                "due_date": "2030-01-01", "completed": False, "user": f"user{index}"}
+        data["tasks"].append(task)
+        storage.insert_task(data, task)
+
+
+def run(path: str, journaled: bool, writers: int, writes: int) -> float:
+    """
+    Runs the writer processes together and returns the elapsed wall time.
+    """
+    start = multiprocessing.Event()
+    processes = [multiprocessing.Process(target=writer, args=(path, journaled, i, writes, start))
+                 for i in range(writers)]
+    for p in processes:
+        p.start()
+    began = time.perf_counter()
+    start.set()
+    for p in processes:
+        p.join()
+    return time.perf_counter() - began
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent writer stress test")
+    parser.add_argument("--tasks", type=int, default=20_000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--writes", type=int, default=50, help="Inserts per writer process")
+    args = parser.parse_args()
+
+    dataset = make_dataset(args.tasks, args.users)
+    total = args.writers * args.writes
+    print(f"Dataset: {args.tasks:,} tasks; {args.writers} writers x {args.writes} inserts")
+    for journaled in (False, True):
+        with tempfile.TemporaryDirectory() as workdir:
+            path = os.path.join(workdir, "tasks.json")
+            with open(path, "w") as f:
+                json.dump(dataset, f)
+            elapsed = run(path, journaled, args.writers, args.writes)
+            stored = sum(t["id"].startswith("bench-") for t in JSONStorage(path).load_data()["tasks"])
+        mode = "journal " if journaled else "snapshot"
+        print(f"{mode}: {elapsed:7.2f} s  {total / elapsed:8.0f} writes/s  "
+              f"{stored}/{total} stored, {total - stored} lost")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+benchmarks/bench_due_index.py
+
+Compares the old "due or overdue" check (scan every task, strptime each due date)
+with the TaskIndex bisect range query.
+
+Usage:
+    python -m benchmarks.bench_due_index --tasks 100000 --users 1000
+"""
+
+import argparse
+import time
+from datetime import datetime, date
+from benchmarks.dataset import make_dataset
+from task_manager_pro.services.task_index import TaskIndex
+
+
+def scan_due_tasks(data, username: str, today: date):
+    """
+    The pre-index implementation used by _print_due_reminders and send_reminders.py.
+    """
+    return [
+        t for t in data["tasks"]
+        if t["user"] == username
+        and not t["completed"]
+        and datetime.strptime(t["due_date"], "%Y-%m-%d").date() <= today
+    ]
+
+
+def _timed(func, repeat: int = 1) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Due-date index benchmark")
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--users", type=int, default=1000)
+    args = parser.parse_args()
+
+    data = make_dataset(args.tasks, args.users)
+    today = date.today()
+    usernames = [u["username"] for u in data["users"]]
+
+    build = _timed(lambda: TaskIndex(data))
+    index = TaskIndex(data)
+
+    # Single-user check, as done after every login / list-tasks
+    scan_one = _timed(lambda: scan_due_tasks(data, "user0", today), repeat=3)
+    index_one = _timed(lambda: index.due_tasks("user0", today), repeat=1000)
+
+    # All-users sweep, as done by send_reminders.py (scan is sampled and extrapolated)
+    sample = usernames[:20]
+    scan_all = _timed(lambda: [scan_due_tasks(data, u, today) for u in sample]) * len(usernames) / len(sample)
+    index_all = _timed(lambda: [index.due_tasks(u, today) for u in usernames])
+
+    assert len(scan_due_tasks(data, "user0", today)) == len(index.due_tasks("user0", today))
+
+    print(f"Dataset: {args.tasks:,} tasks / {args.users:,} users")
+    print(f"Index build:                 {build * 1000:10.2f} ms")
+    print(f"One user   scan  / index:    {scan_one * 1000:10.2f} ms / {index_one * 1000:.4f} ms "
+          f"({scan_one / index_one:,.0f}x)")
+    print(f"All users  scan* / index:    {scan_all * 1000:10.2f} ms / {index_all * 1000:.2f} ms "
+          f"({scan_all / index_all:,.0f}x)  *extrapolated from {len(sample)} users")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+benchmarks/bench_durability.py
+
+Measures write throughput of JSONStorage at each durability level (none, group,
+every-write) for a burst of individual insert_task() calls, as the server or an
+interactive shell would issue them, in both journaled and snapshot mode.
+
+Usage:
+    python -m benchmarks.bench_durability --tasks 10000 --writes 2000
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from benchmarks.dataset import make_dataset
+from task_manager_pro.storage.json_storage import DURABILITY_LEVELS, JSONStorage
+
+
+def measure(path: str, journaled: bool, durability: str, writes: int) -> float:
+    """
+    Returns writes per second for `writes` inserts, including the final flush.
+    """
+    storage = JSONStorage(path, journaled=journaled, durability=durability)
+    data = storage.load_data()
+    start = time.perf_counter()
+    for i in range(writes):
+        task = {"id": f"bench-{i}", "title": f"Burst {i}", "description": "",
+                "due_date": "2030-01-01", "completed": False, "user": "user0"}
+        data["tasks"].append(task)
+        storage.insert_task(data, task)
+    storage.flush()
+    return writes / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Durability level benchmark")
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--writes", type=int, default=2000, help="Inserts in the journaled burst")
+    parser.add_argument("--snapshot-writes", type=int, default=50, help="Inserts in the snapshot burst")
+    args = parser.parse_args()
+
+    dataset = json.dumps(make_dataset(args.tasks, args.users))
+    print(f"Dataset: {args.tasks:,} tasks; writes/s by durability level")
+    for journaled, writes in ((True, args.writes), (False, args.snapshot_writes)):
+        for durability in DURABILITY_LEVELS:
+            with tempfile.TemporaryDirectory() as workdir:
+                path = os.path.join(workdir, "tasks.json")
+                with open(path, "w") as f:
+                    f.write(dataset)
+                rate = measure(path, journaled, durability, writes)
+            mode = "journal " if journaled else "snapshot"
+            print(f"{mode} {durability:<12} {rate:10,.0f} writes/s  ({writes} writes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+benchmarks/bench_log_sink.py
+
+Compares LoggerContext's previous per-block file handling (open the log on enter,
+write each line synchronously, close on exit) with the shared LogSink it now writes
+through (lines queued; one background thread, one long-lived handle).
+Reports total time including the final flush, and time spent in the caller.
+
+Usage:
+    python -m benchmarks.bench_log_sink --blocks 5000 --lines 3
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import os
+import tempfile
+import time
+from task_manager_pro.utils.log_sink import get_sink
+from task_manager_pro.utils.logger_context import LoggerContext
+
+
+class PerBlockLoggerContext:
+    """
+    The pre-sink LoggerContext: a file handle per block and synchronous writes.
+    """
+
+    def __init__(self, action: str, log_file: str):
+        self.action = action
+        self.log_file = log_file
+        self._log_handle = None
+
+    def __enter__(self):
+        self._log_handle = open(self.log_file, "a")
+        self._write_log(f"🔄 Starting: {self.action}")
+        print(f"🔄 [{self._timestamp()}] Starting: {self.action}")
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._write_log(f"✅ Finished: {self.action}")
+        print(f"✅ [{self._timestamp()}] Finished: {self.action}")
+        self._write_log("🟢 Session ended\n")
+        self._log_handle.close()
+        return False
+
+    def _timestamp(self) -> str:
+        return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    def _write_log(self, message: str):
+        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._log_handle.write(f"[{timestamp}] {message}\n")
+
+    def log(self, message: str):
+        self._write_log(f"📝 {message}")
+        print(f"📝 [{self._timestamp()}] {message}")
+
+
+def run(context_class, path: str, blocks: int, lines: int) -> float:
+    """
+    Enters `blocks` logged blocks with `lines` custom lines each; console output is discarded.
+    Returns the time spent in the caller.
+    """
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(blocks):
+            with context_class(f"Block {i}", log_file=path) as log:
+                for j in range(lines):
+                    log.log(f"step {j}")
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LoggerContext file handling benchmark")
+    parser.add_argument("--blocks", type=int, default=5000, help="LoggerContext blocks entered")
+    parser.add_argument("--lines", type=int, default=3, help="Custom log lines per block")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        old_path = os.path.join(workdir, "per_block.log")
+        per_block = run(PerBlockLoggerContext, old_path, args.blocks, args.lines)
+
+        new_path = os.path.join(workdir, "sink.log")
+        start = time.perf_counter()
+        caller = run(LoggerContext, new_path, args.blocks, args.lines)
+        get_sink(new_path).flush()
+        sink_total = time.perf_counter() - start
+        assert os.path.getsize(old_path) == os.path.getsize(new_path)
+
+    total_lines = args.blocks * (args.lines + 3)
+    print(f"{args.blocks:,} blocks, {total_lines:,} lines")
+    print(f"Per-block open/write/close: {per_block * 1000:8.1f} ms")
+    print(f"Shared LogSink (total):     {sink_total * 1000:8.1f} ms  ({per_block / sink_total:.1f}x faster)")
+    print(f"Shared LogSink (caller):    {caller * 1000:8.1f} ms  ({per_block / caller:.1f}x less blocking)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+benchmarks/bench_schedule.py
+
+Measures the nightly reminder job's read cost (load_users + scan stages) with and
+without per-user next_due_date scheduling, as the number of users with something
+due grows. All tasks are due in the future except one overdue task for each of the
+first --due users. "unscheduled" is the same data with the next_due_date fields
+stripped, i.e. a file written before scheduling, which makes the job read every
+user and task.
+
+Usage:
+    python -m benchmarks.bench_schedule --tasks 100000 --users 10000 --due 0 10 100 1000
+"""
+
+import argparse
+import copy
+import os
+import tempfile
+from datetime import date, timedelta
+from typing import Any, Dict
+from benchmarks.dataset import make_dataset
+from task_manager_pro.services.reminders import ReminderEngine
+from task_manager_pro.services.task_index import TaskIndex
+from task_manager_pro.storage.json_storage import JSONStorage
+from task_manager_pro.storage.sqlite_storage import SQLiteStorage
+
+TODAY = date(2030, 6, 1)
+
+
+def scheduled_dataset(n_tasks: int, n_users: int, n_due: int) -> Dict[str, Any]:
+    """
+    Builds a dataset where only the first n_due users have an overdue task, with next_due_date filled in.
+    """
+    data = make_dataset(n_tasks, n_users, due="upcoming", today=TODAY, completed_ratio=0)
+    firsts = {}
+    for task in data["tasks"]:
+        firsts.setdefault(task["user"], task)
+    for i in range(n_due):
+        if f"user{i}" in firsts:
+            firsts[f"user{i}"]["due_date"] = (TODAY - timedelta(days=1)).isoformat()
+    index = TaskIndex(data)
+    for user in data["users"]:
+        user["next_due_date"] = index.next_due_date(user["username"])
+    return data
+
+
+def read_seconds(storage) -> float:
+    """
+    Runs the job once (emails discarded) and returns the time spent reading users and tasks.
+    """
+    stats = ReminderEngine(storage, sender=lambda **kw: None, today=TODAY).run()
+    return stats["stages_seconds"]["load_users"] + stats["stages_seconds"]["scan"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reminder job scheduling benchmark")
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--due", type=int, nargs="+", default=[0, 10, 100, 1000],
+                        help="Numbers of users with a due task to measure")
+    args = parser.parse_args()
+
+    print(f"{args.tasks:,} tasks, {args.users:,} users; reminder job read time (load_users + scan)")
+    print(f"{'due users':>9}  {'backend':<7} {'unscheduled':>12} {'scheduled':>10}")
+    for n_due in args.due:
+        data = scheduled_dataset(args.tasks, args.users, n_due)
+        legacy = copy.deepcopy(data)
+        for user in legacy["users"]:
+            del user["next_due_date"]
+        for backend, storage_class, name in (("json", JSONStorage, "tasks.json"), ("sqlite", SQLiteStorage, "tasks.db")):
+            timings = []
+            for dataset in (legacy, data):
+                with tempfile.TemporaryDirectory() as workdir:
+                    storage = storage_class(os.path.join(workdir, name))
+                    storage.save_data(copy.deepcopy(dataset))
+                    timings.append(read_seconds(storage))
+                    if backend == "sqlite":
+                        storage.close()
+            print(f"{n_due:>9,}  {backend:<7} {timings[0] * 1000:10.1f} ms {timings[1] * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+benchmarks/bench_server.py
+
+Compares the per-call cost of the CLI (a fresh TaskManager loading and indexing the whole
+file on every invocation) with requests served by the long-running HTTP app, whose dataset
+stays loaded. Requests go through Flask's test client, so no sockets are involved.
+
+Usage:
+    python -m benchmarks.bench_server --tasks 100000
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+from benchmarks.dataset import make_dataset
+from task_manager_pro.server import create_app
+from task_manager_pro.services.task_manager import TaskManager
+from task_manager_pro.storage.json_storage import JSONStorage
+from task_manager_pro.utils.outbox import Outbox
+
+
+def _per_call(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP service mode benchmark")
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        storage = JSONStorage(os.path.join(workdir, "tasks.json"), journaled=True)
+        storage.save_data(make_dataset(args.tasks, args.users))
+        outbox = Outbox(os.path.join(workdir, "outbox"))
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            cli_load = _per_call(lambda: TaskManager(storage, outbox=outbox), repeat=3)
+            client = create_app(storage, outbox=outbox).test_client()
+            due = _per_call(lambda: client.get("/users/user0/tasks/due"), args.requests)
+            listing = _per_call(lambda: client.get("/users/user0/tasks?status=pending"), args.requests)
+            add = _per_call(lambda: client.post("/users/user0/tasks", json={"title": "Bench", "due_date": "2030-01-01"}),
+                            args.requests)
+        storage.wait_for_compaction()
+        os.chdir("/")
+
+    print(f"Dataset: {args.tasks:,} tasks / {args.users:,} users (journaled JSON)")
+    print(f"CLI start-up (load + index) per call: {cli_load * 1000:9.2f} ms")
+    print(f"HTTP GET  due tasks:                  {due * 1000:9.3f} ms")
+    print(f"HTTP GET  pending tasks:              {listing * 1000:9.3f} ms")
+    print(f"HTTP POST add task (journaled):       {add * 1000:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+benchmarks/bench_shell.py
+
+Compares a scripted batch of commands run as separate `task-manager` processes
+(interpreter start-up + load_data per command) with the same script fed to
+`task-manager shell` (one process, one load, one save).
+
+Usage:
+    python -m benchmarks.bench_shell --tasks 20000 --commands 500
+"""
+
+import argparse
+import json
+import os
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+from benchmarks.dataset import make_dataset
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_script(n_commands: int):
+    """
+    Builds a realistic mix of writes and reads for user0.
+    """
+    lines = ["login --username user0 --email user0@example.com"]
+    for i in range(1, n_commands):
+        if i % 5 == 0:
+            lines.append("list-tasks --filter pending --summary")
+        else:
+            lines.append(f"add-task --title 'Scripted {i}' --desc 'From bench' --due 2030-01-01")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shell mode benchmark")
+    parser.add_argument("--tasks", type=int, default=20_000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--commands", type=int, default=500)
+    parser.add_argument("--sample", type=int, default=10, help="Per-process commands actually run")
+    args = parser.parse_args()
+
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    script = make_script(args.commands)
+    with tempfile.TemporaryDirectory() as workdir:
+        dataset = json.dumps(make_dataset(args.tasks, args.users))
+
+        def reset():
+            with open(os.path.join(workdir, "tasks.json"), "w") as f:
+                f.write(dataset)
+
+        reset()
+        start = time.perf_counter()
+        for line in script[: args.sample]:
+            subprocess.run([sys.executable, "-m", "task_manager_pro.cli", *shlex.split(line)],
+                           cwd=workdir, env=env, stdout=subprocess.DEVNULL, check=True)
+        per_process = (time.perf_counter() - start) / args.sample * len(script)
+
+        reset()
+        with open(os.path.join(workdir, "script.txt"), "w") as f:
+            f.write("\n".join(script))
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-m", "task_manager_pro.cli", "shell", "script.txt"],
+                       cwd=workdir, env=env, stdout=subprocess.DEVNULL, check=True)
+        shell = time.perf_counter() - start
+
+    print(f"Dataset: {args.tasks:,} tasks / {args.users:,} users; script of {len(script)} commands")
+    print(f"One process per command*: {per_process:8.2f} s   *extrapolated from {args.sample} commands")
+    print(f"task-manager shell:       {shell:8.2f} s   ({per_process / shell:,.0f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
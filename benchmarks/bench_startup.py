@@ -0,0 +1,99 @@
+"""
+benchmarks/bench_startup.py
+
+Tracks cold-start cost of each `task-manager` subcommand.
+Every command runs in a fresh interpreter with `python -X importtime`; the report shows the
+median wall time, the total import time, and the slowest modules imported, so a
+new top-level import of smtplib, dotenv, flask, etc. is easy to spot.
+
+Usage:
+    python -m benchmarks.bench_startup --repeat 5 [--json results.json]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from benchmarks.dataset import make_dataset
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+COMMANDS = {
+    "--help": ["--help"],
+    "login": ["login", "--username", "user0", "--email", "user0@example.com"],
+    "list-tasks": ["list-tasks", "--summary"],
+    "add-task": ["add-task", "--title", "Bench", "--desc", "Startup", "--due", "2030-01-01"],
+    "complete-task": ["complete-task", "--id", "missing"],
+    "export-tasks": ["export-tasks", "--output", "export.jsonl"],
+    "drain-outbox": ["drain-outbox"],
+    "logout": ["logout"],
+}
+
+# Imports that no subcommand above should need at start-up
+HEAVY_MODULES = ("smtplib", "email.mime.multipart", "dotenv", "flask", "concurrent.futures")
+
+
+def parse_importtime(stderr: str):
+    """
+    Returns ({module: cumulative microseconds}, total microseconds) from `-X importtime` output.
+    """
+    modules, total = {}, 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(cumulative)
+        if not name.startswith("  "):  # Top-level import; nested ones are already in its cumulative time
+            total += int(cumulative)
+    return modules, total
+
+
+def run_once(args, workdir, env):
+    # Keep reminder emails queued by login/list-tasks from turning drain-outbox into real sends
+    shutil.rmtree(os.path.join(workdir, "outbox"), ignore_errors=True)
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", "-m", "task_manager_pro.cli", *args],
+                            cwd=workdir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                            text=True, stdin=subprocess.DEVNULL)
+    return (time.perf_counter() - start, *parse_importtime(result.stderr))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CLI cold-start benchmark")
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        with open(os.path.join(workdir, "tasks.json"), "w") as f:
+            json.dump(make_dataset(args.tasks, n_users=10), f)
+        run_once(COMMANDS["login"], workdir, env)  # Warm the bytecode cache and create a session
+        for name, command in COMMANDS.items():
+            runs = [run_once(command, workdir, env) for _ in range(args.repeat)]
+            modules = runs[-1][1]
+            results[name] = {
+                "wall_ms": statistics.median(wall for wall, _, _ in runs) * 1000,
+                "import_ms": statistics.median(total for _, _, total in runs) / 1000,
+                "heavy_modules": [m for m in HEAVY_MODULES if m in modules],
+                "slowest_imports": sorted(modules.items(), key=lambda item: -item[1])[:5],
+            }
+
+    print(f"{'command':16}{'wall ms':>10}{'import ms':>11}  heavy modules loaded")
+    for name, result in results.items():
+        heavy = ", ".join(result["heavy_modules"]) or "-"
+        print(f"{name:16}{result['wall_ms']:10.1f}{result['import_ms']:11.1f}  {heavy}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+benchmarks/bench_task_memory.py
+
+Compares the in-memory cost of loaded tasks as plain dicts (what json.load produces)
+with __slots__ Task objects built by Task.from_dict, and checks the round trip is lossless.
+Reports retained bytes per task (tracemalloc) and load time from serialized JSON, plus
+the extra memory and build time of the TaskIndex that TaskManager keeps over the dicts
+(its due-date fields are held in array('l') columns).
+
+Usage:
+    python -m benchmarks.bench_task_memory --tasks 100000
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from benchmarks.dataset import make_dataset
+from task_manager_pro.models.task import Task
+from task_manager_pro.services.task_index import TaskIndex
+
+
+def load_dicts(text: str):
+    return json.loads(text)["tasks"]
+
+
+def load_tasks(text: str):
+    return [Task.from_dict(t) for t in json.loads(text)["tasks"]]
+
+
+def build_index(text: str):
+    data = json.loads(text)
+    return data, TaskIndex(data)
+
+
+def _timed(loader, text: str) -> float:
+    start = time.perf_counter()
+    loader(text)
+    return time.perf_counter() - start
+
+
+def _retained_bytes(loader, text: str) -> int:
+    """
+    Returns the memory still held by the loaded result, once the parser's temporaries are freed.
+    """
+    gc.collect()
+    tracemalloc.start()
+    result = loader(text)
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return retained
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Task representation memory benchmark")
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--users", type=int, default=1000)
+    args = parser.parse_args()
+
+    data = make_dataset(args.tasks, args.users)
+    text = json.dumps(data)
+    assert [Task.from_dict(t).to_dict() for t in data["tasks"]] == data["tasks"]
+
+    # Timings are taken untraced; tracemalloc slows allocation-heavy code unevenly
+    dict_time = min(_timed(load_dicts, text) for _ in range(3))
+    task_time = min(_timed(load_tasks, text) for _ in range(3))
+    dict_bytes = _retained_bytes(load_dicts, text)
+    task_bytes = _retained_bytes(load_tasks, text)
+    index_time = min(_timed(build_index, text) for _ in range(3)) - dict_time
+    index_bytes = _retained_bytes(build_index, text) - _retained_bytes(json.loads, text)
+
+    print(f"Dataset: {args.tasks:,} tasks / {args.users:,} users ({len(text) / 1e6:.1f} MB JSON)")
+    print(f"{'':14}{'bytes/task':>12}{'load ms':>12}")
+    print(f"{'dict':14}{dict_bytes / args.tasks:12.0f}{dict_time * 1000:12.1f}")
+    print(f"{'Task (slots)':14}{task_bytes / args.tasks:12.0f}{task_time * 1000:12.1f}")
+    print(f"{'+ TaskIndex':14}{index_bytes / args.tasks:12.0f}{index_time * 1000:12.1f}")
+    print(f"Memory saved: {1 - task_bytes / dict_bytes:.0%}")
+
+
+if __name__ == "__main__":
+    main()
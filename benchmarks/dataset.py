@@ -0,0 +1,115 @@
+"""
+benchmarks/dataset.py
+
+Deterministic synthetic data for the Task Manager PRO benchmarks.
+Builds a dataset dictionary in the same shape JSONStorage produces, or streams one
+straight to a tasks.json file so even million-task files never sit in memory.
+
+Usage:
+    python -m benchmarks.dataset --tasks 100000 --users 1000 --due overdue --output tasks.json
+"""
+
+import argparse
+import json
+import random
+from datetime import date, timedelta
+from typing import Any, Dict, Iterator, List, Optional
+
+# Due dates are drawn uniformly from these day offsets around today
+DUE_DISTRIBUTIONS = {
+    "uniform": (-30, 90),   # A mix of overdue, due and upcoming tasks
+    "overdue": (-90, 7),    # Mostly overdue: heavy reminder runs
+    "upcoming": (1, 365),   # Nothing due yet: reminder runs find no work
+    "today": (-3, 3),       # Everything due around today
+}
+
+
+def make_users(n_users: int) -> List[Dict[str, Any]]:
+    """
+    Builds n_users users with email reminders enabled.
+    """
+    return [
+        {"username": f"user{i}", "email": f"user{i}@example.com", "email_reminders_enabled": True}
+        for i in range(n_users)
+    ]
+
+
+def generate_tasks(n_tasks: int, n_users: int = 1000, seed: int = 42, due: str = "uniform",
+                   completed_ratio: float = 0.3, today: Optional[date] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Yields tasks owned by randomly chosen users, one at a time.
+
+    Args:
+        n_tasks (int): Number of tasks to generate.
+        n_users (int): Number of users to spread them across.
+        seed (int): Random seed, so repeated runs produce identical data.
+        due (str): Key of DUE_DISTRIBUTIONS.
+        completed_ratio (float): Share of tasks marked completed.
+        today (Optional[date]): Date the due offsets are relative to; defaults to today.
+    """
+    rng = random.Random(seed)
+    today = today or date.today()
+    low, high = DUE_DISTRIBUTIONS[due]
+    for i in range(n_tasks):
+        due_date = today + timedelta(days=rng.randint(low, high))
+        yield {
+            "id": f"{i:032x}",
+            "title": f"Task {i}",
+            "description": "Synthetic benchmark task",
+            "due_date": due_date.isoformat(),
+            "completed": rng.random() < completed_ratio,
+            "created_at": "2025-01-01 09:00:00",
+            "user": f"user{rng.randrange(n_users)}",
+        }
+
+
+def make_dataset(n_tasks: int, n_users: int = 1000, seed: int = 42, **options) -> Dict[str, Any]:
+    """
+    Builds a dataset with tasks spread evenly across users.
+
+    Args:
+        n_tasks (int): Number of tasks to generate.
+        n_users (int): Number of users to spread them across.
+        seed (int): Random seed, so repeated runs produce identical data.
+        **options: due, completed_ratio and today, as for generate_tasks().
+
+    Returns:
+        Dict[str, Any]: Dictionary with 'users' and 'tasks' lists.
+    """
+    return {"users": make_users(n_users), "tasks": list(generate_tasks(n_tasks, n_users, seed, **options))}
+
+
+def write_dataset(path: str, n_tasks: int, n_users: int = 1000, seed: int = 42, **options) -> None:
+    """
+    Streams a generated dataset to a JSON file that JSONStorage can load, one task at a time.
+    Takes the same arguments as make_dataset().
+    """
+    with open(path, "w") as f:
+        f.write('{"version": 0, "tasks": [')
+        for i, task in enumerate(generate_tasks(n_tasks, n_users, seed, **options)):
+            f.write(("," if i else "") + "\n" + json.dumps(task))
+        f.write('\n], "users": ')
+        json.dump(make_users(n_users), f)
+        f.write("}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic tasks.json")
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--due", choices=sorted(DUE_DISTRIBUTIONS), default="uniform",
+                        help="Due date distribution")
+    parser.add_argument("--completed", type=float, default=0.3, help="Share of completed tasks")
+    parser.add_argument("--today", type=date.fromisoformat, default=None,
+                        help="Date due dates are relative to (YYYY-MM-DD, default: today)")
+    parser.add_argument("--output", default="tasks.json")
+    args = parser.parse_args()
+
+    write_dataset(args.output, args.tasks, args.users, args.seed, due=args.due,
+                  completed_ratio=args.completed, today=args.today)
+    print(f"Wrote {args.tasks:,} tasks for {args.users:,} users to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""
+benchmarks/suite.py
+
+Regression benchmark suite for TaskManager, JSONStorage and the reminder job.
+For each dataset size it writes a synthetic tasks.json (benchmarks/dataset.py) and
+times load, save, add, complete, delete, list (full and lazy) and the reminder scan,
+recording each operation's peak traced memory. Results are written as JSON so runs
+can be compared; --compare reports the change against an earlier results file and
+exits with status 1 if any operation slowed down by more than --threshold.
+
+Usage:
+    python -m benchmarks.suite --sizes 1000,100000,1000000 --output results.json
+    python -m benchmarks.suite --sizes 1000,100000 --compare results.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+from benchmarks.dataset import DUE_DISTRIBUTIONS, write_dataset
+from task_manager_pro.services.reminders import ReminderEngine
+from task_manager_pro.services.task_manager import TaskManager
+from task_manager_pro.storage.json_storage import JSONStorage
+from task_manager_pro.utils.outbox import Outbox
+from task_manager_pro.utils.session import save_session
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The user every TaskManager operation runs as
+BENCH_USER = "user0"
+
+
+class Context:
+    def __init__(self, path: str, journaled: bool, today: date):
+        """
+        Shared state for one dataset: its storage, a fully loaded TaskManager and the
+        IDs of tasks added by the 'add' operation (later completed and deleted).
+        """
+        self.path = path
+        self.journaled = journaled
+        self.today = today
+        self.storage = JSONStorage(path, journaled=journaled)
+        self.outbox = Outbox(os.path.join(os.path.dirname(path), "outbox"))
+        self.manager: Optional[TaskManager] = None
+        self.data: Optional[Dict[str, Any]] = None
+        self.added: List[str] = []
+
+    def new_manager(self, lazy: bool = False) -> TaskManager:
+        return TaskManager(self.storage, outbox=self.outbox, lazy=lazy)
+
+
+def op_load(ctx: Context, i: int) -> None:
+    ctx.data = ctx.storage.load_data()
+
+
+def op_startup(ctx: Context, i: int) -> None:
+    ctx.manager = ctx.new_manager()
+
+
+def op_list(ctx: Context, i: int) -> None:
+    ctx.manager.list_tasks("all", summary=True)
+
+
+def op_list_lazy(ctx: Context, i: int) -> None:
+    ctx.new_manager(lazy=True).list_tasks("all", summary=True)
+
+
+def op_reminders(ctx: Context, i: int) -> None:
+    # Each run uses a new day, so users reminded by the previous run are reminded again
+    ReminderEngine(ctx.storage, sender=lambda **kw: None, today=ctx.today + timedelta(days=i)).run()
+
+
+def op_add(ctx: Context, i: int) -> None:
+    ctx.added.append(ctx.manager.add_task(f"Bench {i}", "Added by the suite", ctx.today.isoformat())["id"])
+
+
+def op_complete(ctx: Context, i: int) -> None:
+    ctx.manager.mark_task_complete(ctx.added[i])
+
+
+def op_delete(ctx: Context, i: int) -> None:
+    ctx.manager.delete_task(ctx.added[i])
+
+
+def op_save(ctx: Context, i: int) -> None:
+    ctx.storage.save_data(ctx.data)
+
+
+# Run in this order; later operations rely on state left by earlier ones
+OPERATIONS: Dict[str, Callable[[Context, int], None]] = {
+    "load": op_load,
+    "save": op_save,
+    "startup": op_startup,
+    "list": op_list,
+    "list_lazy": op_list_lazy,
+    "add": op_add,
+    "complete": op_complete,
+    "delete": op_delete,
+    "reminders": op_reminders,  # Last: its writes make the manager's copy stale
+}
+
+
+def measure(ctx: Context, func: Callable[[Context, int], None], repeat: int, memory: bool) -> Dict[str, Any]:
+    """
+    Times `repeat` runs of an operation, then (if asked) one more run under tracemalloc.
+    """
+    times = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        func(ctx, i)
+        times.append(time.perf_counter() - start)
+    result = {"mean_seconds": sum(times) / len(times), "min_seconds": min(times), "peak_bytes": None}
+    if memory:
+        tracemalloc.start()
+        try:
+            func(ctx, repeat)
+            result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def run_size(n_tasks: int, n_users: int, args) -> List[Dict[str, Any]]:
+    """
+    Benchmarks every operation against a fresh dataset of n_tasks tasks.
+    """
+    today = date.today()
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "tasks.json")
+        write_dataset(path, n_tasks, n_users, args.seed, due=args.due, today=today)
+        cwd = os.getcwd()
+        os.chdir(workdir)  # The session file lives in the working directory
+        try:
+            save_session(BENCH_USER)
+            ctx = Context(path, args.journal, today)
+            for name, func in OPERATIONS.items():
+                with contextlib.redirect_stdout(io.StringIO()):
+                    result = measure(ctx, func, args.repeat, not args.no_memory)
+                results.append({"tasks": n_tasks, "users": n_users, "operation": name, **result})
+                peak = f"{result['peak_bytes'] / 1e6:9.1f} MB" if result["peak_bytes"] is not None else ""
+                print(f"{n_tasks:>9,} tasks  {name:<10} {result['mean_seconds'] * 1000:10.2f} ms  {peak}",
+                      file=sys.stderr)
+        finally:
+            os.chdir(cwd)
+    return results
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: List[Dict[str, Any]], baseline: Dict[str, Any], threshold: float) -> bool:
+    """
+    Prints each operation's time relative to a baseline results file.
+
+    Returns:
+        bool: True if any operation got slower than the threshold ratio.
+    """
+    before = {(r["tasks"], r["operation"]): r for r in baseline["results"]}
+    regressed = False
+    print(f"\nCompared with {baseline['meta'].get('commit') or 'baseline'} ({baseline['meta']['created']}):",
+          file=sys.stderr)
+    for r in results:
+        old = before.get((r["tasks"], r["operation"]))
+        if old is None:
+            continue
+        ratio = r["mean_seconds"] / old["mean_seconds"] if old["mean_seconds"] else float("inf")
+        flag = ""
+        if ratio > threshold:
+            flag = "  ⚠️ slower"
+            regressed = True
+        print(f"{r['tasks']:>9,} tasks  {r['operation']:<10} {ratio:6.2f}x{flag}", file=sys.stderr)
+    return regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Task Manager PRO benchmark suite")
+    parser.add_argument("--sizes", default="1000,100000", help="Comma-separated task counts")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--due", choices=sorted(DUE_DISTRIBUTIONS), default="uniform")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per operation")
+    parser.add_argument("--journal", action="store_true", help="Benchmark journaled JSONStorage")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc peak-memory run")
+    parser.add_argument("--output", default="-", help="Results file (default: stdout)")
+    parser.add_argument("--compare", help="Earlier results file to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="Slowdown ratio reported as a regression")
+    args = parser.parse_args(argv)
+
+    report = {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "journaled": args.journal,
+            "due": args.due,
+            "repeat": args.repeat,
+        },
+        "results": [],
+    }
+    for size in (int(s) for s in args.sizes.split(",")):
+        report["results"].extend(run_size(size, args.users, args))
+
+    text = json.dumps(report, indent=2)
+    if args.output == "-":
+        print(text)
+    else:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+
+    if args.compare:
+        with open(args.compare) as f:
+            if compare(report["results"], json.load(f), args.threshold):
+                sys.exit(1)
+    return report
+
+
+if __name__ == "__main__":
+    main()
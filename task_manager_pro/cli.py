@@ -8,12 +8,37 @@ Also handles user login, logout, and email reminder toggling via CLI.
 """
 
 import argparse
+import os
+import sys
+from typing import Callable, Iterable, Optional
 from task_manager_pro.services.task_manager import TaskManager
-from task_manager_pro.storage.json_storage import JSONStorage
+from task_manager_pro.storage.json_storage import DURABILITY_LEVELS, JSONStorage
+from task_manager_pro.storage.sqlite_storage import SQLiteStorage
+from task_manager_pro.utils.dispatch import ConcurrentDispatcher
+from task_manager_pro.utils.exporter import EXPORT_FORMATS, export_tasks, filter_tasks
+from task_manager_pro.utils import log_sink, metrics
+from task_manager_pro.utils.importer import IMPORT_FORMATS, detect_format, read_rows
+from task_manager_pro.utils.outbox import Outbox
+from task_manager_pro.utils.session import load_session
 
-def main():
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Builds the argument parser with every subcommand.
+    Also used by the interactive shell to parse each line it reads.
+    """
     # Initialize argument parser
     parser = argparse.ArgumentParser(description="📝 Task Manager PRO CLI")
+    parser.add_argument("--storage", choices=["json", "sqlite"], default="json",
+                        help="Storage backend: tasks.json (default) or tasks.db")
+    parser.add_argument("--journal", action="store_true",
+                        help="Append JSON changes to tasks.journal instead of rewriting tasks.json")
+    parser.add_argument("--durability", choices=DURABILITY_LEVELS, default="every-write",
+                        help="JSON storage: fsync every write (default), group writes into one fsync, or never fsync")
+    parser.add_argument("--quiet", action="store_true", help="Hide the per-operation log lines")
+    parser.add_argument("--log-file", metavar="FILE", help="Also append the per-operation log lines to FILE")
+    parser.add_argument("--metrics", metavar="FILE",
+                        help="Write timing metrics to FILE on exit (.json for JSON, otherwise Prometheus text)")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     # Add Task command
@@ -57,14 +82,85 @@ def main():
     # Logout command
     logout_parser = subparsers.add_parser("logout", help="Log out current user")
 
-    # Parse the CLI arguments
-    args = parser.parse_args()
+    # Reschedule command
+    reschedule_parser = subparsers.add_parser(
+        "reschedule", help="Recompute every user's next due date (for data edited outside the CLI)"
+    )
 
-    # Set up storage and task manager
-    storage = JSONStorage()
-    manager = TaskManager(storage)
+    # Import Tasks command
+    import_parser = subparsers.add_parser("import-tasks", help="Bulk import tasks from a JSONL or CSV file")
+    import_parser.add_argument("file", help="Feed to import ('-' reads stdin and needs --format)")
+    import_parser.add_argument("--format", choices=IMPORT_FORMATS, help="Feed format (default: from file extension)")
+    import_parser.add_argument("--strict", action="store_true", help="Import nothing if any row is invalid")
 
-    # Route commands to corresponding methods
+    # Export Tasks command
+    export_parser = subparsers.add_parser("export-tasks", help="Export tasks as JSONL, CSV or iCalendar")
+    export_parser.add_argument("--format", choices=EXPORT_FORMATS, default="jsonl")
+    export_parser.add_argument("--output", default="-", help="Destination file (default: stdout)")
+    export_parser.add_argument("--user", help="Only this user's tasks (default: the logged-in user)")
+    export_parser.add_argument("--all-users", action="store_true", help="Export every user's tasks")
+    export_parser.add_argument("--status", choices=["all", "completed", "pending"], default="all")
+
+    # Serve command
+    serve_parser = subparsers.add_parser("serve", help="Serve tasks over a local JSON HTTP API")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8000)
+
+    # Shell command
+    shell_parser = subparsers.add_parser("shell", help="Run many commands against one loaded dataset")
+    shell_parser.add_argument("script", nargs="?", help="File of commands to run (default: read stdin)")
+
+    # Drain Outbox command
+    drain_parser = subparsers.add_parser("drain-outbox", help="Send queued reminder emails")
+    drain_parser.add_argument("--batch-size", type=int, default=100, help="Messages sent per batch")
+    drain_parser.add_argument("--concurrency", type=int, default=1, help="Maximum emails in flight")
+    drain_parser.add_argument("--rate-limit", type=float, default=None, help="Maximum send attempts per second")
+
+    return parser
+
+
+def drain_outbox(args) -> None:
+    """
+    Sends queued reminder emails; needs no task data.
+    """
+    dispatcher = ConcurrentDispatcher(concurrency=args.concurrency, rate_limit=args.rate_limit, max_retries=1)
+    stats = Outbox().drain(dispatcher, batch_size=args.batch_size)
+    print(f"📤 Outbox drained: {stats['sent']} sent, {stats['retried']} queued for retry, "
+          f"{stats['dead_lettered']} moved to outbox/failed.")
+
+
+def export(args, iter_tasks: Callable[[Optional[str]], Iterable[dict]]) -> None:
+    """
+    Writes the selected tasks to stdout or --output.
+
+    Args:
+        args (argparse.Namespace): Parsed export-tasks arguments.
+        iter_tasks (Callable): Returns the tasks of a user (or of everyone for None).
+    """
+    user = None if args.all_users else (args.user or load_session())
+    if user is None and not args.all_users:
+        print("❌ Please login first, or pass --user NAME or --all-users.", file=sys.stderr)
+        return
+    tasks = filter_tasks(iter_tasks(user), args.status)
+    if args.output == "-":
+        try:
+            count = export_tasks(tasks, sys.stdout, args.format)
+            sys.stdout.flush()
+        except BrokenPipeError:
+            # The reader (e.g. `head`) exited early; silence the flush at interpreter exit
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            return
+        print(f"📤 Exported {count} tasks.", file=sys.stderr)
+    else:
+        with open(args.output, "w", newline="", encoding="utf-8") as out:
+            count = export_tasks(tasks, out, args.format)
+        print(f"📤 Exported {count} tasks to {args.output}.")
+
+
+def run_command(manager: TaskManager, args) -> None:
+    """
+    Routes a parsed TaskManager subcommand to the corresponding method.
+    """
     if args.command == "add-task":
         manager.add_task(args.title, args.desc, args.due)
 
@@ -92,8 +188,74 @@ def main():
     elif args.command == "toggle-email-reminders":
         manager.toggle_email_reminders()
 
-    else:
-        parser.print_help()
+    elif args.command == "reschedule":
+        manager.reschedule_users()
+
+    elif args.command == "import-tasks":
+        try:
+            fmt = args.format or detect_format(args.file)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return
+        if args.file == "-":
+            manager.import_tasks(read_rows(sys.stdin, fmt), strict=args.strict)
+            return
+        try:
+            feed = open(args.file, newline="", encoding="utf-8")
+        except OSError as e:
+            print(f"❌ Could not open {args.file}: {e.strerror}")
+            return
+        with feed:
+            manager.import_tasks(read_rows(feed, fmt), strict=args.strict)
+
+
+def main(argv=None):
+    """
+    Parses the command line and runs one command.
+
+    Args:
+        argv (Optional[List[str]]): Command-line arguments; defaults to sys.argv[1:].
+    """
+    parser = build_parser()
+
+    # Parse the CLI arguments
+    args = parser.parse_args(argv)
+    if args.quiet:
+        metrics.set_quiet()
+    if args.metrics:
+        metrics.export_at_exit(args.metrics)
+    if args.log_file:
+        log_sink.set_action_log(args.log_file)
+
+    # Draining the outbox needs no task data, so skip loading it
+    if args.command == "drain-outbox":
+        drain_outbox(args)
+        return
+
+    # Set up storage and task manager
+    storage = SQLiteStorage() if args.storage == "sqlite" else JSONStorage(journaled=args.journal, durability=args.durability)
+
+    # Exports stream records straight from storage, without a TaskManager
+    if args.command == "export-tasks":
+        export(args, lambda user: storage.iter_tasks(user=user))
+        return
+
+    # Flask is only imported when the server is actually started
+    if args.command == "serve":
+        from task_manager_pro.server import serve
+        serve(storage, args.host, args.port)
+        return
+
+    if args.command == "shell":
+        from task_manager_pro.shell import run_shell
+        run_shell(TaskManager(storage), parser, args.script)
+        return
+
+    # Read-only commands stream what they need instead of loading every task
+    manager = TaskManager(storage, lazy=args.command in ("list-tasks", "send-reminders", "logout"))
+
+    # Route commands to corresponding methods
+    run_command(manager, args)
 
 # Ensures this runs only when called from command line
 if __name__ == "__main__":
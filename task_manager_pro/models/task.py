@@ -4,12 +4,34 @@ models/task.py
 Defines the Task class representing an individual task in the task manager.
 Includes attributes like title, description, due date, and completion status.
 Supports serialization to/from dictionary for storage.
+Tasks use __slots__ and keep dates as their stored 'YYYY-MM-DD' strings, so an instance
+is compact and from_dict() does no date parsing; to_dict(from_dict(d)) == d for stored records.
+normalize_due_date() is the one due date rule, shared with the task importer.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
+
+DATE_FORMAT = "%Y-%m-%d"
+
+# Keys held in dedicated slots; any other keys in a stored record are kept in _extra
+_FIELDS = frozenset(("id", "title", "description", "due_date", "completed", "created_at", "user"))
+
+
+def normalize_due_date(due_date: str) -> str:
+    """
+    Validates a due date against DATE_FORMAT and returns it zero-padded (e.g. '2025-5-1' → '2025-05-01').
+
+    Raises:
+        ValueError: If due_date is not a valid 'YYYY-MM-DD' date.
+        TypeError: If due_date is not a string.
+    """
+    return datetime.strptime(due_date, DATE_FORMAT).strftime(DATE_FORMAT)
+
 
 class Task:
+    __slots__ = ("_id", "_title", "_description", "_due_date", "_completed", "_created_at", "_user", "_extra")
+
     def __init__(self, title: str, description: str, due_date: str, completed: bool = False):
         """
         Initializes a Task instance.
@@ -19,13 +41,18 @@ class Task:
             description (str): Optional description.
             due_date (str): Due date in 'YYYY-MM-DD' format.
             completed (bool): Completion status. Default is False.
+
+        Raises:
+            ValueError: If due_date is not a valid 'YYYY-MM-DD' date.
         """
         self._title = title
         self._description = description
-        self._due_date = datetime.strptime(due_date, "%Y-%m-%d")
+        self._due_date = normalize_due_date(due_date)
         self._completed = completed
-        self._created_at = datetime.now()
+        self._created_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         self._id: Optional[str] = None  # Will be assigned after creation
+        self._user: Optional[str] = None
+        self._extra: Optional[Dict[str, Any]] = None
 
     @property
     def id(self) -> Optional[str]:
@@ -37,6 +64,16 @@ class Task:
         """Sets the task ID."""
         self._id = value
 
+    @property
+    def user(self) -> Optional[str]:
+        """Returns the username of the task owner."""
+        return self._user
+
+    @user.setter
+    def user(self, value: str):
+        """Sets the username of the task owner."""
+        self._user = value
+
     @property
     def title(self):
         return self._title
@@ -48,7 +85,12 @@ class Task:
     @property
     def due_date(self):
         """Returns due date as a formatted string."""
-        return self._due_date.strftime("%Y-%m-%d")
+        return self._due_date
+
+    @property
+    def created_at(self):
+        """Returns the creation timestamp as a formatted string."""
+        return self._created_at
 
     @property
     def completed(self):
@@ -62,19 +104,26 @@ class Task:
         """
         Converts the task to a dictionary format for JSON serialization.
         """
-        return {
+        data = {
             "id": self._id,
             "title": self._title,
             "description": self._description,
-            "due_date": self.due_date,
+            "due_date": self._due_date,
             "completed": self._completed,
-            "created_at": self._created_at.strftime("%Y-%m-%d %H:%M:%S")
         }
+        if self._created_at is not None:
+            data["created_at"] = self._created_at
+        if self._user is not None:
+            data["user"] = self._user
+        if self._extra:
+            data.update(self._extra)
+        return data
 
     @staticmethod
     def from_dict(data: dict):
         """
-        Creates a Task object from a dictionary.
+        Creates a Task object from a stored task record without re-validating it.
+        The id, owner, creation time and any unknown keys are preserved.
 
         Args:
             data (dict): Dictionary with task data.
@@ -82,17 +131,20 @@ class Task:
         Returns:
             Task: A Task object reconstructed from the dictionary.
         """
-        task = Task(
-            title=data["title"],
-            description=data["description"],
-            due_date=data["due_date"],
-            completed=data.get("completed", False)
-        )
-        task.id = data.get("id")
+        task = Task.__new__(Task)
+        task._id = data.get("id")
+        task._title = data["title"]
+        task._description = data.get("description", "")
+        task._due_date = data["due_date"]
+        task._completed = data.get("completed", False)
+        task._created_at = data.get("created_at")
+        task._user = data.get("user")
+        extra = {key: value for key, value in data.items() if key not in _FIELDS}
+        task._extra = extra or None
         return task
 
     def __str__(self):
         return f"{self._title} - Due: {self._due_date} - {'Done' if self.completed else 'Pending'}"
 
     def __repr__(self):
-        return f"<Task {self.title}>"
\ No newline at end of file
+        return f"<Task {self.title}>"
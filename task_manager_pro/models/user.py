@@ -84,6 +84,24 @@ class User:
             "email_reminders_enabled": self._email_reminders_enabled
         }
 
+    @staticmethod
+    def from_dict(data: dict):
+        """
+        Creates a User object from a stored user record.
+        Extra bookkeeping fields (e.g., last_reminder_date) are ignored.
+
+        Args:
+            data (dict): Dictionary with user data.
+
+        Returns:
+            User: A User object reconstructed from the dictionary.
+        """
+        return User(
+            username=data["username"],
+            email=data.get("email"),
+            email_reminders_enabled=data.get("email_reminders_enabled", True)
+        )
+
     def __str__(self):
         """Returns a human-readable string representation of the user."""
         return f"User({self.username})"
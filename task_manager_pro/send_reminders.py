@@ -4,63 +4,99 @@ send_reminders.py
 This script sends daily email reminders to users who have due or overdue tasks.
 Designed to be run as a scheduled job (e.g., via cron).
 Ensures reminders are not sent multiple times in a day and logs output for tracking.
+The work itself is done by services/reminders.ReminderEngine, so it can also be
+imported and driven from other code via main(). It reads the same backends as the
+CLI: tasks.json by default, --journal for a journaled tasks.json, or --storage sqlite.
+
+Each run writes a JSON telemetry report (--report, default reminder_report.json) with
+wall time per stage (load_users, scan, send, save), users and tasks scanned, due and
+overdue tasks found, emails attempted/sent/failed, SMTP latency percentiles and bytes
+saved. With --history, the report is also appended as one JSON line per run, for
+charting job duration over time.
 '''
 
+import argparse
 import datetime
-from task_manager_pro.storage.json_storage import JSONStorage
-from task_manager_pro.utils.emailer import send_email_reminder
+import json
+import os
 import sys
+from typing import Any, Dict
+from task_manager_pro.services.reminders import ReminderEngine
+from task_manager_pro.storage.json_storage import JSONStorage
+from task_manager_pro.storage.sqlite_storage import SQLiteStorage
 
-# Ensure print statements are immediately flushed (important for cron log visibility)
-sys.stdout.reconfigure(line_buffering=True)
 
-# Load stored task/user data from JSON file
-storage = JSONStorage("tasks.json")
-data = storage.load_data()
+def write_report(report: Dict[str, Any], path: str) -> None:
+    """
+    Writes the run report as indented JSON, replacing the previous one atomically.
+    """
+    tmp_name = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_name, "w") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+    os.replace(tmp_name, path)
 
-# Get today's date for comparison
-today = datetime.date.today()
-print(f"[{datetime.datetime.now()}] Starting scheduled reminders...\n")
 
-# Flag to track whether any data was updated (to decide if we need to save)
-updated = False
+def append_history(report: Dict[str, Any], path: str) -> None:
+    """
+    Appends the run report to a JSON Lines history file in a single write.
+    """
+    with open(path, "a") as f:
+        f.write(json.dumps(report) + "\n")
 
-# Iterate through all users in the storage
-for user_data in data.get("users", []):
-    username = user_data["username"]
-    email = user_data.get("email")
-    reminders_enabled = user_data.get("email_reminders_enabled", False)
-    last_reminder_date = user_data.get("last_reminder_date")
 
-    # Skip users without email or if they have reminders disabled
-    if not email or not reminders_enabled:
-        continue
+def main(argv=None):
+    """
+    Runs one reminder pass over the data file, prints a throughput summary and writes the telemetry report.
 
-    # Skip if reminder already sent today
-    if last_reminder_date == str(today):
-        print(f"[{username}] 💤 Reminder already sent today.")
-        continue
+    Args:
+        argv (Optional[List[str]]): Command-line arguments; defaults to sys.argv[1:].
 
-    # Filter due/overdue tasks for this user
-    due_tasks = [
-        t for t in data.get("tasks", [])
-        if t["user"] == username
-        and not t["completed"]
-        and datetime.datetime.strptime(t["due_date"], "%Y-%m-%d").date() <= today
-    ]
+    Returns:
+        Dict[str, Any]: Run statistics from ReminderEngine.run().
+    """
+    parser = argparse.ArgumentParser(description="⏰ Send daily task reminder emails")
+    parser.add_argument("--storage", choices=["json", "sqlite"], default="json",
+                        help="Storage backend: tasks.json (default) or tasks.db")
+    parser.add_argument("--journal", action="store_true",
+                        help="Also read (and append to) tasks.journal, as written by 'task-manager --journal'")
+    parser.add_argument("--file", help="Path to the data file (default: tasks.json, or tasks.db with --storage sqlite)")
+    parser.add_argument("--concurrency", type=int, default=1, help="Maximum emails in flight")
+    parser.add_argument("--rate-limit", type=float, default=None, help="Maximum send attempts per second")
+    parser.add_argument("--retries", type=int, default=3, help="Retries per email for transient SMTP errors")
+    parser.add_argument("--report", default="reminder_report.json",
+                        help="JSON telemetry report for this run ('' to skip)")
+    parser.add_argument("--history", help="Also append the report to this JSON Lines file")
+    args = parser.parse_args(argv)
 
-    # If due tasks exist, send reminder and update last reminder date
-    if due_tasks:
-        subject = "⏰ Daily Task Reminder"
-        body = "\n".join([f"{t['title']} — Due: {t['due_date']}" for t in due_tasks])
-        send_email_reminder(to_email=email, subject=subject, body=body)
-        print(f"[{username}] 🔔 Reminder sent to {email} for {len(due_tasks)} task(s).")
+    # Ensure print statements are immediately flushed (important for cron log visibility)
+    sys.stdout.reconfigure(line_buffering=True)
 
-        user_data["last_reminder_date"] = str(today)
-        updated = True
+    print(f"[{datetime.datetime.now()}] Starting scheduled reminders...\n")
+    if args.storage == "sqlite":
+        storage = SQLiteStorage(args.file or "tasks.db")
     else:
-        print(f"[{username}] ✅ No due tasks.")
+        storage = JSONStorage(args.file or "tasks.json", journaled=args.journal)
+    engine = ReminderEngine(
+        storage,
+        concurrency=args.concurrency,
+        rate_limit=args.rate_limit,
+        max_retries=args.retries,
+    )
+    stats = engine.run()
+    print(
+        f"\n📊 Processed {stats['users']} user(s) and {stats['tasks']} task(s) "
+        f"in {stats['elapsed_seconds']:.3f}s "
+        f"({stats['users_per_second']:,.0f} users/s, {stats['tasks_per_second']:,.0f} tasks/s); "
+        f"{stats['reminders_sent']} reminder(s) sent, {stats['reminders_failed']} failed."
+    )
+    print("⏱️ Stages: " + ", ".join(f"{name} {seconds:.3f}s" for name, seconds in stats["stages_seconds"].items()))
+    if args.report:
+        write_report(stats, args.report)
+    if args.history:
+        append_history(stats, args.history)
+    return stats
+
 
-# Persist changes only if we updated reminder timestamps
-if updated:
-    storage.save_data(data)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+'''
+server.py
+
+Long-running HTTP mode for Task Manager PRO (`task-manager serve`).
+Loads the dataset and its indexes once into a single TaskManager and exposes its
+operations as a small JSON API, so each request costs an index lookup instead of a
+process start plus a full file load. Every request runs under one lock, so writes are
+serialized and persisted through the configured StorageInterface as they happen.
+
+Endpoints:
+    GET    /health
+    GET    /metrics                                 (Prometheus text format)
+    GET    /users/<username>
+    PUT    /users/<username>                        {"email": ...}
+    POST   /users/<username>/toggle-email-reminders
+    GET    /users/<username>/tasks?status=all|completed|pending
+    GET    /users/<username>/tasks/due?date=YYYY-MM-DD
+    POST   /users/<username>/tasks                  {"title", "description", "due_date"}
+    GET    /users/<username>/tasks/<task_id>
+    PATCH  /users/<username>/tasks/<task_id>        {"title", "description", "due_date", "completed": true}
+    DELETE /users/<username>/tasks/<task_id>
+'''
+
+import argparse
+import contextlib
+import threading
+from datetime import date
+from typing import Optional
+from flask import Flask, Response, abort, jsonify, request
+from task_manager_pro.models.task import normalize_due_date
+from task_manager_pro.models.user import User
+from task_manager_pro.services.task_manager import TaskManager
+from task_manager_pro.storage.interface import StorageInterface
+from task_manager_pro.storage.json_storage import DURABILITY_LEVELS, JSONStorage
+from task_manager_pro.storage.sqlite_storage import SQLiteStorage
+from task_manager_pro.utils.metrics import METRICS
+from task_manager_pro.utils.outbox import Outbox
+
+
+def create_app(storage: StorageInterface, outbox: Outbox = None) -> Flask:
+    """
+    Builds the Flask app around one fully loaded TaskManager.
+
+    Args:
+        storage (StorageInterface): Backend the dataset is loaded from and written to.
+        outbox (Optional[Outbox]): Reminder queue handed to the TaskManager.
+
+    Returns:
+        Flask: The configured application; the manager is available as app.config["MANAGER"].
+    """
+    app = Flask(__name__)
+    manager = TaskManager(storage, outbox=outbox)
+    manager.current_user = None  # Requests name their user; the CLI session does not apply
+    lock = threading.Lock()  # TaskIndex is not safe to read while another thread mutates it
+    app.config["MANAGER"] = manager
+
+    @contextlib.contextmanager
+    def acting_as(username: str):
+        """
+        Holds the lock and runs TaskManager calls as the given user.
+        Handlers respond from the methods' return values; their console messages go to the server log.
+        """
+        with lock:
+            user_data = manager.index.get_user(username)
+            if user_data is None:
+                abort(404, description=f"Unknown user '{username}'")
+            manager.current_user = User.from_dict(user_data)
+            try:
+                yield user_data
+            finally:
+                manager.current_user = None
+
+    def owned_task(username: str, task_id: str) -> dict:
+        task = manager.index.get_task(task_id)
+        if task is None or task.get("user") != username:
+            abort(404, description=f"Task '{task_id}' not found")
+        return task
+
+    def json_body(optional: bool = False) -> dict:
+        body = request.get_json(silent=True)
+        if body is None and optional:
+            return {}
+        if not isinstance(body, dict):
+            abort(400, description="Expected a JSON object body")
+        return body
+
+    def string_field(body: dict, name: str) -> Optional[str]:
+        value = body.get(name)
+        if value is not None and not isinstance(value, str):
+            abort(400, description=f"{name} must be a string")
+        return value
+
+    def due_field(body: dict) -> Optional[str]:
+        due = body.get("due_date")
+        if due is None:
+            return None
+        try:
+            return normalize_due_date(due)
+        except (TypeError, ValueError):
+            abort(400, description="due_date must be YYYY-MM-DD")
+
+    @app.errorhandler(400)
+    @app.errorhandler(404)
+    def error(e):
+        return jsonify(error=e.description), e.code
+
+    @app.get("/health")
+    def health():
+        with lock:
+            return jsonify(status="ok", users=len(manager.data["users"]), tasks=len(manager.data["tasks"]))
+
+    @app.get("/metrics")
+    def metrics():
+        return Response(METRICS.to_prometheus(), mimetype="text/plain; version=0.0.4")
+
+    @app.get("/users/<username>")
+    def get_user(username):
+        with acting_as(username) as user_data:
+            return jsonify(user_data)
+
+    @app.put("/users/<username>")
+    def put_user(username):
+        email = json_body(optional=True).get("email")
+        if email is not None and not isinstance(email, str):
+            abort(400, description="email must be a string")
+        with lock:
+            created = manager.index.get_user(username) is None
+            user_data = manager.register_user(username, email)
+            return jsonify(user_data), 201 if created else 200
+
+    @app.post("/users/<username>/toggle-email-reminders")
+    def toggle_email_reminders(username):
+        with acting_as(username):
+            enabled = manager.toggle_email_reminders()
+            return jsonify(email_reminders_enabled=enabled)
+
+    @app.get("/users/<username>/tasks")
+    def list_tasks(username):
+        status = request.args.get("status", "all")
+        if status not in ("all", "completed", "pending"):
+            abort(400, description="status must be all, completed or pending")
+        with acting_as(username):
+            tasks = manager.index.tasks_for_user(username)
+            if status != "all":
+                tasks = [t for t in tasks if bool(t["completed"]) == (status == "completed")]
+            return jsonify(tasks)
+
+    @app.get("/users/<username>/tasks/due")
+    def due_tasks(username):
+        try:
+            today = date.fromisoformat(request.args["date"]) if "date" in request.args else date.today()
+        except ValueError:
+            abort(400, description="date must be YYYY-MM-DD")
+        with acting_as(username):
+            return jsonify(manager.index.due_tasks(username, today))
+
+    @app.post("/users/<username>/tasks")
+    def add_task(username):
+        body = json_body()
+        title, description, due = string_field(body, "title"), string_field(body, "description"), due_field(body)
+        if not title or not title.strip() or not due:
+            abort(400, description="title and due_date are required")
+        with acting_as(username):
+            return jsonify(manager.add_task(title, description or "", due)), 201
+
+    @app.get("/users/<username>/tasks/<task_id>")
+    def get_task(username, task_id):
+        with acting_as(username):
+            return jsonify(owned_task(username, task_id))
+
+    @app.patch("/users/<username>/tasks/<task_id>")
+    def update_task(username, task_id):
+        body = json_body()
+        title, description, due = string_field(body, "title"), string_field(body, "description"), due_field(body)
+        completed = body.get("completed")
+        if completed is not None and not isinstance(completed, bool):
+            abort(400, description="completed must be true or false")
+        with acting_as(username):
+            task = owned_task(username, task_id)
+            if title or description or due:
+                task = manager.update_task(task_id, title, description, due)
+            if completed and not task["completed"]:
+                task = manager.mark_task_complete(task_id)
+            return jsonify(task)
+
+    @app.delete("/users/<username>/tasks/<task_id>")
+    def delete_task(username, task_id):
+        with acting_as(username):
+            owned_task(username, task_id)
+            return jsonify(manager.delete_task(task_id))
+
+    return app
+
+
+def main(argv=None):
+    """
+    Starts the HTTP server on the local machine.
+
+    Args:
+        argv (Optional[List[str]]): Command-line arguments; defaults to sys.argv[1:].
+    """
+    parser = argparse.ArgumentParser(description="🌐 Serve the Task Manager PRO JSON API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--storage", choices=["json", "sqlite"], default="json")
+    parser.add_argument("--journal", action="store_true", help="Journal JSON changes instead of rewriting tasks.json")
+    parser.add_argument("--durability", choices=DURABILITY_LEVELS, default="every-write",
+                        help="Use 'group' to commit bursts of JSON writes with a single fsync")
+    args = parser.parse_args(argv)
+    serve(SQLiteStorage() if args.storage == "sqlite" else JSONStorage(journaled=args.journal, durability=args.durability), args.host, args.port)
+
+
+def serve(storage: StorageInterface, host: str = "127.0.0.1", port: int = 8000) -> None:
+    """
+    Loads the dataset once and serves the API until interrupted.
+    """
+    app = create_app(storage)
+    manager = app.config["MANAGER"]
+    print(f"🌐 Serving {len(manager.data['tasks'])} tasks for {len(manager.data['users'])} users "
+          f"on http://{host}:{port}")
+    app.run(host=host, port=port, threaded=True)
+
+
+if __name__ == "__main__":
+    main()
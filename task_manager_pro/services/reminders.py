@@ -0,0 +1,201 @@
+"""
+services/reminders.py
+
+Defines the ReminderEngine class, the reusable core of the daily reminder job.
+Groups pending, due tasks by user in a single pass over the task list, builds one
+digest per eligible user, hands the digests to a ConcurrentDispatcher (bounded
+parallelism, rate limiting, retries), and records last_reminder_date only for users
+whose email went out, so a user is reminded at most once per day. Reports how many users and tasks it processed per second,
+along with per-stage wall times, SMTP latency percentiles and bytes written, for the job's telemetry report.
+Tasks are streamed from storage and only due tasks of eligible users are kept, so
+memory use does not grow with the size of the task file.
+Only users whose stored next_due_date is on or before today are read (see
+StorageInterface.due_users), and only their pending tasks, so the run time follows
+the number of users with something due rather than the number of users.
+"""
+
+import time
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set
+from task_manager_pro.services.task_index import due_ordinal
+from task_manager_pro.storage.interface import StorageInterface
+from task_manager_pro.utils.dispatch import ConcurrentDispatcher
+from task_manager_pro.utils.metrics import METRICS, percentiles
+
+REMINDER_SUBJECT = "⏰ Daily Task Reminder"
+
+
+def group_due_tasks(tasks: Iterable[Dict[str, Any]], today: date,
+                    usernames: Optional[Set[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Groups pending tasks due on or before today by user in one linear pass.
+
+    Args:
+        tasks (Iterable[Dict[str, Any]]): Task records to scan.
+        today (date): Reference date for "due or overdue".
+        usernames (Optional[Set[str]]): Only keep tasks of these users (None keeps all).
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: Username → due tasks, in scan order.
+    """
+    today_ordinal = today.toordinal()
+    grouped: Dict[str, List[Dict[str, Any]]] = {}
+    for task in tasks:
+        if task.get("completed"):
+            continue
+        if usernames is not None and task.get("user") not in usernames:
+            continue
+        ordinal = due_ordinal(task.get("due_date"))
+        if ordinal is not None and ordinal <= today_ordinal:
+            grouped.setdefault(task.get("user"), []).append(task)
+    return grouped
+
+
+def format_digest(tasks: List[Dict[str, Any]]) -> str:
+    """
+    Renders the plain-text body of a reminder email.
+    """
+    return "\n".join(f"{t['title']} — Due: {t['due_date']}" for t in tasks)
+
+
+class ReminderEngine:
+    def __init__(self, storage: StorageInterface,
+                 sender: Optional[Callable[..., Any]] = None,
+                 today: Optional[date] = None, concurrency: int = 1,
+                 rate_limit: Optional[float] = None, max_retries: int = 0):
+        """
+        Initializes the reminder engine.
+
+        Args:
+            storage (StorageInterface): Backend holding users and tasks.
+            sender (Optional[Callable]): Function called as sender(to_email=..., subject=..., body=...)
+                that raises on failure. Defaults to one pooled EmailSession per worker.
+            today (Optional[date]): Reference date; defaults to the current date.
+            concurrency (int): Maximum number of emails in flight.
+            rate_limit (Optional[float]): Maximum send attempts per second.
+            max_retries (int): Retries per email for transient SMTP failures.
+        """
+        self.storage = storage
+        self.today = today or date.today()
+        self.dispatcher = ConcurrentDispatcher(
+            send=sender, concurrency=concurrency, rate_limit=rate_limit, max_retries=max_retries
+        )
+
+    def eligible_users(self, users: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Keeps the users with an email address and reminders enabled who were not reminded today.
+        """
+        eligible = []
+        for user_data in users:
+            if not user_data.get("email") or not user_data.get("email_reminders_enabled", False):
+                continue
+            if user_data.get("last_reminder_date") == str(self.today):
+                print(f"[{user_data['username']}] 💤 Reminder already sent today.")
+                continue
+            eligible.append(user_data)
+        return eligible
+
+    def build_digests(self, users: List[Dict[str, Any]], tasks: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Builds one digest per user who should be reminded today.
+
+        Args:
+            users (List[Dict[str, Any]]): User records to consider.
+            tasks (Iterable[Dict[str, Any]]): Task records; consumed once.
+
+        Returns:
+            List[Dict[str, Any]]: Items with the user record, their due tasks and how many are overdue.
+        """
+        eligible = self.eligible_users(users)
+        grouped = group_due_tasks(tasks, self.today, {u["username"] for u in eligible})
+        today_ordinal = self.today.toordinal()
+        digests = []
+        for user_data in eligible:
+            username = user_data["username"]
+            due_tasks = grouped.get(username)
+            if due_tasks:
+                overdue = sum(1 for t in due_tasks if due_ordinal(t["due_date"]) < today_ordinal)
+                digests.append({"user": user_data, "tasks": due_tasks, "overdue": overdue})
+            else:
+                print(f"[{username}] ✅ No due tasks.")
+        return digests
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Runs one reminder pass: load, group, send digests, and persist reminder dates.
+
+        Returns:
+            Dict[str, Any]: Counters, throughput figures and per-stage telemetry for the run.
+        """
+        started_at = datetime.now()
+        bytes_before = METRICS.counter_total("storage_bytes_written_total")
+        stages: Dict[str, float] = {}
+        start = stage_start = time.perf_counter()
+
+        def end_stage(name: str) -> None:
+            nonlocal stage_start
+            now = time.perf_counter()
+            stages[name] = now - stage_start
+            stage_start = now
+
+        users = self.storage.due_users(self.today)
+        end_stage("load_users")
+        eligible = self.eligible_users(users)
+        scanned = [0]
+
+        def counted(tasks: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+            for task in tasks:
+                scanned[0] += 1
+                yield task
+
+        # Tasks are streamed, so reading them and grouping them is one stage
+        tasks = self.storage.iter_pending_tasks([u["username"] for u in eligible])
+        digests = self.build_digests(eligible, counted(tasks))
+        end_stage("scan")
+        errors = self.dispatcher.dispatch([
+            {"to_email": d["user"]["email"], "subject": REMINDER_SUBJECT, "body": format_digest(d["tasks"])}
+            for d in digests
+        ])
+        end_stage("send")
+        reminded = []
+        for digest, error in zip(digests, errors):
+            user_data = digest["user"]
+            if error is not None:
+                print(f"[{user_data['username']}] ❌ Failed to send reminder: {error}")
+                continue
+            print(f"[{user_data['username']}] 🔔 Reminder sent to {user_data['email']} "
+                  f"for {len(digest['tasks'])} task(s), {digest['overdue']} overdue.")
+            user_data["last_reminder_date"] = str(self.today)
+            reminded.append(user_data)
+
+        # Persist once, and only if reminder dates changed
+        if reminded:
+            # Only the reminder date is written, so settings changed while we were sending are kept
+            self.storage.update_user_fields({u["username"]: {"last_reminder_date": u["last_reminder_date"]}
+                                             for u in reminded})
+        end_stage("save")
+
+        elapsed = max(time.perf_counter() - start, 1e-9)
+        latencies = self.dispatcher.latencies
+        latency_ms = {name: None if value is None else value * 1000
+                      for name, value in percentiles(latencies).items()}
+        latency_ms["max"] = max(latencies) * 1000 if latencies else None
+        return {
+            "started_at": started_at.isoformat(timespec="seconds"),
+            "today": str(self.today),
+            "storage": type(self.storage).__name__,
+            "users": len(users),
+            "tasks": scanned[0],
+            "due_tasks": sum(len(d["tasks"]) for d in digests),
+            "overdue_tasks": sum(d["overdue"] for d in digests),
+            "reminders_sent": len(reminded),
+            "reminders_failed": len(digests) - len(reminded),
+            "emails_attempted": len(digests),
+            "send_attempts": len(latencies),
+            "smtp_latency_ms": latency_ms,
+            "bytes_saved": int(METRICS.counter_total("storage_bytes_written_total") - bytes_before),
+            "stages_seconds": stages,
+            "elapsed_seconds": elapsed,
+            "users_per_second": len(users) / elapsed,
+            "tasks_per_second": scanned[0] / elapsed,
+        }
@@ -0,0 +1,262 @@
+"""
+services/task_index.py
+
+Defines the TaskIndex class, an in-memory lookup layer over the loaded task/user data.
+Maintains id → task, user → task ids and username → user hash indexes so TaskManager
+can find and remove records without scanning the full task list.
+Also keeps, per user, the pending tasks sorted by due-date ordinal, so "due or overdue"
+is a bisect range query instead of a scan that re-parses every due date. These hot fields
+are stored compactly: each user's schedule is an array('l') of ordinals beside a list of
+ids, and each task's indexed ordinal sits in an array('l') column by slot, instead of a
+tuple plus a dict entry per pending task.
+Removing a task keeps the order of the task list (and so of tasks.json and exports):
+each task remembers the slot it was appended to, removed slots are kept as sorted
+tombstones, and a task's list position is its slot minus the tombstones before it.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional
+from task_manager_pro.models.task import DATE_FORMAT
+
+# Slots are renumbered (and the tombstones dropped) once this many tasks have been removed
+MAX_TOMBSTONES = 1024
+
+
+def due_ordinal(due_date: Optional[str]) -> Optional[int]:
+    """
+    Parses a due date into a proleptic Gregorian ordinal, accepting exactly what
+    models.task.normalize_due_date() accepts (so '2025-1-5' too).
+
+    Returns:
+        Optional[int]: The ordinal, or None if the date is missing or malformed.
+    """
+    try:
+        if len(due_date) == 10 and due_date[4] == due_date[7] == "-":
+            # Zero-padded form: fromisoformat agrees with the strptime rule and is much faster
+            return date.fromisoformat(due_date).toordinal()
+        return datetime.strptime(due_date, DATE_FORMAT).toordinal()
+    except (TypeError, ValueError):
+        return None
+
+
+def pending_due_dates(tasks: Iterable[Dict[str, Any]]) -> Dict[str, str]:
+    """
+    Computes each user's earliest pending due date ('YYYY-MM-DD') from task records,
+    the same value TaskIndex.next_due_date() returns, so storage backends can derive
+    'next_due_date' from the tasks they hold. Users with nothing pending are left out.
+    """
+    earliest: Dict[Any, int] = {}
+    for task in tasks:
+        if task.get("completed"):
+            continue
+        ordinal = due_ordinal(task.get("due_date"))
+        if ordinal is not None and ordinal < earliest.get(task.get("user"), ordinal + 1):
+            earliest[task.get("user")] = ordinal
+    return {user: date.fromordinal(ordinal).isoformat() for user, ordinal in earliest.items()}
+
+
+class TaskIndex:
+    def __init__(self, data: Dict[str, Any]):
+        """
+        Builds the indexes for a loaded dataset.
+
+        Args:
+            data (Dict[str, Any]): Dictionary containing 'users' and 'tasks' lists.
+                The lists are indexed in place and kept in sync by this class.
+        """
+        self._tasks: List[Dict[str, Any]] = data.setdefault("tasks", [])
+        self._users: List[Dict[str, Any]] = data.setdefault("users", [])
+        self._tasks_by_id: Dict[str, Dict[str, Any]] = {}
+        self._slots: Dict[str, int] = {}  # Task id → slot it was appended to
+        self._tombstones: List[int] = []  # Sorted slots of removed tasks
+        # Dicts with None values act as insertion-ordered sets of task ids
+        self._task_ids_by_user: Dict[str, Dict[str, None]] = {}
+        self._users_by_name: Dict[str, Dict[str, Any]] = {}
+        # Per-user pending tasks ordered by (due ordinal, task id)
+        self._pending_due: Dict[str, _DueSchedule] = {}
+        # Slot → ordinal the task is scheduled under (0: not scheduled)
+        self._due_column = array("l")
+
+        for slot, task in enumerate(self._tasks):
+            self._index_task(task, slot, presorted=False)
+        for schedule in self._pending_due.values():
+            schedule.sort()
+        for user in self._users:
+            self._users_by_name[user["username"]] = user
+
+    def _index_task(self, task: Dict[str, Any], slot: int, presorted: bool = True) -> None:
+        """
+        Registers a task appended to the task list at the given slot.
+        """
+        self._tasks_by_id[task["id"]] = task
+        self._slots[task["id"]] = slot
+        self._due_column.append(0)
+        self._task_ids_by_user.setdefault(task.get("user"), {})[task["id"]] = None
+        self._index_due(task, presorted)
+
+    def _index_due(self, task: Dict[str, Any], presorted: bool = True) -> None:
+        """
+        Adds a pending task to its user's due-date ordering.
+        With presorted=False the entry is only appended; the caller sorts afterwards.
+        """
+        if task.get("completed"):
+            return
+        ordinal = due_ordinal(task.get("due_date"))
+        if ordinal is None:
+            return
+        self._due_column[self._slots[task["id"]]] = ordinal
+        schedule = self._pending_due.get(task.get("user"))
+        if schedule is None:
+            schedule = self._pending_due[task.get("user")] = _DueSchedule()
+        if presorted:
+            schedule.insert(ordinal, task["id"])
+        else:
+            schedule.append(ordinal, task["id"])
+
+    def _unindex_due(self, task: Dict[str, Any]) -> None:
+        """
+        Removes a task from its user's due-date ordering, if present.
+        """
+        slot = self._slots[task["id"]]
+        ordinal = self._due_column[slot]
+        if not ordinal:
+            return
+        self._due_column[slot] = 0
+        self._pending_due[task.get("user")].remove(ordinal, task["id"])
+
+    def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the task with the given ID, or None if it does not exist.
+        """
+        return self._tasks_by_id.get(task_id)
+
+    def tasks_for_user(self, username: str) -> List[Dict[str, Any]]:
+        """
+        Returns the user's tasks in the order they were added.
+        """
+        return [self._tasks_by_id[task_id] for task_id in self._task_ids_by_user.get(username, ())]
+
+    def get_user(self, username: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the stored user record for a username, or None if unknown.
+        """
+        return self._users_by_name.get(username)
+
+    def due_tasks(self, username: str, today: date) -> List[Dict[str, Any]]:
+        """
+        Returns the user's pending tasks due on or before the given date, earliest first.
+        """
+        schedule = self._pending_due.get(username)
+        if schedule is None:
+            return []
+        return [self._tasks_by_id[task_id] for task_id in schedule.ids_until(today.toordinal())]
+
+    def next_due_date(self, username: str) -> Optional[str]:
+        """
+        Returns the earliest due date among the user's pending tasks ('YYYY-MM-DD'), or None.
+        """
+        schedule = self._pending_due.get(username)
+        return date.fromordinal(schedule.ordinals[0]).isoformat() if schedule and schedule.ids else None
+
+    def refresh_task(self, task: Dict[str, Any]) -> None:
+        """
+        Re-indexes a task after its due date or completion status changed in place.
+        """
+        self._unindex_due(task)
+        self._index_due(task)
+
+    def add_task(self, task: Dict[str, Any]) -> None:
+        """
+        Appends a task to the task list and indexes it.
+        """
+        self._tasks.append(task)
+        self._index_task(task, len(self._tasks) + len(self._tombstones) - 1)
+
+    def add_tasks(self, tasks: List[Dict[str, Any]]) -> None:
+        """
+        Appends many tasks at once, sorting each affected user's due ordering a single time.
+        """
+        affected = set()
+        for task in tasks:
+            self._tasks.append(task)
+            self._index_task(task, len(self._tasks) + len(self._tombstones) - 1, presorted=False)
+            affected.add(task.get("user"))
+        for user in affected:
+            if user in self._pending_due:
+                self._pending_due[user].sort()
+
+    def remove_task(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Removes a task without changing the order of the others. Finding its position is a
+        bisect over the tombstones; the list deletion itself is a memmove.
+
+        Returns:
+            Optional[Dict[str, Any]]: The removed task, or None if it was not found.
+        """
+        task = self._tasks_by_id.pop(task_id, None)
+        if task is None:
+            return None
+        self._unindex_due(task)
+        slot = self._slots.pop(task_id)
+        del self._tasks[slot - bisect_left(self._tombstones, slot)]
+        insort(self._tombstones, slot)
+        if len(self._tombstones) >= MAX_TOMBSTONES:
+            column = self._due_column
+            self._due_column = array("l", (column[self._slots[t["id"]]] for t in self._tasks))
+            self._slots = {t["id"]: slot for slot, t in enumerate(self._tasks)}
+            self._tombstones.clear()
+        user_tasks = self._task_ids_by_user.get(task.get("user"), {})
+        user_tasks.pop(task_id, None)
+        return task
+
+    def add_user(self, user: Dict[str, Any]) -> None:
+        """
+        Appends a user record to the user list and indexes it.
+        """
+        self._users.append(user)
+        self._users_by_name[user["username"]] = user
+
+
+class _DueSchedule:
+    """
+    One user's pending tasks ordered by (due ordinal, task id), as an array('l') of
+    ordinals and a parallel list of ids.
+    """
+
+    __slots__ = ("ordinals", "ids")
+
+    def __init__(self):
+        self.ordinals = array("l")
+        self.ids: List[str] = []
+
+    def append(self, ordinal: int, task_id: str) -> None:
+        """Adds an entry at the end; call sort() once all are appended."""
+        self.ordinals.append(ordinal)
+        self.ids.append(task_id)
+
+    def sort(self) -> None:
+        pairs = sorted(zip(self.ordinals, self.ids))
+        self.ordinals = array("l", [ordinal for ordinal, _ in pairs])
+        self.ids = [task_id for _, task_id in pairs]
+
+    def _find(self, ordinal: int, task_id: str) -> int:
+        """Returns where (ordinal, task_id) is or would be inserted."""
+        lo = bisect_left(self.ordinals, ordinal)
+        hi = bisect_right(self.ordinals, ordinal, lo)
+        return bisect_left(self.ids, task_id, lo, hi)
+
+    def insert(self, ordinal: int, task_id: str) -> None:
+        i = self._find(ordinal, task_id)
+        self.ordinals.insert(i, ordinal)
+        self.ids.insert(i, task_id)
+
+    def remove(self, ordinal: int, task_id: str) -> None:
+        i = self._find(ordinal, task_id)
+        del self.ordinals[i]
+        del self.ids[i]
+
+    def ids_until(self, ordinal: int) -> List[str]:
+        """Returns the ids due on or before the given ordinal, earliest first."""
+        return self.ids[:bisect_right(self.ordinals, ordinal)]
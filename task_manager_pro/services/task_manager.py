@@ -4,66 +4,250 @@ services/task_manager.py
 Defines the TaskManager class, the core controller for managing tasks and users in the CLI application.
 Responsible for user authentication, task CRUD operations, reminder notifications, and data persistence.
 Uses decorators for logging, JSON/DB storage interface, and optional email reminders for due tasks.
+Reminder emails are queued in an on-disk Outbox rather than sent inline, so commands never wait on SMTP.
+In lazy mode the dataset is only loaded when a command mutates it; read-only commands
+stream just the records they need from storage.
+Inside `with manager.batch():` storage writes are deferred and applied once when the block exits.
+Every task change also refreshes the owner's 'next_due_date' (earliest pending due date),
+which the reminder job uses to read only the users who have something due.
 """
 
-import uuid
-from typing import Optional
-from task_manager_pro.models.task import Task
+import hashlib
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from task_manager_pro.models.task import Task, normalize_due_date
 from task_manager_pro.models.user import User
+from task_manager_pro.services.task_index import TaskIndex, due_ordinal
 from task_manager_pro.storage.interface import StorageInterface
 from task_manager_pro.utils.decorators import log_action
+from task_manager_pro.utils.ids import new_id
+from task_manager_pro.utils.importer import RowParser
 from task_manager_pro.utils.session import save_session, load_session, clear_session
-from datetime import datetime
-from task_manager_pro.utils.emailer import send_email_reminder
+from datetime import datetime, timedelta
+from task_manager_pro.utils.outbox import Outbox
+
+# An identical reminder digest is not emailed again within this window
+DIGEST_RESEND_INTERVAL = timedelta(hours=24)
+
+# import_tasks prints a progress line every this many rows
+IMPORT_PROGRESS_EVERY = 10_000
+
+# Only the first invalid rows are reported individually
+MAX_REPORTED_IMPORT_ERRORS = 10
 
 
 class TaskManager:
-    def __init__(self, storage: StorageInterface):
+    def __init__(self, storage: StorageInterface, outbox: Optional[Outbox] = None, lazy: bool = False):
         """
         Initializes the TaskManager with a storage backend.
 
         Args:
             storage (StorageInterface): Abstract storage handler (e.g., JSON, SQLite).
+            outbox (Optional[Outbox]): Queue for reminder emails. Defaults to ./outbox.
+            lazy (bool): Defer loading the full dataset until a command needs it.
         """
         self.storage = storage
-        self.data = self.storage.load_data()
+        self.outbox = outbox or Outbox()
+        self._data: Optional[dict] = None
+        self._index: Optional[TaskIndex] = None
+        self._streamed_tasks: Optional[tuple] = None  # (username, tasks) read without a full load
+        self._pending: Optional[List[Tuple[str, Any]]] = None  # Storage writes deferred by batch()
+        if not lazy:
+            self._load()
         username = load_session()  # Restore session if any
         self.current_user: Optional[User] = None
         if username:
-            user_data = next((u for u in self.data["users"] if u["username"] == username), None)
+            user_data = self._find_user(username)
             if user_data:
-                self.current_user = User(**user_data)
+                self.current_user = User.from_dict(user_data)
+
+    def _load(self):
+        """
+        Loads the full dataset from storage and builds its indexes.
+        """
+        self._data = self.storage.load_data()
+        self._index = TaskIndex(self._data)
+        self._streamed_tasks = None
+
+    @property
+    def data(self) -> dict:
+        """Returns the full dataset, loading it on first access."""
+        if self._data is None:
+            self._load()
+        return self._data
+
+    @property
+    def index(self) -> TaskIndex:
+        """Returns the indexes over the full dataset, loading it on first access."""
+        if self._index is None:
+            self._load()
+        return self._index
+
+    def _persist(self, operation: str, record) -> None:
+        """
+        Writes one record change through the storage backend, or defers it while a batch is open.
+
+        Args:
+            operation (str): StorageInterface method name, e.g. 'insert_task'.
+            record: The affected record (or task ID for 'delete_task').
+        """
+        if self._pending is not None:
+            self._pending.append((operation, record))
+        else:
+            getattr(self.storage, operation)(self.data, record)
+
+    def _reschedule(self, username: Optional[str]) -> bool:
+        """
+        Stores the user's earliest pending due date on their record, persisting it only if it changed.
+
+        Returns:
+            bool: True if the record changed.
+        """
+        user_data = self.index.get_user(username)
+        if user_data is None:
+            return False
+        next_due = self.index.next_due_date(username)
+        if "next_due_date" in user_data and user_data["next_due_date"] == next_due:
+            return False
+        user_data["next_due_date"] = next_due
+        self._persist("update_user", user_data)
+        return True
+
+    @contextmanager
+    def batch(self):
+        """
+        Defers persistence until the block exits, then writes every change at once.
+        If the block (or the final write) raises, in-memory state is reloaded from storage,
+        discarding the block's changes. Nested batches join the outermost one.
+
+        Example:
+            with manager.batch():
+                for title in titles:
+                    manager.add_task(title, "", "2025-01-01")
+        """
+        if self._pending is not None:
+            yield self
+            return
+        self.data  # Changes are applied to the loaded dataset
+        self._pending = []
+        try:
+            yield self
+            operations, self._pending = self._pending, None
+            if operations:
+                self.storage.apply_batch(self._data, operations)
+        except BaseException:
+            self._pending = None
+            self._rollback()
+            raise
+
+    transaction = batch
+
+    def _rollback(self):
+        """
+        Discards unsaved in-memory changes by reloading the dataset and current user.
+        """
+        username = self.current_user.username if self.current_user else None
+        self._load()
+        user_data = self._find_user(username) if username else None
+        self.current_user = User.from_dict(user_data) if user_data else None
+
+    def _find_user(self, username: str) -> Optional[dict]:
+        """
+        Looks up a user record, streaming it from storage if the dataset is not loaded.
+        """
+        if self._index is not None:
+            return self._index.get_user(username)
+        return next((u for u in self.storage.iter_users() if u["username"] == username), None)
+
+    def _tasks_for_user(self, username: str) -> list:
+        """
+        Returns a user's tasks, streaming only that user's records if the dataset is not loaded.
+        """
+        if self._index is not None:
+            return self._index.tasks_for_user(username)
+        if self._streamed_tasks is None or self._streamed_tasks[0] != username:
+            self._streamed_tasks = (username, list(self.storage.iter_tasks(user=username)))
+        return self._streamed_tasks[1]
+
+    def _due_tasks(self, username: str, today) -> list:
+        """
+        Returns the user's pending tasks due on or before today, earliest first.
+        """
+        if self._index is not None:
+            return self._index.due_tasks(username, today)
+        today_ordinal = today.toordinal()
+        due = []
+        for t in self._tasks_for_user(username):
+            ordinal = due_ordinal(t.get("due_date"))
+            if not t["completed"] and ordinal is not None and ordinal <= today_ordinal:
+                due.append((ordinal, t["id"], t))
+        return [t for _, _, t in sorted(due, key=lambda entry: entry[:2])]
 
     def _print_due_reminders(self):
         """
         Checks and prints tasks that are due or overdue.
-        Also sends an email reminder if user's email is configured.
+        Also queues an email reminder if user's email is configured, unless the
+        same digest was already queued within DIGEST_RESEND_INTERVAL.
         """
+        if not self.current_user:
+            return
         today = datetime.today().date()
-        due_tasks = [
-            t for t in self.data["tasks"]
-            if t["user"] == self.current_user.username
-            and not t["completed"]
-            and datetime.strptime(t["due_date"], "%Y-%m-%d").date() <= today
-        ]
+        due_tasks = self._due_tasks(self.current_user.username, today)
 
         if due_tasks:
             print("\n⏰ You have tasks due or overdue:")
             for t in due_tasks:
                 print(f"  🔔 {t['title']} — Due: {t['due_date']}")
 
-        # Send optional email reminder
+        # Queue optional email reminder (sent later by `drain-outbox`)
         if due_tasks and self.current_user._email:
             subject = "🔔 Task Due Reminder"
             message = "\n".join([f"{t['title']} — Due: {t['due_date']}" for t in due_tasks])
+            digest_hash = hashlib.sha256(
+                "\n".join([self.current_user._email, subject, message]).encode()
+            ).hexdigest()
+            user_data = self._find_user(self.current_user.username)
+            if user_data and self._digest_recently_sent(user_data, digest_hash):
+                print("💤 Same reminder was emailed recently; not sending again.")
+                return
             try:
-                send_email_reminder(
+                self.outbox.enqueue(
                     to_email=self.current_user._email,
                     subject=subject,
                     body=message
                 )
-            except Exception as e:
-                print(f"⚠️ Could not send email reminder: {e}")
+                print(f"📬 Email reminder queued for {self.current_user._email}.")
+            except OSError as e:
+                print(f"⚠️ Could not queue email reminder: {e}")
+                return
+            if user_data:
+                user_data["last_digest_hash"] = digest_hash
+                user_data["last_digest_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                if self._data is not None:
+                    self._persist("update_user", user_data)
+                else:
+                    self.storage.update_user_fields({user_data["username"]: {
+                        "last_digest_hash": user_data["last_digest_hash"],
+                        "last_digest_at": user_data["last_digest_at"],
+                    }})
+
+    @staticmethod
+    def _digest_recently_sent(user_data: dict, digest_hash: str) -> bool:
+        """
+        Checks whether this exact digest was already queued for the user within the resend window.
+
+        Args:
+            user_data (dict): Stored user record.
+            digest_hash (str): SHA-256 of the recipient, subject and body.
+
+        Returns:
+            bool: True if the email can be skipped.
+        """
+        if user_data.get("last_digest_hash") != digest_hash or not user_data.get("last_digest_at"):
+            return False
+        last_sent = datetime.strptime(user_data["last_digest_at"], "%Y-%m-%d %H:%M:%S")
+        return datetime.now() - last_sent < DIGEST_RESEND_INTERVAL
 
     @log_action
     def login(self, username: str, email: Optional[str] = None):
@@ -74,29 +258,57 @@ class TaskManager:
             username (str): Username.
             email (Optional[str]): Optional email for reminder setup.
         """
-        user_data = next((u for u in self.data["users"] if u["username"] == username), None)
+        user_data = self.index.get_user(username)
 
         if user_data:
-            self.current_user = User(**user_data)
+            self.current_user = User.from_dict(user_data)
             if "email" not in user_data or not user_data["email"]:
                 user_email = input("📧 Enter your email (optional, for reminders): ").strip()
                 if user_email:
                     self.current_user._email = user_email
                     user_data["email"] = user_email
-                    self.storage.save_data(self.data)
+                    self._persist("update_user", user_data)
         else:
             self.current_user = User(username, email=email)
             if not email:
                 user_email = input("📧 Enter your email (optional, for reminders): ").strip()
                 if user_email:
                     self.current_user._email = user_email
-            self.data["users"].append(self.current_user.to_dict())
-            self.storage.save_data(self.data)
+            user_data = self.current_user.to_dict()
+            user_data["next_due_date"] = None  # No tasks yet
+            self.index.add_user(user_data)
+            self._persist("insert_user", user_data)
 
         save_session(username)
         print(f"✅ Logged in as {self.current_user.username}")
         self._print_due_reminders()
 
+    @log_action
+    def register_user(self, username: str, email: Optional[str] = None) -> dict:
+        """
+        Creates a user, or updates an existing user's email, without prompting or
+        touching the CLI session (used by the HTTP API).
+
+        Args:
+            username (str): Username.
+            email (Optional[str]): Email for reminders; left unchanged when None.
+
+        Returns:
+            dict: The stored user record.
+        """
+        user_data = self.index.get_user(username)
+        if user_data is None:
+            user_data = User(username, email=email).to_dict()
+            user_data["next_due_date"] = None  # No tasks yet
+            self.index.add_user(user_data)
+            self._persist("insert_user", user_data)
+            print(f"👤 Registered {username}")
+        elif email is not None and user_data.get("email") != email:
+            user_data["email"] = email
+            self._persist("update_user", user_data)
+            print(f"📧 Updated email for {username}")
+        return user_data
+
     @log_action
     def add_task(self, title: str, desc: str, due: str):
         """
@@ -106,21 +318,80 @@ class TaskManager:
             title (str): Task title.
             desc (str): Task description.
             due (str): Due date in 'YYYY-MM-DD'.
+
+        Returns:
+            Optional[dict]: The stored task record, or None if nobody is logged in.
         """
         if not self.current_user:
             print("❌ Please login first.")
-            return
+            return None
 
         task = Task(title, desc, due)
-        task.id = uuid.uuid4().hex
+        task.id = new_id()
+        task.user = self.current_user.username
         task_dict = task.to_dict()
-        task_dict["id"] = task.id
-        task_dict["user"] = self.current_user.username
 
-        self.data["tasks"].append(task_dict)
-        self.storage.save_data(self.data)
+        with self.batch():
+            self.index.add_task(task_dict)
+            self._persist("insert_task", task_dict)
+            self._reschedule(task.user)
         print(f"✅ Task '{title}' added.")
         print(f"🆔 Task ID: {task.id}")
+        return task_dict
+
+    @log_action
+    def import_tasks(self, rows: Iterable[Any], strict: bool = False,
+                     progress_every: int = IMPORT_PROGRESS_EVERY) -> Optional[Dict[str, Any]]:
+        """
+        Bulk-adds tasks from an iterable of rows (e.g. utils.importer.read_rows) in one storage write.
+        Rows without a 'user' field are assigned to the current user.
+
+        Args:
+            rows (Iterable[Any]): Row dictionaries with title, due_date/due and optional
+                description, completed and user.
+            strict (bool): Abort the whole import on the first invalid row instead of skipping it.
+            progress_every (int): Print a progress line after this many rows.
+
+        Returns:
+            Optional[Dict[str, Any]]: Counts of imported/skipped rows, elapsed seconds and
+                rows per second, or None if the import was aborted.
+        """
+        start = time.perf_counter()
+        parser = RowParser(
+            self.current_user.username if self.current_user else None,
+            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        )
+        tasks = []
+        skipped = 0
+        try:
+            for row_number, row in enumerate(rows, start=1):
+                try:
+                    tasks.append(parser.parse(row))
+                except ValueError as e:
+                    if strict:
+                        print(f"❌ Row {row_number}: {e}. Nothing was imported.")
+                        return None
+                    skipped += 1
+                    if skipped <= MAX_REPORTED_IMPORT_ERRORS:
+                        print(f"⚠️ Row {row_number}: {e} — skipped.")
+                if row_number % progress_every == 0:
+                    print(f"  … {row_number:,} rows read")
+        except ValueError as e:  # Unreadable feed
+            print(f"❌ {e}. Nothing was imported.")
+            return None
+
+        with self.batch():
+            self.index.add_tasks(tasks)
+            for task in tasks:
+                self._persist("insert_task", task)
+            for username in {task["user"] for task in tasks}:
+                self._reschedule(username)
+
+        elapsed = time.perf_counter() - start
+        rows_read = len(tasks) + skipped
+        rate = rows_read / elapsed if elapsed else float("inf")
+        print(f"📥 Imported {len(tasks):,} tasks ({skipped:,} skipped) in {elapsed:.2f}s — {rate:,.0f} rows/s")
+        return {"imported": len(tasks), "skipped": skipped, "elapsed_seconds": elapsed, "rows_per_second": rate}
 
     @log_action
     def update_task(self, task_id: str, title: str = None, desc: str = None, due: str = None):
@@ -131,25 +402,37 @@ class TaskManager:
             task_id (str): Unique task identifier.
             title (Optional[str]): New title.
             desc (Optional[str]): New description.
-            due (Optional[str]): New due date.
+            due (Optional[str]): New due date; stored zero-padded.
+
+        Returns:
+            Optional[dict]: The updated task record, or None if it was not found.
+
+        Raises:
+            ValueError: If due is not a valid 'YYYY-MM-DD' date.
         """
         if not self.current_user:
             print("❌ Please login first.")
-            return
-
-        for task in self.data["tasks"]:
-            if task["id"] == task_id and task["user"] == self.current_user.username:
-                if title:
-                    task["title"] = title
-                if desc:
-                    task["description"] = desc
+            return None
+
+        task = self.index.get_task(task_id)
+        if task and task["user"] == self.current_user.username:
+            if due:
+                due = normalize_due_date(due)  # Before any change, so a bad date leaves the task as it was
+            if title:
+                task["title"] = title
+            if desc:
+                task["description"] = desc
+            with self.batch():
                 if due:
                     task["due_date"] = due
-                self.storage.save_data(self.data)
-                print(f"🔄 Task '{task_id}' updated successfully.")
-                return
+                    self.index.refresh_task(task)
+                self._persist("update_task", task)
+                self._reschedule(task["user"])
+            print(f"🔄 Task '{task_id}' updated successfully.")
+            return task
 
         print("❌ Task not found or does not belong to current user.")
+        return None
 
     @log_action
     def mark_task_complete(self, task_id: str):
@@ -158,14 +441,21 @@ class TaskManager:
 
         Args:
             task_id (str): Unique task identifier.
+
+        Returns:
+            Optional[dict]: The updated task record, or None if it was not found.
         """
-        for task in self.data["tasks"]:
-            if task["id"] == task_id:
+        task = self.index.get_task(task_id)
+        if task:
+            with self.batch():
                 task["completed"] = True
-                self.storage.save_data(self.data)
-                print(f"✅ Task '{task['title']}' marked as completed.")
-                return
+                self.index.refresh_task(task)
+                self._persist("update_task", task)
+                self._reschedule(task.get("user"))
+            print(f"✅ Task '{task['title']}' marked as completed.")
+            return task
         print("❌ Task not found.")
+        return None
 
     @log_action
     def list_tasks(self, filter_status: str, verbose: bool = False, summary: bool = False):
@@ -177,27 +467,30 @@ class TaskManager:
             verbose (bool): Show description for each task.
             summary (bool): Show overall task count breakdown.
         """
-        tasks = self.data["tasks"]
         if self.current_user:
-            tasks = [t for t in tasks if t["user"] == self.current_user.username]
-
-        if filter_status == "completed":
-            tasks = [t for t in tasks if t["completed"]]
-        elif filter_status == "pending":
-            tasks = [t for t in tasks if not t["completed"]]
-
-        if not tasks:
-            print("📭 No tasks found.")
+            tasks = self._tasks_for_user(self.current_user.username)
+        elif self._data is not None:
+            tasks = self._data["tasks"]
         else:
-            for task in tasks:
-                status = "✅" if task["completed"] else "⏳"
-                print(f"{status} {task['title']} - Due: {task['due_date']}")
-                if verbose:
-                    print(f"    📝 {task['description']}")
+            tasks = self.storage.iter_tasks()  # Stream instead of loading everything
+
+        total = completed = 0
+        for task in tasks:
+            if filter_status == "completed" and not task["completed"]:
+                continue
+            if filter_status == "pending" and task["completed"]:
+                continue
+            status = "✅" if task["completed"] else "⏳"
+            print(f"{status} {task['title']} - Due: {task['due_date']}")
+            if verbose:
+                print(f"    📝 {task['description']}")
+            total += 1
+            completed += 1 if task["completed"] else 0
+
+        if not total:
+            print("📭 No tasks found.")
         
         if summary:
-            total = len(tasks)
-            completed = sum(1 for t in tasks if t["completed"])
             pending = total - completed
             print(f"\n📊 Summary:\nTotal: {total} | Completed: {completed} | Pending: {pending}")
         
@@ -210,14 +503,19 @@ class TaskManager:
 
         Args:
             task_id (str): Unique task identifier.
+
+        Returns:
+            Optional[dict]: The removed task record, or None if it was not found.
         """
-        for i, task in enumerate(self.data["tasks"]):
-            if task["id"] == task_id:
-                deleted = self.data["tasks"].pop(i)
-                self.storage.save_data(self.data)
-                print(f"🗑️ Deleted task '{deleted['title']}'")
-                return
+        deleted = self.index.remove_task(task_id)
+        if deleted:
+            with self.batch():
+                self._persist("delete_task", task_id)
+                self._reschedule(deleted.get("user"))
+            print(f"🗑️ Deleted task '{deleted['title']}'")
+            return deleted
         print("❌ Task not found.")
+        return None
 
     @log_action
     def logout(self):
@@ -246,17 +544,33 @@ class TaskManager:
         """
         Toggles email reminder setting for the current user.
         Also updates the setting in persistent storage.
+
+        Returns:
+            Optional[bool]: The new setting, or None if nobody is logged in.
         """
         if not self.current_user:
             print("❌ Please login first.")
-            return
-        
+            return None
+
         updated_value = self.current_user.toggle_email_reminders()
         print(f"🔧 Email reminders {'enabled' if updated_value else 'disabled'}.")
 
-        for u in self.data["users"]:
-            if u["username"] == self.current_user.username:
-                u["email_reminders_enabled"] = updated_value
-                break
-        
-        self.storage.save_data(self.data)
\ No newline at end of file
+        user_data = self.index.get_user(self.current_user.username)
+        if user_data:
+            user_data["email_reminders_enabled"] = updated_value
+            self._persist("update_user", user_data)
+        return updated_value
+
+    @log_action
+    def reschedule_users(self) -> int:
+        """
+        Recomputes every user's next_due_date, e.g. for data written before it was tracked
+        or edited outside TaskManager.
+
+        Returns:
+            int: Number of user records that changed.
+        """
+        with self.batch():
+            changed = sum(self._reschedule(user_data["username"]) for user_data in self.data["users"])
+        print(f"🗓️ Rescheduled {changed} user(s).")
+        return changed
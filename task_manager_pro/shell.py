@@ -0,0 +1,134 @@
+"""
+shell.py
+
+Interactive shell for Task Manager PRO (`task-manager shell [script]`).
+Reads one CLI subcommand per line, parses it with the same argparse parser as
+`task-manager`, and runs it against a single TaskManager whose data stays loaded,
+so a long series of commands pays the interpreter start-up and load_data() once.
+
+Interactive sessions (stdin is a terminal) save after every change. Scripts (a file
+or piped stdin) run inside TaskManager.batch(), so all their changes are written once
+at the end; interrupting a script discards its changes.
+"""
+
+import contextlib
+import io
+import shlex
+import sys
+import time
+from typing import Dict, Iterator, Optional, TextIO
+from task_manager_pro.cli import drain_outbox, export, run_command
+from task_manager_pro.services.task_manager import TaskManager
+
+PROMPT = "task-manager> "
+
+# Commands that make no sense inside a running shell
+UNAVAILABLE_COMMANDS = ("shell", "serve")
+
+
+class _BlankAnswers(io.TextIOBase):
+    """Stands in for stdin while a script runs: every prompt reads an empty answer."""
+
+    def readline(self, size=-1) -> str:
+        return "\n"
+
+
+def _read_lines(stream: TextIO, interactive: bool) -> Iterator[str]:
+    """
+    Yields command lines, prompting when attached to a terminal.
+    """
+    if not interactive:
+        yield from stream
+        return
+    while True:
+        try:
+            yield input(PROMPT)
+        except EOFError:
+            print()
+            return
+
+
+def run_line(manager: TaskManager, parser, line: str, interactive: bool = True) -> bool:
+    """
+    Parses and runs one shell line.
+
+    Args:
+        manager (TaskManager): The shared, loaded manager.
+        parser (argparse.ArgumentParser): Parser from cli.build_parser().
+        line (str): Command line without the program name, e.g. 'list-tasks --summary'.
+        interactive (bool): Whether commands may prompt on stdin (e.g. login asking for an email).
+
+    Returns:
+        bool: True if the command ran without errors.
+    """
+    try:
+        args = parser.parse_args(shlex.split(line))
+    except ValueError as e:  # Unbalanced quotes
+        print(f"❌ {e}")
+        return False
+    except SystemExit as e:  # argparse already printed the problem (or the help text)
+        return e.code == 0
+    if args.command in UNAVAILABLE_COMMANDS:
+        print(f"❌ '{args.command}' is not available inside the shell.")
+        return False
+
+    stdin = sys.stdin
+    if not interactive:
+        sys.stdin = _BlankAnswers()  # Prompts get an empty answer instead of eating script lines
+    try:
+        if args.command == "drain-outbox":
+            drain_outbox(args)
+        elif args.command == "export-tasks":
+            export(args, lambda user: manager.index.tasks_for_user(user) if user else list(manager.data["tasks"]))
+        else:
+            run_command(manager, args)
+        return True
+    except Exception as e:
+        print(f"❌ {args.command} failed: {e}")
+        return False
+    finally:
+        sys.stdin = stdin
+
+
+def run_shell(manager: TaskManager, parser, script: Optional[str] = None,
+              stream: Optional[TextIO] = None) -> Dict[str, int]:
+    """
+    Runs commands from a script file, a given stream, or stdin until EOF or 'exit'.
+
+    Args:
+        manager (TaskManager): Manager to run the commands against.
+        parser (argparse.ArgumentParser): Parser from cli.build_parser().
+        script (Optional[str]): Path of a file with one command per line.
+        stream (Optional[TextIO]): Stream to read instead of stdin (when no script is given).
+
+    Returns:
+        Dict[str, int]: Number of commands run and of those that failed.
+    """
+    start = time.perf_counter()
+    stats = {"commands": 0, "failed": 0}
+    with contextlib.ExitStack() as stack:
+        if script:
+            stream = stack.enter_context(open(script, encoding="utf-8"))
+        stream = stream or sys.stdin
+        interactive = stream is sys.stdin and sys.stdin.isatty()
+        if interactive:
+            print("🐚 Task Manager PRO shell — type a command (e.g. 'list-tasks'), 'help' or 'exit'.")
+        else:
+            stack.enter_context(manager.batch())
+
+        for line in _read_lines(stream, interactive):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line in ("exit", "quit"):
+                break
+            if line == "help":
+                parser.print_help()
+                continue
+            stats["commands"] += 1
+            if not run_line(manager, parser, line, interactive):
+                stats["failed"] += 1
+
+    elapsed = time.perf_counter() - start
+    print(f"🐚 Ran {stats['commands']} commands ({stats['failed']} failed) in {elapsed:.2f}s")
+    return stats
@@ -0,0 +1,60 @@
+"""
+storage/file_lock.py
+
+Implements FileLock, an advisory inter-process lock on a small side file.
+Used by JSONStorage to serialize writers across processes (e.g. a CLI command and the
+cron reminder job). Uses fcntl.flock on POSIX and msvcrt.locking on Windows; the lock
+is released automatically if the holding process dies.
+"""
+
+import os
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    def __init__(self, path: str):
+        """
+        Initializes the lock. Nothing is created or locked until the lock is entered.
+
+        Args:
+            path (str): Lock file path; created if missing and never deleted.
+        """
+        self.path = path
+        self._fd = None
+
+    def __enter__(self):
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                while True:
+                    try:
+                        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:  # LK_LOCK gives up after ~10 s; keep waiting like flock does
+                        time.sleep(0.05)
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+        return False
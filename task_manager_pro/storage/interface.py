@@ -4,10 +4,41 @@ storage/interface.py
 Defines an abstract interface for storage backends used by Task Manager PRO.
 This interface enforces a contract for loading and saving task/user data,
 enabling flexibility to support different storage mechanisms (e.g., JSON, SQLite).
+
+Besides whole-dataset load/save, the interface exposes per-record write methods.
+Their default implementations fall back to a full save_data(), so a backend only
+needs to override them when it can persist a single row more cheaply.
+Likewise, iter_tasks/iter_users default to load_data() but can be overridden to
+stream records with bounded memory.
+
+User records carry 'next_due_date', the earliest due date among the user's pending
+tasks (None if they have none), kept up to date by TaskManager. due_users() uses it
+so the reminder job only reads users who have something due. Backends that index it
+derive it from the tasks they store, since a record saved from a stale copy may not.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class StorageConflictError(Exception):
+    """
+    Raised when a full save_data() would overwrite changes that another process
+    persisted after the data being saved was loaded.
+    """
+
+
+def schedule_key(user: Dict[str, Any]) -> Optional[str]:
+    """
+    Returns the date a user is scheduled for: their 'next_due_date', None if they have
+    no pending due tasks, or '' if the record predates scheduling. '' sorts before every
+    date, so unscheduled users are always treated as due.
+    """
+    if "next_due_date" not in user:
+        return ""
+    return user["next_due_date"]
+
 
 class StorageInterface(ABC):
     @abstractmethod
@@ -28,4 +59,139 @@ class StorageInterface(ABC):
         Args:
             data (Dict[str, Any]): Dictionary containing 'users', 'tasks', and other relevant info.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def insert_task(self, data: Dict[str, Any], task: Dict[str, Any]) -> None:
+        """
+        Persist a newly created task.
+
+        Args:
+            data (Dict[str, Any]): Full in-memory dataset (already containing the task).
+            task (Dict[str, Any]): The task record that was added.
+        """
+        self.save_data(data)
+
+    def update_task(self, data: Dict[str, Any], task: Dict[str, Any]) -> None:
+        """
+        Persist changes made to an existing task.
+
+        Args:
+            data (Dict[str, Any]): Full in-memory dataset (already containing the change).
+            task (Dict[str, Any]): The updated task record.
+        """
+        self.save_data(data)
+
+    def delete_task(self, data: Dict[str, Any], task_id: str) -> None:
+        """
+        Persist the removal of a task.
+
+        Args:
+            data (Dict[str, Any]): Full in-memory dataset (task already removed).
+            task_id (str): ID of the deleted task.
+        """
+        self.save_data(data)
+
+    def insert_user(self, data: Dict[str, Any], user: Dict[str, Any]) -> None:
+        """
+        Persist a newly registered user.
+
+        Args:
+            data (Dict[str, Any]): Full in-memory dataset (already containing the user).
+            user (Dict[str, Any]): The user record that was added.
+        """
+        self.save_data(data)
+
+    def update_user(self, data: Dict[str, Any], user: Dict[str, Any]) -> None:
+        """
+        Persist changes made to an existing user.
+
+        Args:
+            data (Dict[str, Any]): Full in-memory dataset (already containing the change).
+            user (Dict[str, Any]): The updated user record.
+        """
+        self.save_data(data)
+
+    def apply_batch(self, data: Dict[str, Any], operations: List[Tuple[str, Any]]) -> None:
+        """
+        Persist several record changes at once, e.g. at the end of TaskManager.batch().
+
+        Args:
+            data (Dict[str, Any]): Full in-memory dataset (already containing every change).
+            operations (List[Tuple[str, Any]]): (method name, record) pairs in the order they
+                happened, e.g. ("insert_task", task) or ("delete_task", task_id).
+        """
+        self.save_data(data)
+
+    def save_users(self, users: List[Dict[str, Any]]) -> None:
+        """
+        Persist changes to several existing users without the caller holding the full dataset.
+
+        Args:
+            users (List[Dict[str, Any]]): Updated user records, matched by username.
+        """
+        updates = {u["username"]: u for u in users}
+        data = self.load_data()
+        data["users"] = [updates.get(u["username"], u) for u in data.get("users", [])]
+        self.save_data(data)
+
+    def update_user_fields(self, changes: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Sets individual fields on several existing users, keeping every other field as it is
+        in storage, so a concurrent change to another field of the same user is not lost.
+
+        Args:
+            changes (Dict[str, Dict[str, Any]]): Username → fields to set; unknown users are ignored.
+        """
+        data = self.load_data()
+        for user in data.get("users", []):
+            if user["username"] in changes:
+                user.update(changes[user["username"]])
+        self.save_data(data)
+
+    def iter_tasks(self, user: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield task records one at a time, optionally only those of one user.
+
+        Args:
+            user (Optional[str]): Username to filter by; None yields every task.
+        """
+        for task in self.load_data().get("tasks", []):
+            if user is None or task.get("user") == user:
+                yield task
+
+    def iter_users(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield user records one at a time.
+        """
+        yield from self.load_data().get("users", [])
+
+
+    def due_users(self, today: date) -> List[Dict[str, Any]]:
+        """
+        Return the users whose earliest pending due date is on or before today,
+        plus any user whose record predates scheduling.
+
+        Args:
+            today (date): Reference date for "due or overdue".
+        """
+        cutoff = today.isoformat()
+        due = []
+        for user in self.iter_users():
+            key = schedule_key(user)
+            if key is not None and key <= cutoff:
+                due.append(user)
+        return due
+
+    def iter_pending_tasks(self, usernames: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the pending (not completed) tasks of the given users.
+
+        Args:
+            usernames (Iterable[str]): Users whose tasks are wanted.
+        """
+        wanted = set(usernames)
+        if not wanted:
+            return
+        for task in self.iter_tasks():
+            if not task.get("completed") and task.get("user") in wanted:
+                yield task
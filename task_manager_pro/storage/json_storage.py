@@ -4,22 +4,201 @@ storage/json_storage.py
 Implements the JSONStorage class, a concrete storage backend for Task Manager PRO.
 Persists tasks and users data to a local JSON file (default: tasks.json).
 Implements the StorageInterface to support load and save operations.
+
+In journaled mode, per-record changes are appended as JSON lines to a journal file
+(default: tasks.journal) instead of rewriting the whole snapshot. The journal is
+replayed on load and folded back into the snapshot once it grows past a threshold.
+
+iter_tasks/iter_users walk the snapshot incrementally, decoding one record at a time,
+so reading a single user's tasks needs memory proportional to that user's tasks
+rather than to the whole file.
+
+Several processes may share one file. Writes take an advisory lock (tasks.json.lock)
+only for the write itself, and every snapshot carries a version counter. A record-level
+change whose in-memory copy is stale is merged into the current file instead of
+overwriting it; a stale full save_data() raises StorageConflictError.
+
+Snapshots are laid out as version, schedule, users, tasks. The schedule is a sorted
+list of [next_due_date, username] pairs, so due_users() reads it only up to today's
+date and then the users it names, without touching the (much larger) task list.
+Each user's next_due_date is recomputed from the tasks whenever a snapshot is written,
+and due_users() trusts journaled tasks rather than journaled user records, so a user
+record saved from a stale copy cannot hide a due task.
+
+Durability levels trade safety for write throughput:
+    every-write  each change is written and fsynced before the call returns (default)
+    group        changes are buffered and written together, with one fsync, after
+                 group_size changes or group_delay_ms milliseconds, whichever comes first
+    none         each change is written but never fsynced (the OS flushes it later)
 """
 
+import atexit
+import copy
+import itertools
 import json
 import os
-from typing import Dict, Any
-from task_manager_pro.storage.interface import StorageInterface
+import re
+import textwrap
+import threading
+from contextlib import contextmanager
+from datetime import date
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional, TextIO, Tuple
+from task_manager_pro.services.task_index import pending_due_dates
+from task_manager_pro.storage.file_lock import FileLock
+from task_manager_pro.storage.interface import StorageConflictError, StorageInterface, schedule_key
+from task_manager_pro.utils.metrics import METRICS
+
+# Journal size (in bytes) after which it is folded back into the snapshot
+DEFAULT_COMPACT_THRESHOLD = 1024 * 1024
+
+# Characters read per step by the streaming loader
+STREAM_CHUNK_SIZE = 64 * 1024
+
+DURABILITY_LEVELS = ("none", "group", "every-write")
+
+# Group commit flushes after this many buffered changes...
+DEFAULT_GROUP_SIZE = 100
+
+# ...or this long after the first one, whichever comes first
+DEFAULT_GROUP_DELAY_MS = 20
+
+# Snapshots begin with their version counter, so it can be read without parsing the file
+_VERSION_PREFIX = re.compile(r'\s*\{\s*"version"\s*:\s*(\d+)')
+
+# ...followed by the schedule, unless written before schedules existed
+_SCHEDULE_PREFIX = re.compile(r'\s*\{\s*"version"\s*:\s*\d+\s*,\s*"schedule"\s*:')
+
+# Key holding the record in a journal entry, per operation
+_ENTRY_KEYS = {
+    "insert_task": "task",
+    "update_task": "task",
+    "delete_task": "id",
+    "insert_user": "user",
+    "update_user": "user",
+}
+
+
+def iter_json_array(f: TextIO, key: str, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Yields the elements of one top-level array (e.g., "tasks") of a JSON object file,
+    decoding them one at a time. Other top-level values are parsed and discarded
+    element by element, so memory use is bounded by the largest single record.
+
+    Args:
+        f (TextIO): File opened for reading, positioned at the start of the JSON object.
+        key (str): Name of the top-level array to stream.
+        chunk_size (int): Characters read per refill.
+    """
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    eof = False
+
+    def refill() -> bool:
+        nonlocal buf, pos, eof
+        chunk = f.read(chunk_size)
+        if not chunk:
+            eof = True
+            return False
+        buf = buf[pos:] + chunk
+        pos = 0
+        return True
+
+    def peek() -> str:
+        # Skips whitespace and returns the next significant character ('' at end of file)
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buf):
+                return buf[pos]
+            if not refill():
+                return ""
+
+    def next_value() -> Any:
+        nonlocal pos
+        while True:
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+                # A value ending exactly at the buffer edge may be a truncated number
+                if end < len(buf) or eof:
+                    pos = end
+                    return value
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            refill()
+
+    if peek() != "{":
+        raise ValueError("Expected a JSON object at the top level")
+    pos += 1
+    while True:
+        c = peek()
+        if c in ("}", ""):
+            return
+        if c == ",":
+            pos += 1
+            continue
+        name = next_value()
+        if peek() != ":":
+            raise ValueError(f"Expected ':' after key {name!r}")
+        pos += 1
+        if peek() != "[":
+            next_value()
+            continue
+        pos += 1
+        while True:
+            c = peek()
+            if c == "]":
+                pos += 1
+                break
+            if c == ",":
+                pos += 1
+                continue
+            if c == "":
+                raise ValueError(f"Unterminated array {name!r}")
+            item = next_value()
+            if name == key:
+                yield item
+        if name == key:
+            return
+
 
 class JSONStorage(StorageInterface):
-    def __init__(self, filename="tasks.json"):
+    def __init__(self, filename="tasks.json", journaled: bool = False,
+                 compact_threshold: int = DEFAULT_COMPACT_THRESHOLD, durability: str = "every-write",
+                 group_size: int = DEFAULT_GROUP_SIZE, group_delay_ms: float = DEFAULT_GROUP_DELAY_MS):
         """
         Initializes the JSONStorage instance.
 
         Args:
             filename (str): Name of the JSON file to store task and user data.
+            journaled (bool): Append per-record changes to a journal instead of rewriting the file.
+            compact_threshold (int): Journal size in bytes that triggers a background compaction.
+            durability (str): One of DURABILITY_LEVELS.
+            group_size (int): Buffered changes that trigger a group commit.
+            group_delay_ms (float): Longest time a change waits in the group commit buffer.
+
+        Raises:
+            ValueError: If the durability level is unknown.
         """
+        if durability not in DURABILITY_LEVELS:
+            raise ValueError(f"Unknown durability level '{durability}'; expected one of {DURABILITY_LEVELS}")
         self.filename = filename
+        self.journaled = journaled
+        self.journal_file = os.path.splitext(filename)[0] + ".journal"
+        self.lock_file = f"{filename}.lock"
+        self.compact_threshold = compact_threshold
+        self._lock = threading.Lock()
+        self._compaction_thread: Optional[threading.Thread] = None
+        self.durability = durability
+        self.group_size = group_size
+        self.group_delay_ms = group_delay_ms
+        self._pending: List[Dict[str, Any]] = []
+        self._pending_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        if durability == "group":
+            atexit.register(self.flush)
         if not os.path.exists(self.filename):
             self._initialize_file()
 
@@ -27,28 +206,525 @@ class JSONStorage(StorageInterface):
         """
         Creates an empty JSON file with initial structure if it doesn't exist.
         """
-        with open(self.filename, "w") as f:
-            json.dump({"tasks": [], "users": []}, f)
+        with self._locked():
+            if not os.path.exists(self.filename):
+                self._write_snapshot({"tasks": [], "users": []}, 0)
 
-    def load_data(self) -> Dict[str, Any]:
+    @contextmanager
+    def _locked(self):
+        """
+        Holds the in-process lock and the inter-process file lock for a read-modify-write.
         """
-        Loads and returns the data from the JSON file.
+        with self._lock, FileLock(self.lock_file):
+            yield
 
-        Returns:
-            Dict[str, Any]: Dictionary containing user and task data.
+    def _read_snapshot(self) -> Dict[str, Any]:
+        """
+        Reads the JSON snapshot file without applying the journal.
         """
         try:
             with open(self.filename, "r") as f:
-                return json.load(f)
+                data = json.load(f)
+        except FileNotFoundError:
+            data = {"users": [], "tasks": []}
+        data.setdefault("version", 0)
+        data.pop("schedule", None)  # Derived from the users; rebuilt on every write
+        return data
+
+    def _snapshot_version(self) -> int:
+        """
+        Returns the version counter of the snapshot on disk.
+        Snapshots written by this class start with it, so usually only the first bytes are read.
+        """
+        try:
+            with open(self.filename, "r") as f:
+                match = _VERSION_PREFIX.match(f.read(64))
+        except FileNotFoundError:
+            return 0
+        if match:
+            return int(match.group(1))
+        return self._read_snapshot()["version"]  # Written before versioning existed
+
+    def _write_snapshot(self, data: Dict[str, Any], version: int) -> None:
+        """
+        Writes the snapshot, stamped with a version, to a temporary file and atomically
+        renames it into place, so a crash mid-write never leaves a truncated tasks.json behind.
+        """
+        users = self._rescheduled(data.get("users", []), data.get("tasks", []))
+        snapshot = {"version": version, "schedule": self._schedule(users),
+                    "users": users, "tasks": data.get("tasks", [])}
+        snapshot.update((key, value) for key, value in data.items() if key not in snapshot)
+        tmp_name = f"{self.filename}.{os.getpid()}.tmp"
+        with METRICS.timer("storage_save_seconds", backend="json"):
+            with open(tmp_name, "w") as f:
+                json.dump(snapshot, f, indent=4)
+                self._sync(f)
+                METRICS.inc("storage_bytes_written_total", f.tell(), backend="json")
+            os.replace(tmp_name, self.filename)
+
+    @staticmethod
+    def _rescheduled(users: List[Dict[str, Any]], tasks: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Returns the users with 'next_due_date' derived from the tasks, copying only the records that change.
+        """
+        due = pending_due_dates(tasks)
+        return [user if "next_due_date" in user and user["next_due_date"] == due.get(user["username"])
+                else {**user, "next_due_date": due.get(user["username"])} for user in users]
+
+    @staticmethod
+    def _schedule(users: Iterable[Dict[str, Any]]) -> List[List[str]]:
+        """
+        Builds the sorted [next_due_date, username] schedule, leaving out users with nothing pending.
+        """
+        entries = []
+        for user in users:
+            key = schedule_key(user)
+            if key is not None:
+                entries.append([key, user["username"]])
+        return sorted(entries)
+
+    def _sync(self, f) -> None:
+        """
+        Flushes an open file to disk unless durability is 'none'.
+        """
+        f.flush()
+        if self.durability != "none":
+            os.fsync(f.fileno())
+
+    def _commit(self, data: Dict[str, Any], version: int) -> None:
+        """
+        Writes a full snapshot and drops the journal it supersedes. Caller holds _locked().
+        """
+        self._write_snapshot(data, version)
+        if os.path.exists(self.journal_file):
+            os.remove(self.journal_file)
+
+    def _read_journal(self) -> Iterable[Dict[str, Any]]:
+        """
+        Yields journal entries in the order they were written.
+        Torn lines (left by a crash during append) are skipped.
+        """
+        try:
+            with open(self.journal_file, "r") as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
         except FileNotFoundError:
-            return {"users": [], "tasks": []}
-    
+            return
+
+    @staticmethod
+    def _replay(data: Dict[str, Any], entries: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Applies journal entries on top of a snapshot.
+        Entries are keyed by task id / username, so replaying one twice is harmless.
+        """
+        tasks = {t["id"]: t for t in data.get("tasks", [])}
+        users = {u["username"]: u for u in data.get("users", [])}
+        for entry in entries:
+            op = entry["op"]
+            if op in ("insert_task", "update_task"):
+                tasks[entry["task"]["id"]] = entry["task"]
+            elif op == "delete_task":
+                tasks.pop(entry["id"], None)
+            elif op in ("insert_user", "update_user"):
+                users[entry["user"]["username"]] = entry["user"]
+        data["tasks"] = list(tasks.values())
+        data["users"] = list(users.values())
+        return data
+
+    def load_data(self) -> Dict[str, Any]:
+        """
+        Loads and returns the data from the JSON file, replaying any pending journal.
+        The returned dictionary carries the snapshot's 'version', which later saves check.
+
+        Returns:
+            Dict[str, Any]: Dictionary containing user and task data.
+        """
+        self.flush()
+        with METRICS.timer("storage_load_seconds", backend="json"):
+            if not self.journaled and not os.path.exists(self.journal_file):
+                return self._read_snapshot()  # A single atomic file; no lock needed to read it
+            with self._locked():
+                data = self._read_snapshot()
+                if os.path.exists(self.journal_file):
+                    data = self._replay(data, self._read_journal())
+                return data
+
     def save_data(self, data):
         """
         Saves the provided data dictionary to the JSON file.
+        Any journal is discarded since the snapshot now contains everything.
 
         Args:
             data (Dict[str, Any]): Dictionary containing updated task and user data.
+                If it came from load_data(), its 'version' must still match the file.
+
+        Raises:
+            StorageConflictError: If another writer saved the file after `data` was loaded.
+        """
+        self.flush()
+        with self._locked():
+            current = self._snapshot_version()
+            expected = data.get("version")
+            if expected is not None and expected != current:
+                raise StorageConflictError(
+                    f"{self.filename} changed since it was loaded (version {expected}, now {current})"
+                )
+            self._commit(data, current + 1)
+            data["version"] = current + 1
+
+    def _append(self, entries: List[Dict[str, Any]], data: Dict[str, Any]) -> None:
+        """
+        Writes entries now, or buffers them for the next group commit.
+        """
+        if self.durability != "group":
+            self._write(entries, data)
+            return
+        with self._pending_lock:
+            # Copied: the caller keeps changing its records (or rolls them back) before the flush
+            self._pending.extend(copy.deepcopy(entries))
+            if len(self._pending) >= self.group_size:
+                self._flush_pending()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.group_delay_ms / 1000, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self) -> None:
+        """
+        Writes any changes buffered for group commit, as one write with one fsync.
+        Called automatically before reads, on a timer and at interpreter exit.
+        """
+        with self._pending_lock:
+            self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        """
+        Writes the buffered entries. Caller holds _pending_lock.
+        """
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._pending:
+            return
+        entries, self._pending = self._pending, []
+        try:
+            # Applied to the file as it is now, never from the caller's live dataset
+            self._write(entries, None)
+        except BaseException:
+            # Keep the changes buffered so the next flush (read, write, timer or exit) retries them
+            self._pending[:0] = entries
+            raise
+
+    def _write(self, entries: List[Dict[str, Any]], data: Optional[Dict[str, Any]]) -> None:
+        """
+        Appends entries to the journal in a single write. When not journaled, the snapshot
+        is rewritten instead: from `data` if nobody else has written since it was loaded,
+        otherwise (or when `data` is None) by applying the entries to the current file,
+        so concurrent updates merge.
+        """
+        if not self.journaled:
+            if data is not None and data.get("version") is not None and not os.path.exists(self.journal_file):
+                try:
+                    self.save_data(data)
+                    return
+                except StorageConflictError:
+                    pass
+            with self._locked():
+                # Our copy is stale: merge into what is on disk (data["version"] stays stale)
+                merged = self._replay(self._read_snapshot(), itertools.chain(self._read_journal(), entries))
+                self._commit(merged, merged["version"] + 1)
+            return
+        with self._locked():
+            size = self._append_journal(entries)
+        if size >= self.compact_threshold:
+            self._start_compaction()
+
+    def _append_journal(self, entries: List[Dict[str, Any]]) -> int:
+        """
+        Appends entries to the journal in a single write. Caller holds _locked().
+
+        Returns:
+            int: The journal's size in bytes afterwards.
+        """
+        payload = b"".join(json.dumps(entry).encode() + b"\n" for entry in entries)
+        with METRICS.timer("storage_save_seconds", backend="json"):
+            with open(self.journal_file, "a+b") as f:
+                # Terminate a torn line left by a crash so this entry starts cleanly
+                if f.seek(0, os.SEEK_END):
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        f.write(b"\n")
+                f.write(payload)
+                self._sync(f)
+        METRICS.inc("storage_bytes_written_total", len(payload), backend="json")
+        return os.path.getsize(self.journal_file)
+
+    def insert_task(self, data: Dict[str, Any], task: Dict[str, Any]) -> None:
+        """Journals a newly created task."""
+        self._append([{"op": "insert_task", "task": task}], data)
+
+    def update_task(self, data: Dict[str, Any], task: Dict[str, Any]) -> None:
+        """Journals changes to an existing task."""
+        self._append([{"op": "update_task", "task": task}], data)
+
+    def delete_task(self, data: Dict[str, Any], task_id: str) -> None:
+        """Journals the removal of a task."""
+        self._append([{"op": "delete_task", "id": task_id}], data)
+
+    def insert_user(self, data: Dict[str, Any], user: Dict[str, Any]) -> None:
+        """Journals a newly registered user."""
+        self._append([{"op": "insert_user", "user": user}], data)
+
+    def update_user(self, data: Dict[str, Any], user: Dict[str, Any]) -> None:
+        """Journals changes to an existing user."""
+        self._append([{"op": "update_user", "user": user}], data)
+
+    def apply_batch(self, data: Dict[str, Any], operations: List[Tuple[str, Any]]) -> None:
+        """
+        Journals a batch of changes with one append, or saves the snapshot once when not journaled.
+        """
+        self._append([{"op": op, _ENTRY_KEYS[op]: record} for op, record in operations], data)
+
+    def compact(self) -> None:
+        """
+        Folds the journal into the snapshot and truncates the journal.
+        The new snapshot is built from disk, so it is safe to run alongside appends.
+        """
+        with self._locked():
+            if not os.path.exists(self.journal_file):
+                return
+            data = self._replay(self._read_snapshot(), self._read_journal())
+            self._commit(data, data["version"] + 1)
+
+    def _start_compaction(self) -> None:
+        """
+        Runs compact() in a background thread unless one is already in progress.
+        The thread is non-daemon, so the interpreter waits for it before exiting.
+        """
+        if self._compaction_thread and self._compaction_thread.is_alive():
+            return
+        self._compaction_thread = threading.Thread(target=self.compact, name="json-journal-compaction")
+        self._compaction_thread.start()
+
+    def wait_for_compaction(self) -> None:
+        """
+        Blocks until a running background compaction (if any) has finished.
+        """
+        if self._compaction_thread:
+            self._compaction_thread.join()
+
+    def _journal_overrides(self):
+        """
+        Collapses the journal into the latest task and user records it mentions.
+
+        Returns:
+            Tuple[Dict, Dict]: Task id → record (None if deleted), and username → record.
+        """
+        tasks: Dict[str, Optional[Dict[str, Any]]] = {}
+        users: Dict[str, Dict[str, Any]] = {}
+        for entry in self._read_journal():
+            op = entry["op"]
+            if op in ("insert_task", "update_task"):
+                tasks[entry["task"]["id"]] = entry["task"]
+            elif op == "delete_task":
+                tasks[entry["id"]] = None
+            elif op in ("insert_user", "update_user"):
+                users[entry["user"]["username"]] = entry["user"]
+        return tasks, users
+
+    def _open_view(self, lock: bool = True):
+        """
+        Opens the snapshot and collapses the journal as one consistent view.
+        The open handle keeps reading the same snapshot even if a writer replaces the file later.
+
+        Args:
+            lock (bool): Take the file lock while opening; pass False if the caller holds it.
+
+        Returns:
+            Tuple: (open snapshot file or None, task overrides, user overrides).
+        """
+        if lock:
+            self.flush()
+        if lock and (self.journaled or os.path.exists(self.journal_file)):
+            with self._locked():
+                return self._open_view(lock=False)
+        try:
+            f = open(self.filename, "r")
+        except FileNotFoundError:
+            f = None
+        task_overrides, user_overrides = self._journal_overrides()
+        return f, task_overrides, user_overrides
+
+    @staticmethod
+    def _merged_tasks(f: Optional[TextIO], overrides: Dict[str, Optional[Dict[str, Any]]],
+                      user: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Streams tasks from an open snapshot with journal overrides applied, then closes it.
+        """
+        if f is not None:
+            with f:
+                for task in iter_json_array(f, "tasks"):
+                    if task["id"] in overrides:
+                        task = overrides.pop(task["id"])
+                        if task is None:
+                            continue
+                    if user is None or task.get("user") == user:
+                        yield task
+        for task in overrides.values():
+            if task is not None and (user is None or task.get("user") == user):
+                yield task
+
+    @staticmethod
+    def _merged_users(f: Optional[TextIO], overrides: Dict[str, Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Streams users from an open snapshot with journal overrides applied, then closes it.
+        """
+        if f is not None:
+            with f:
+                for user in iter_json_array(f, "users"):
+                    yield overrides.pop(user["username"], user)
+        yield from overrides.values()
+
+    def iter_tasks(self, user: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Streams tasks from the snapshot (with any journal applied), optionally filtered by user.
+
+        Args:
+            user (Optional[str]): Username to filter by; None yields every task.
+        """
+        f, overrides, _ = self._open_view()
+        yield from self._merged_tasks(f, overrides, user)
+
+    def iter_users(self) -> Iterator[Dict[str, Any]]:
+        """
+        Streams users from the snapshot (with any journal applied).
+        """
+        f, _, overrides = self._open_view()
+        yield from self._merged_users(f, overrides)
+
+    def save_users(self, users: List[Dict[str, Any]]) -> None:
+        """
+        Persists several updated user records without loading every task.
+        Journaled mode appends them; otherwise the snapshot is rewritten by streaming
+        tasks from the old file into a new one while holding the file lock.
+
+        Args:
+            users (List[Dict[str, Any]]): Updated user records, matched by username.
+        """
+        if self.journaled:
+            self._append([{"op": "update_user", "user": user} for user in users], {})
+            return
+        updates = {u["username"]: u for u in users}
+        self._rewrite_users(lambda user: updates.get(user["username"], user))
+
+    def update_user_fields(self, changes: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Sets individual fields on several users. The fields are applied, under the file lock,
+        to the records as they are on disk at that moment, so a change another process made
+        to a different field of the same user since we read it is kept.
+
+        Args:
+            changes (Dict[str, Dict[str, Any]]): Username → fields to set; unknown users are ignored.
+        """
+        def patch(user: Dict[str, Any]) -> Dict[str, Any]:
+            return {**user, **changes[user["username"]]} if user["username"] in changes else user
+
+        if not self.journaled:
+            self._rewrite_users(patch)
+            return
+        self.flush()
+        with self._locked():
+            f, _, user_overrides = self._open_view(lock=False)
+            entries = [{"op": "update_user", "user": patch(user)}
+                       for user in self._merged_users(f, user_overrides) if user["username"] in changes]
+            size = self._append_journal(entries) if entries else 0
+        if size >= self.compact_threshold:
+            self._start_compaction()
+
+    def _rewrite_users(self, patch: Callable[[Dict[str, Any]], Dict[str, Any]]) -> None:
+        """
+        Rewrites the snapshot with every user passed through `patch`, streaming the tasks
+        from the old file into the new one, all while holding the file lock.
+
+        Args:
+            patch (Callable): Maps a user record on disk to the one to write.
+        """
+        self.flush()
+        with self._locked():
+            version = self._snapshot_version() + 1
+            f, task_overrides, user_overrides = self._open_view(lock=False)
+            if task_overrides or user_overrides:
+                # Journaled user records may carry a stale next_due_date; derive it from the tasks
+                due = pending_due_dates(self._merged_tasks(f, dict(task_overrides)))
+                f, _, _ = self._open_view(lock=False)
+                merged_users = [{**patch(u), "next_due_date": due.get(u["username"])}
+                                for u in self._merged_users(f, user_overrides)]
+            else:
+                # The snapshot's dates were derived from its tasks when it was written
+                merged_users = [self._keep_schedule(u, patch(u)) for u in self._merged_users(f, user_overrides)]
+            f, task_overrides, _ = self._open_view(lock=False)
+            tmp_name = f"{self.filename}.{os.getpid()}.tmp"
+            with METRICS.timer("storage_save_seconds", backend="json"), open(tmp_name, "w") as out:
+                # Mirrors json.dump(data, f, indent=4) one record at a time
+                out.write(f'{{\n    "version": {version},\n    "schedule": ')
+                out.write(textwrap.indent(json.dumps(self._schedule(merged_users), indent=4), " " * 4).lstrip())
+                out.write(',\n    "users": ')
+                out.write(textwrap.indent(json.dumps(merged_users, indent=4), " " * 4).lstrip())
+                out.write(',\n    "tasks": [')
+                for i, task in enumerate(self._merged_tasks(f, task_overrides)):
+                    out.write(("," if i else "") + "\n" + textwrap.indent(json.dumps(task, indent=4), " " * 8))
+                out.write("\n    ]\n}")
+                self._sync(out)
+                METRICS.inc("storage_bytes_written_total", out.tell(), backend="json")
+            os.replace(tmp_name, self.filename)
+            if os.path.exists(self.journal_file):
+                os.remove(self.journal_file)
+
+    @staticmethod
+    def _keep_schedule(stored: Dict[str, Any], user: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Returns `user` with the stored record's next_due_date, which a caller's copy may have outdated.
+        """
+        if user is stored or "next_due_date" not in stored:
+            return user
+        return {**user, "next_due_date": stored["next_due_date"]}
+
+    def due_users(self, today: date) -> List[Dict[str, Any]]:
+        """
+        Returns the users whose earliest pending due date is on or before today.
+        Reads the snapshot's schedule only up to today, then just the users it names;
+        snapshots without a schedule fall back to checking every user.
+
+        Args:
+            today (date): Reference date for "due or overdue".
         """
-        with open(self.filename, "w") as f:
-            json.dump(data, f, indent=4)
\ No newline at end of file
+        cutoff = today.isoformat()
+        f, task_overrides, overrides = self._open_view()
+        if f is None or not _SCHEDULE_PREFIX.match(f.read(256)):
+            if f is not None:
+                f.close()
+            return super().due_users(today)
+        f.seek(0)
+        due = set()
+        for when, username in iter_json_array(f, "schedule"):
+            if when > cutoff:
+                break  # Sorted, so nobody further on is due
+            due.add(username)
+        # Journaled user records may carry a stale next_due_date, so only journaled tasks can add
+        # users (and none are removed: a user with nothing due after all just gets no digest)
+        journaled_tasks = (task for task in task_overrides.values() if task is not None)
+        due.update(username for username, when in pending_due_dates(journaled_tasks).items() if when <= cutoff)
+        due.update(username for username, user in overrides.items() if schedule_key(user) == "")
+        users: List[Dict[str, Any]] = []
+        if due:
+            f.seek(0)
+            for user in self._merged_users(f, overrides):
+                if user["username"] in due:
+                    users.append(user)
+                    if len(users) == len(due):
+                        break
+        f.close()
+        return users
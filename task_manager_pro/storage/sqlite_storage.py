@@ -0,0 +1,302 @@
+"""
+storage/sqlite_storage.py
+
+Implements the SQLiteStorage class, a concrete storage backend for Task Manager PRO.
+Persists tasks and users in indexed SQLite tables (default: tasks.db).
+Unlike JSONStorage, per-record operations only write the affected rows, so the cost
+of a single change does not grow with the size of the dataset.
+Users are indexed by their earliest pending due date, so due_users() reads only the
+users who have something due. That date is recomputed from the tasks table in the same
+transaction as every task or user write, so a user record saved from a stale copy
+cannot hide a due task.
+"""
+
+import json
+import sqlite3
+from contextlib import contextmanager
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from task_manager_pro.services.task_index import pending_due_dates
+from task_manager_pro.storage.interface import StorageInterface, schedule_key
+from task_manager_pro.utils.metrics import METRICS
+
+# Each record is kept losslessly as a JSON document; the columns next to it are
+# copies of the fields we need to look up or filter on, so they can be indexed.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    username      TEXT PRIMARY KEY,
+    next_due_date TEXT DEFAULT '',
+    record        TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    id        TEXT PRIMARY KEY,
+    user      TEXT,
+    due_date  TEXT,
+    completed INTEGER NOT NULL DEFAULT 0,
+    record    TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_user ON tasks (user);
+CREATE INDEX IF NOT EXISTS idx_tasks_user_pending_due ON tasks (user, completed, due_date);
+"""
+
+# Created once databases from before scheduling have gained the next_due_date column
+_SCHEDULE_INDEX = "CREATE INDEX IF NOT EXISTS idx_users_next_due ON users (next_due_date)"
+
+
+class SQLiteStorage(StorageInterface):
+    def __init__(self, filename="tasks.db"):
+        """
+        Initializes the SQLiteStorage instance and creates the schema if needed.
+
+        Args:
+            filename (str): Path to the SQLite database file.
+        """
+        self.filename = filename
+        # Callers that share one storage across threads (e.g. the HTTP server) serialize access themselves
+        self._conn = sqlite3.connect(self.filename, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._migrate()
+        self._conn.execute(_SCHEDULE_INDEX)
+        self._conn.commit()
+
+    def _migrate(self) -> None:
+        """
+        Adds the next_due_date column to databases created before it existed, filled from the records.
+        """
+        columns = {name for (_, name, *_) in self._conn.execute("PRAGMA table_info(users)")}
+        if "next_due_date" in columns:
+            return
+        self._conn.execute("ALTER TABLE users ADD COLUMN next_due_date TEXT DEFAULT ''")
+        rows = self._conn.execute("SELECT username, record FROM users").fetchall()
+        self._conn.executemany(
+            "UPDATE users SET next_due_date = ? WHERE username = ?",
+            [(schedule_key(json.loads(record)), username) for username, record in rows],
+        )
+
+    def close(self) -> None:
+        """
+        Closes the underlying database connection.
+        """
+        self._conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        """
+        Runs a block in one transaction (committed on success), timed as a storage save.
+        The write lock is taken up front, so rows read inside the block stay current until it commits.
+        """
+        with METRICS.timer("storage_save_seconds", backend="sqlite"), self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            yield
+
+    @staticmethod
+    def _task_row(task: Dict[str, Any]) -> tuple:
+        """
+        Converts a task dictionary into a row tuple for the tasks table.
+        """
+        return (
+            task["id"],
+            task.get("user"),
+            task.get("due_date"),
+            int(bool(task.get("completed", False))),
+            json.dumps(task),
+        )
+
+    @staticmethod
+    def _user_row(user: Dict[str, Any], next_due_date: Optional[str]) -> tuple:
+        """
+        Converts a user dictionary into a row tuple for the users table.
+        The next_due_date column (NULL when nothing is pending) comes from the tasks, not the record.
+        """
+        return (user["username"], next_due_date, json.dumps(user))
+
+    def _next_due_date(self, username: str) -> Optional[str]:
+        """
+        Computes a user's earliest pending due date from the tasks table.
+        """
+        cursor = self._conn.execute("SELECT due_date FROM tasks WHERE user = ? AND completed = 0", (username,))
+        return pending_due_dates({"user": username, "due_date": due_date} for (due_date,) in cursor).get(username)
+
+    def _reschedule(self, username: Optional[str]) -> None:
+        """
+        Refreshes a user's next_due_date after one of their tasks changed.
+        """
+        self._conn.execute(
+            "UPDATE users SET next_due_date = ? WHERE username = ?", (self._next_due_date(username), username)
+        )
+
+    def _task_owner(self, task_id: str) -> Optional[str]:
+        row = self._conn.execute("SELECT user FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        return row[0] if row else None
+
+    def load_data(self) -> Dict[str, Any]:
+        """
+        Loads all users and tasks in insertion order.
+
+        Returns:
+            Dict[str, Any]: Dictionary containing user and task data.
+        """
+        with METRICS.timer("storage_load_seconds", backend="sqlite"):
+            users: List[Dict[str, Any]] = [
+                json.loads(record) for (record,) in self._conn.execute("SELECT record FROM users ORDER BY rowid")
+            ]
+            tasks: List[Dict[str, Any]] = [
+                json.loads(record) for (record,) in self._conn.execute("SELECT record FROM tasks ORDER BY rowid")
+            ]
+        return {"users": users, "tasks": tasks}
+
+    def save_data(self, data: Dict[str, Any]) -> None:
+        """
+        Replaces the full contents of the database with the provided data.
+
+        Args:
+            data (Dict[str, Any]): Dictionary containing task and user data.
+        """
+        due = pending_due_dates(data.get("tasks", []))
+        with self._transaction():
+            self._conn.execute("DELETE FROM users")
+            self._conn.execute("DELETE FROM tasks")
+            self._conn.executemany(
+                "INSERT INTO users (username, next_due_date, record) VALUES (?, ?, ?)",
+                [self._user_row(u, due.get(u["username"])) for u in data.get("users", [])],
+            )
+            self._conn.executemany(
+                "INSERT INTO tasks (id, user, due_date, completed, record) VALUES (?, ?, ?, ?, ?)",
+                [self._task_row(t) for t in data.get("tasks", [])],
+            )
+
+    def _insert_task(self, task: Dict[str, Any]) -> None:
+        self._conn.execute(
+            "INSERT INTO tasks (id, user, due_date, completed, record) VALUES (?, ?, ?, ?, ?)",
+            self._task_row(task),
+        )
+        self._reschedule(task.get("user"))
+
+    def _update_task(self, task: Dict[str, Any]) -> None:
+        task_id, user, due_date, completed, record = self._task_row(task)
+        previous_owner = self._task_owner(task_id)
+        self._conn.execute(
+            "UPDATE tasks SET user = ?, due_date = ?, completed = ?, record = ? WHERE id = ?",
+            (user, due_date, completed, record, task_id),
+        )
+        self._reschedule(user)
+        if previous_owner != user:
+            self._reschedule(previous_owner)
+
+    def _delete_task(self, task_id: str) -> None:
+        owner = self._task_owner(task_id)
+        self._conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+        self._reschedule(owner)
+
+    def _insert_user(self, user: Dict[str, Any]) -> None:
+        self._conn.execute(
+            "INSERT INTO users (username, next_due_date, record) VALUES (?, ?, ?)",
+            self._user_row(user, self._next_due_date(user["username"])),
+        )
+
+    def _update_user(self, user: Dict[str, Any]) -> None:
+        username, next_due_date, record = self._user_row(user, self._next_due_date(user["username"]))
+        self._conn.execute(
+            "UPDATE users SET next_due_date = ?, record = ? WHERE username = ?", (next_due_date, record, username)
+        )
+
+    def insert_task(self, data: Dict[str, Any], task: Dict[str, Any]) -> None:
+        """
+        Inserts a single task row.
+        """
+        with self._transaction():
+            self._insert_task(task)
+
+    def update_task(self, data: Dict[str, Any], task: Dict[str, Any]) -> None:
+        """
+        Updates a single task row in place.
+        """
+        with self._transaction():
+            self._update_task(task)
+
+    def delete_task(self, data: Dict[str, Any], task_id: str) -> None:
+        """
+        Deletes a single task row.
+        """
+        with self._transaction():
+            self._delete_task(task_id)
+
+    def insert_user(self, data: Dict[str, Any], user: Dict[str, Any]) -> None:
+        """
+        Inserts a single user row.
+        """
+        with self._transaction():
+            self._insert_user(user)
+
+    def update_user(self, data: Dict[str, Any], user: Dict[str, Any]) -> None:
+        """
+        Updates a single user row in place.
+        """
+        with self._transaction():
+            self._update_user(user)
+
+    def apply_batch(self, data: Dict[str, Any], operations: List[Tuple[str, Any]]) -> None:
+        """
+        Applies a batch of row changes in one transaction (a single commit).
+        """
+        with self._transaction():
+            for operation, record in operations:
+                getattr(self, f"_{operation}")(record)
+
+    def save_users(self, users: List[Dict[str, Any]]) -> None:
+        """
+        Updates several user rows in one transaction.
+        """
+        with self._transaction():
+            for user in users:
+                self._update_user(user)
+
+    def update_user_fields(self, changes: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Sets individual fields on several user rows, reading and rewriting each record
+        inside one write-locked transaction so concurrent changes to other fields are kept.
+        """
+        with self._transaction():
+            for username, fields in changes.items():
+                row = self._conn.execute("SELECT record FROM users WHERE username = ?", (username,)).fetchone()
+                if row is not None:
+                    self._update_user({**json.loads(row[0]), **fields})
+
+    def iter_tasks(self, user: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Streams task rows from a cursor, using the user index when filtering.
+        """
+        if user is None:
+            cursor = self._conn.execute("SELECT record FROM tasks ORDER BY rowid")
+        else:
+            cursor = self._conn.execute("SELECT record FROM tasks WHERE user = ? ORDER BY rowid", (user,))
+        for (record,) in cursor:
+            yield json.loads(record)
+
+    def iter_users(self) -> Iterator[Dict[str, Any]]:
+        """
+        Streams user rows from a cursor.
+        """
+        for (record,) in self._conn.execute("SELECT record FROM users ORDER BY rowid"):
+            yield json.loads(record)
+
+    def due_users(self, today: date) -> List[Dict[str, Any]]:
+        """
+        Reads the users due on or before today through the next_due_date index.
+        NULL (nothing pending) never matches; '' (not yet scheduled) always does.
+        """
+        cursor = self._conn.execute(
+            "SELECT record FROM users WHERE next_due_date <= ? ORDER BY rowid", (today.isoformat(),)
+        )
+        return [json.loads(record) for (record,) in cursor]
+
+    def iter_pending_tasks(self, usernames: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Streams each user's pending tasks through the (user, completed, due_date) index.
+        """
+        for username in usernames:
+            cursor = self._conn.execute(
+                "SELECT record FROM tasks WHERE user = ? AND completed = 0 ORDER BY rowid", (username,)
+            )
+            for (record,) in cursor:
+                yield json.loads(record)
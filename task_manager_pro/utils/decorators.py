@@ -5,13 +5,28 @@ Provides function decorators to enhance functionality of CLI actions.
 Includes logging of function calls and enforcement of login requirements.
 """
 
+import time
 from functools import wraps
-from datetime import datetime
+from task_manager_pro.utils import log_sink, metrics
+
+
+def _emit(line: str, quiet: bool, sink) -> None:
+    """
+    Prints a log line unless quiet, and queues it to the action log sink if there is one.
+    """
+    if not quiet:
+        print(line)
+    if sink:
+        sink.write(line + "\n")
 
 
 def log_action(func):
     """
-    Logs every decorated function call with a timestamp and function name.
+    Logs every decorated function call with timestamps, its name and duration,
+    and records the duration and outcome in metrics.METRICS.
+    Console lines are dropped in quiet mode, and the call runs under cProfile when
+    profiling is enabled (see utils/metrics.py). The lines are also queued to the
+    action log's LogSink when one is set (see utils/log_sink.py).
 
     Args:
         func (Callable): The function being decorated.
@@ -19,13 +34,30 @@ def log_action(func):
     Returns:
         Callable: Wrapped function with logging functionality.
     """
+    operation = func.__name__
+    func_name = operation.replace("_", " ").title()
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        func_name = func.__name__.replace("_", " ").title()
-        print(f"[{timestamp}] ▶ Executing: {func_name}")
-        result = func(*args, **kwargs)
-        print(f"[{timestamp}] ✔ Completed: {func_name}")
+        quiet = metrics.QUIET
+        sink = log_sink.action_sink()
+        if not quiet or sink:
+            _emit(f"[{log_sink.timestamp()}] ▶ Executing: {func_name}", quiet, sink)
+        status = "error"
+        start = time.perf_counter()
+        try:
+            if metrics.profiler is not None:
+                result = metrics.profile_call(func, *args, **kwargs)
+            else:
+                result = func(*args, **kwargs)
+            status = "ok"
+        finally:
+            elapsed = time.perf_counter() - start
+            metrics.METRICS.observe("operation_duration_seconds", elapsed, operation=operation)
+            metrics.METRICS.inc("operations_total", operation=operation, status=status)
+        if not quiet or sink:
+            _emit(f"[{log_sink.timestamp()}] ✔ Completed: {func_name} "
+                  f"({elapsed * 1000:.1f} ms)", quiet, sink)
         return result
     return wrapper
 
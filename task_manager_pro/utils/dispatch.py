@@ -0,0 +1,161 @@
+"""
+utils/dispatch.py
+
+Provides concurrent email dispatch for reminder fan-out.
+ConcurrentDispatcher sends messages from a bounded thread pool (one pooled EmailSession
+per worker), throttles them with a shared token-bucket RateLimiter to stay inside
+provider quotas, and retries transient SMTP failures with exponential backoff.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+from task_manager_pro.utils.emailer import EmailSession
+
+
+class RateLimiter:
+    def __init__(self, rate: float, burst: int = 1,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Initializes a thread-safe token bucket.
+
+        Args:
+            rate (float): Tokens added per second (i.e., allowed sends per second).
+            burst (int): Maximum tokens that can accumulate while idle.
+            clock (Callable): Monotonic time source (injectable for tests).
+            sleep (Callable): Sleep function (injectable for tests).
+        """
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(burst)
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Blocks until a token is available, then consumes it.
+        Tokens are reserved under the lock, so concurrent callers queue up fairly.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            self._sleep(wait)
+
+
+def is_transient(error: BaseException) -> bool:
+    """
+    Decides whether a failed send is worth retrying.
+    4xx replies and connection problems are transient; 5xx replies are permanent.
+    """
+    import smtplib  # Deferred: only needed once a send has failed
+
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(code < 500 for code, _ in error.recipients.values())
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code < 500
+    return isinstance(error, (smtplib.SMTPException, OSError))
+
+
+class ConcurrentDispatcher:
+    def __init__(self, send: Optional[Callable[..., Any]] = None,
+                 session_factory: Callable[[], EmailSession] = EmailSession,
+                 concurrency: int = 4, rate_limit: Optional[float] = None,
+                 max_retries: int = 3, backoff_base: float = 0.5, backoff_max: float = 30.0,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Initializes the dispatcher.
+
+        Args:
+            send (Optional[Callable]): Thread-safe send(to_email=..., subject=..., body=...).
+                When omitted, each worker thread sends through its own EmailSession.
+            session_factory (Callable): Creates the per-worker EmailSession.
+            concurrency (int): Maximum number of messages in flight.
+            rate_limit (Optional[float]): Maximum send attempts per second across all workers.
+            max_retries (int): Retries per message for transient failures.
+            backoff_base (float): First retry delay in seconds; doubles on each retry.
+            backoff_max (float): Upper bound for a single retry delay.
+            sleep (Callable): Sleep function used for backoff (injectable for tests).
+        """
+        self.send = send
+        self.session_factory = session_factory
+        self.concurrency = max(1, concurrency)
+        self.rate_limiter = RateLimiter(rate_limit) if rate_limit else None
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._sleep = sleep
+        self._local = threading.local()
+        self._sessions: List[EmailSession] = []
+        self._sessions_lock = threading.Lock()
+        # Seconds taken by each send attempt of the last dispatch(), retries included
+        self.latencies: List[float] = []
+
+    def _sender(self) -> Callable[..., Any]:
+        """
+        Returns the send function for the current worker thread.
+        """
+        if self.send is not None:
+            return self.send
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self.session_factory()
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session.send
+
+    def _deliver(self, message: Dict[str, str]) -> Optional[BaseException]:
+        """
+        Sends one message, retrying transient failures with exponential backoff.
+
+        Returns:
+            Optional[BaseException]: None on success, otherwise the last error.
+        """
+        attempt = 0
+        while True:
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            start = time.perf_counter()
+            try:
+                self._sender()(**message)
+            except Exception as e:
+                self.latencies.append(time.perf_counter() - start)
+                if attempt >= self.max_retries or not is_transient(e):
+                    return e
+                self._sleep(min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+                attempt += 1
+                continue
+            self.latencies.append(time.perf_counter() - start)
+            return None
+
+    def dispatch(self, messages: List[Dict[str, str]]) -> List[Optional[BaseException]]:
+        """
+        Sends all messages with bounded parallelism.
+
+        Args:
+            messages (List[Dict[str, str]]): Keyword arguments for each send (to_email, subject, body).
+
+        Returns:
+            List[Optional[BaseException]]: One entry per message, in order; None means delivered.
+        """
+        self.latencies = []
+        try:
+            if self.concurrency == 1:
+                return [self._deliver(m) for m in messages]
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="reminder-dispatch") as pool:
+                return list(pool.map(self._deliver, messages))
+        finally:
+            with self._sessions_lock:
+                for session in self._sessions:
+                    session.close()
+                self._sessions.clear()
+            self._local = threading.local()
@@ -3,24 +3,205 @@ utils/emailer.py
 
 Provides functionality for sending email reminders to users about due tasks.
 Uses SMTP with STARTTLS and reads credentials from a .env file for secure configuration.
+
+EmailSession keeps one authenticated SMTP connection open across many messages,
+reconnecting transparently when the server drops it and after a configurable number
+of messages, so bulk reminder runs pay the connect/STARTTLS/login cost only once.
+
+Importing this module is cheap: smtplib, the email package and python-dotenv are only
+loaded, and .env only read, when a message is first built or a session first configured.
+The settings below stay available as module attributes (e.g. emailer.SMTP_SERVER).
 """
 
 import os
-import smtplib
-from dotenv import load_dotenv
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:
+    import smtplib
+    from email.mime.multipart import MIMEMultipart
+
+_SETTING_NAMES = frozenset((
+    "EMAIL_ADDRESS", "EMAIL_PASSWORD", "SMTP_SERVER", "SMTP_PORT", "SMTP_STARTTLS", "SMTP_MAX_MESSAGES_PER_CONNECTION",
+))
+_settings: Optional[Dict[str, Any]] = None
+
+
+def settings() -> Dict[str, Any]:
+    """
+    Loads the .env file on first use and returns the SMTP configuration.
+    """
+    global _settings
+    if _settings is None:
+        from dotenv import load_dotenv
+
+        # Load environment variables (e.g., email credentials, SMTP server details)
+        load_dotenv()
+        _settings = {
+            "EMAIL_ADDRESS": os.environ.get("EMAIL_USER"),       # Sender's email address
+            "EMAIL_PASSWORD": os.environ.get("EMAIL_PASS"),      # Sender's email password or app-specific password
+            "SMTP_SERVER": os.environ.get("SMTP_SERVER", "smtp.gmail.com"),  # Default SMTP server
+            "SMTP_PORT": int(os.environ.get("SMTP_PORT", 587)),  # Port for STARTTLS (default: 587)
+            "SMTP_STARTTLS": os.environ.get("SMTP_STARTTLS", "true").lower() != "false",  # Off only for local relays
+            "SMTP_MAX_MESSAGES_PER_CONNECTION": int(os.environ.get("SMTP_MAX_MESSAGES_PER_CONNECTION", 100)),
+        }
+    return _settings
+
+
+def __getattr__(name: str) -> Any:
+    """Resolves the configuration constants lazily (PEP 562)."""
+    if name in _SETTING_NAMES:
+        return settings()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# SMTP reply codes meaning "this connection is done, try a new one"
+_RECONNECT_CODES = {421}
+
+
+def build_message(to_email: str, subject: str, body: str, from_email: Optional[str] = None) -> "MIMEMultipart":
+    """
+    Constructs a plain-text email message.
+
+    Args:
+        to_email (str): Recipient's email address.
+        subject (str): Subject line of the email.
+        body (str): Main body content of the email.
+        from_email (Optional[str]): Sender address. Defaults to EMAIL_USER.
+
+    Returns:
+        MIMEMultipart: The message, ready for SMTP.send_message().
+    """
+    from email.mime.multipart import MIMEMultipart
+    from email.mime.text import MIMEText
+
+    msg = MIMEMultipart()
+    msg["From"] = from_email or settings()["EMAIL_ADDRESS"]
+    msg["To"] = to_email
+    msg["Subject"] = subject
+    msg.attach(MIMEText(body, "plain"))
+    return msg
+
+
+class EmailSession:
+    def __init__(self, host: Optional[str] = None, port: Optional[int] = None,
+                 username: Optional[str] = None, password: Optional[str] = None,
+                 use_tls: Optional[bool] = None, max_messages_per_connection: Optional[int] = None,
+                 timeout: float = 30.0):
+        """
+        Initializes a reusable SMTP session. Arguments default to the .env configuration.
+
+        Args:
+            host (Optional[str]): SMTP server host.
+            port (Optional[int]): SMTP server port.
+            username (Optional[str]): Login user; no login is attempted when empty.
+            password (Optional[str]): Login password or app password.
+            use_tls (Optional[bool]): Whether to upgrade the connection with STARTTLS.
+            max_messages_per_connection (Optional[int]): Reconnect after this many messages.
+            timeout (float): Socket timeout in seconds.
+        """
+        config = settings()
+        self.host = host or config["SMTP_SERVER"]
+        self.port = port or config["SMTP_PORT"]
+        self.username = username if username is not None else config["EMAIL_ADDRESS"]
+        self.password = password if password is not None else config["EMAIL_PASSWORD"]
+        self.use_tls = config["SMTP_STARTTLS"] if use_tls is None else use_tls
+        self.max_messages_per_connection = max_messages_per_connection or config["SMTP_MAX_MESSAGES_PER_CONNECTION"]
+        self.timeout = timeout
+        self.connections_opened = 0
+        self.messages_sent = 0
+        self._smtp: Optional["smtplib.SMTP"] = None
+        self._sent_on_connection = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def _connect(self) -> "smtplib.SMTP":
+        """
+        Opens, secures and authenticates a new SMTP connection.
+        """
+        import smtplib
+
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.use_tls:
+                smtp.starttls()  # Secure the connection
+            if self.username and self.password:
+                smtp.login(self.username, self.password)  # Login using credentials
+        except Exception:
+            smtp.close()
+            raise
+        self.connections_opened += 1
+        self._sent_on_connection = 0
+        return smtp
+
+    def _drop(self) -> None:
+        """
+        Discards the current connection without raising.
+        """
+        if self._smtp is not None:
+            try:
+                self._smtp.close()
+            except OSError:
+                pass
+        self._smtp = None
+
+    def send(self, to_email: str, subject: str, body: str) -> None:
+        """
+        Sends one email over the pooled connection.
+        If the server has dropped the connection, reconnects once and retries.
+
+        Args:
+            to_email (str): Recipient's email address.
+            subject (str): Subject line of the email.
+            body (str): Main body content of the email.
+
+        Raises:
+            smtplib.SMTPException | OSError: If the message could not be delivered.
+        """
+        import smtplib
+
+        msg = build_message(to_email, subject, body, from_email=self.username)
+        for attempt in range(2):
+            if self._smtp is None or self._sent_on_connection >= self.max_messages_per_connection:
+                self.close()
+                self._smtp = self._connect()
+            try:
+                self._smtp.send_message(msg)
+            except (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError):
+                self._drop()
+                if attempt:
+                    raise
+                continue
+            except smtplib.SMTPResponseException as e:
+                if e.smtp_code not in _RECONNECT_CODES:
+                    raise
+                self._drop()
+                if attempt:
+                    raise
+                continue
+            self._sent_on_connection += 1
+            self.messages_sent += 1
+            return
 
-# Load environment variables (e.g., email credentials, SMTP server details)
-load_dotenv()
+    def close(self) -> None:
+        """
+        Politely ends the current connection, if any.
+        """
+        if self._smtp is None:
+            return
+        import smtplib
 
-EMAIL_ADDRESS = os.environ.get("EMAIL_USER")            # Sender's email address
-EMAIL_PASSWORD = os.environ.get("EMAIL_PASS")           # Sender's email password or app-specific password
-SMTP_SERVER = os.environ.get("SMTP_SERVER", "smtp.gmail.com")  # Default SMTP server
-SMTP_PORT = int(os.environ.get("SMTP_PORT", 587))       # Port for STARTTLS (default: 587)
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        self._drop()
 
 
-def send_email_reminder(to_email: str, subject: str, body: str):
+def send_email_reminder(to_email: str, subject: str, body: str, session: Optional[EmailSession] = None):
     """
     Sends an email reminder using SMTP.
 
@@ -28,23 +209,17 @@ def send_email_reminder(to_email: str, subject: str, body: str):
         to_email (str): Recipient's email address.
         subject (str): Subject line of the email.
         body (str): Main body content of the email.
+        session (Optional[EmailSession]): Reuse this session's connection instead of opening a new one.
     """
     try:
-        # Construct the email message
-        msg = MIMEMultipart()
-        msg["From"] = EMAIL_ADDRESS
-        msg["To"] = to_email
-        msg["Subject"] = subject
-        msg.attach(MIMEText(body, "plain"))
-
-        # Establish connection to the SMTP server using STARTTLS
-        with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
-            server.starttls()  # Secure the connection
-            server.login(EMAIL_ADDRESS, EMAIL_PASSWORD)  # Login using credentials
-            server.send_message(msg)  # Send the email
+        if session is not None:
+            session.send(to_email, subject, body)
+        else:
+            with EmailSession() as one_off:
+                one_off.send(to_email, subject, body)
 
         print(f"📧 Email reminder sent to {to_email}!")
 
     except Exception as e:
         # Handle and display any errors encountered
-        print(f"❌ Failed to send email: {e}")
\ No newline at end of file
+        print(f"❌ Failed to send email: {e}")
@@ -0,0 +1,147 @@
+"""
+utils/exporter.py
+
+Streams task records out of storage as JSON Lines, CSV or iCalendar (`export-tasks`).
+Every stage is a generator: records come from StorageInterface.iter_tasks(), pass through
+filter_tasks(), are rendered one line (or event) at a time and written straight to the
+output, so exporting never holds the whole dataset in memory.
+"""
+
+import csv
+import io
+import json
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, TextIO
+
+EXPORT_FORMATS = ("jsonl", "csv", "ics")
+
+CSV_FIELDS = ["id", "title", "description", "due_date", "completed", "created_at", "user"]
+
+
+def filter_tasks(tasks: Iterable[Dict[str, Any]], status: str = "all") -> Iterator[Dict[str, Any]]:
+    """
+    Yields only tasks matching a status filter ('all', 'completed' or 'pending').
+    """
+    for task in tasks:
+        if status == "completed" and not task.get("completed"):
+            continue
+        if status == "pending" and task.get("completed"):
+            continue
+        yield task
+
+
+def render_jsonl(tasks: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """
+    Renders each task as one JSON line.
+    """
+    for task in tasks:
+        yield json.dumps(task, ensure_ascii=False) + "\n"
+
+
+def render_csv(tasks: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """
+    Renders a header row followed by one CSV row per task (extra fields are dropped).
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CSV_FIELDS, extrasaction="ignore", lineterminator="\n")
+    writer.writeheader()
+    for task in tasks:
+        writer.writerow(task)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _ics_escape(text: str) -> str:
+    return (str(text).replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+            .replace("\r\n", "\\n").replace("\n", "\\n"))
+
+
+def _ics_fold(line: str) -> str:
+    """
+    Folds a content line to at most 75 octets per physical line (RFC 5545, section 3.1).
+    """
+    if len(line.encode()) <= 75:
+        return line + "\r\n"
+    parts, current, size = [], "", 0
+    for char in line:
+        width = len(char.encode())
+        if size + width > (75 if not parts else 74):  # Continuation lines start with a space
+            parts.append(current)
+            current, size = "", 0
+        current += char
+        size += width
+    parts.append(current)
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _ics_due_date(task: Dict[str, Any]) -> Optional[date]:
+    """
+    Returns the date of a task's all-day event, or None if its due date is malformed or not a string.
+    """
+    try:
+        return date.fromisoformat(task.get("due_date") or "")
+    except (TypeError, ValueError):
+        return None
+
+
+def render_ics(tasks: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """
+    Renders an iCalendar file with one all-day event per task on its due date.
+    Tasks without a valid due date are skipped.
+    """
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    yield "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Task Manager PRO//Tasks//EN\r\nCALSCALE:GREGORIAN\r\n"
+    for task in tasks:
+        due = _ics_due_date(task)
+        if due is None:
+            continue
+        lines = [
+            "BEGIN:VEVENT",
+            f"UID:{task['id']}@task-manager-pro",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART;VALUE=DATE:{due.strftime('%Y%m%d')}",
+            f"DTEND;VALUE=DATE:{(due + timedelta(days=1)).strftime('%Y%m%d')}",
+            f"SUMMARY:{_ics_escape(task.get('title', ''))}",
+        ]
+        if task.get("description"):
+            lines.append(f"DESCRIPTION:{_ics_escape(task['description'])}")
+        lines.append(f"CATEGORIES:{'Completed' if task.get('completed') else 'Pending'}")
+        lines.append("END:VEVENT")
+        yield "".join(_ics_fold(line) for line in lines)
+    yield "END:VCALENDAR\r\n"
+
+
+RENDERERS: Dict[str, Callable[[Iterable[Dict[str, Any]]], Iterator[str]]] = {
+    "jsonl": render_jsonl,
+    "csv": render_csv,
+    "ics": render_ics,
+}
+
+
+def export_tasks(tasks: Iterable[Dict[str, Any]], out: TextIO, fmt: str) -> int:
+    """
+    Writes tasks to an open text stream as they are rendered.
+
+    Args:
+        tasks (Iterable[Dict[str, Any]]): Task records, typically a storage stream.
+        out (TextIO): Destination; opened with newline="" for files so CRLF in ICS is kept.
+        fmt (str): One of EXPORT_FORMATS.
+
+    Returns:
+        int: Number of tasks written (ICS skips tasks without a valid due date).
+    """
+    if fmt == "ics":
+        tasks = (task for task in tasks if _ics_due_date(task) is not None)
+    count = 0
+
+    def counted(records):
+        nonlocal count
+        for record in records:
+            count += 1
+            yield record
+
+    for chunk in RENDERERS[fmt](counted(tasks)):
+        out.write(chunk)
+    return count
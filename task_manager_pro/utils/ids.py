@@ -0,0 +1,15 @@
+"""
+utils/ids.py
+
+Generates the random identifiers used for tasks, imported rows and outbox messages.
+"""
+
+
+def new_id() -> str:
+    """
+    Returns a new random 32-character hex identifier.
+    """
+    # Imported on first use rather than at CLI start-up; read-only commands never create an ID
+    import uuid
+
+    return uuid.uuid4().hex
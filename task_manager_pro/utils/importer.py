@@ -0,0 +1,127 @@
+"""
+utils/importer.py
+
+Reads task feeds for bulk import (`import-tasks` / TaskManager.import_tasks).
+Rows are streamed one at a time from JSON Lines or CSV files and turned into task
+records; nothing here touches storage.
+
+Each row needs a title and a due date ('due_date' or 'due', YYYY-MM-DD). Optional
+fields are description, completed and user (defaults to the importing user).
+"""
+
+import csv
+import json
+import os
+from typing import Any, Dict, Iterator, Optional, TextIO
+from task_manager_pro.models.task import normalize_due_date
+from task_manager_pro.utils.ids import new_id
+
+IMPORT_FORMATS = ("jsonl", "csv")
+
+# CSV has no booleans; these strings (case-insensitive) mean completed
+_TRUE_STRINGS = frozenset(("1", "true", "yes", "y", "done"))
+
+
+def detect_format(path: str) -> str:
+    """
+    Guesses the feed format from a file extension.
+
+    Raises:
+        ValueError: If the extension is not recognized.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if extension == ".csv":
+        return "csv"
+    raise ValueError(f"Cannot tell the format of '{path}'; pass --format jsonl or csv.")
+
+
+def read_rows(f: TextIO, fmt: str) -> Iterator[Dict[str, Any]]:
+    """
+    Streams rows from a feed.
+
+    Args:
+        f (TextIO): Open text file.
+        fmt (str): 'jsonl' or 'csv' (first line holds the column names).
+
+    Raises:
+        ValueError: If a JSON line cannot be decoded.
+    """
+    if fmt == "csv":
+        yield from csv.DictReader(f)
+        return
+    for line_number, line in enumerate(f, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Line {line_number}: invalid JSON ({e.msg})") from None
+
+
+class RowParser:
+    def __init__(self, default_user: Optional[str], created_at: str):
+        """
+        Converts feed rows into task records.
+
+        Args:
+            default_user (Optional[str]): Owner for rows without a 'user' field.
+            created_at (str): Creation timestamp stamped on every imported task.
+        """
+        self.default_user = default_user
+        self.created_at = created_at
+        # Feeds repeat a small set of due dates, so each distinct string is parsed once
+        self._due_dates: Dict[str, Optional[str]] = {}
+
+    def _normalize_date(self, value: str) -> Optional[str]:
+        """
+        Returns normalize_due_date(value), or None if the date is invalid; results are cached.
+        """
+        if value not in self._due_dates:
+            try:
+                self._due_dates[value] = normalize_due_date(value)
+            except ValueError:
+                self._due_dates[value] = None
+        return self._due_dates[value]
+
+    def parse(self, row: Any) -> Dict[str, Any]:
+        """
+        Validates one row and builds its task record with a fresh ID.
+
+        Raises:
+            ValueError: If the row is missing a title, has an invalid due date or owner,
+                or a title, description or user that is not a string.
+        """
+        if not isinstance(row, dict):
+            raise ValueError("row is not an object")
+        title = row.get("title") or ""
+        if not isinstance(title, str):
+            raise ValueError("title is not a string")
+        title = title.strip()
+        if not title:
+            raise ValueError("missing title")
+        due = row.get("due_date") or row.get("due") or ""
+        due_date = self._normalize_date(due.strip()) if isinstance(due, str) else None
+        if due_date is None:
+            raise ValueError(f"invalid due date '{due}'")
+        user = row.get("user") or self.default_user
+        if not user:
+            raise ValueError("no user given and nobody is logged in")
+        if not isinstance(user, str):
+            raise ValueError("user is not a string")
+        description = row.get("description") or ""
+        if not isinstance(description, str):
+            raise ValueError("description is not a string")
+        completed = row.get("completed", False)
+        if isinstance(completed, str):
+            completed = completed.strip().lower() in _TRUE_STRINGS
+        return {
+            "id": new_id(),
+            "title": title,
+            "description": description,
+            "due_date": due_date,
+            "completed": bool(completed),
+            "created_at": self.created_at,
+            "user": user,
+        }
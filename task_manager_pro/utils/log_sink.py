@@ -0,0 +1,236 @@
+"""
+utils/log_sink.py
+
+Provides LogSink, a shared, queue-based writer for log files.
+Callers only put lines on a queue; one background thread per file keeps a single
+long-lived handle open, writes whatever has queued up in one go, rotates the file
+when it grows past max_bytes (task_manager.log → task_manager.log.1 → ...), and
+flushes. Every sink is flushed and closed at interpreter exit, so no line is lost.
+The file is opened by the first write(), so an unusable path raises there. If a later
+write to the file fails (e.g. disk full), the sink is marked failed: pending flush()
+calls return False and further writes raise until the sink is closed.
+
+get_sink() returns the process-wide sink for a path; LoggerContext and log_action
+both write through it. log_action only writes to a file when an action log is set
+with set_action_log() or the TASK_MANAGER_LOG environment variable.
+"""
+
+import atexit
+import os
+import queue
+import threading
+import time
+from typing import Dict, List, Optional
+
+# Rotate once the log file reaches this size...
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+
+# ...keeping this many older files
+DEFAULT_BACKUP_COUNT = 3
+
+_STOP = object()
+
+# timestamp() cache: formatting the time dominates the cost of a log line
+_last_second = -1
+_last_timestamp = ""
+
+
+def timestamp() -> str:
+    """
+    Returns the current local time as 'YYYY-MM-DD HH:MM:SS', formatted at most once per second.
+    """
+    global _last_second, _last_timestamp
+    now = time.time()
+    second = int(now)
+    if second != _last_second:
+        _last_timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        _last_second = second
+    return _last_timestamp
+
+
+class LogSink:
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_BYTES, backup_count: int = DEFAULT_BACKUP_COUNT):
+        """
+        Initializes the sink. The file is opened and the writer thread started on first write.
+
+        Args:
+            path (str): Log file to append to.
+            max_bytes (int): Size that triggers a rotation (0 disables rotation).
+            backup_count (int): Rotated files to keep (path.1 is the newest).
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._file = None
+        self._error: Optional[Exception] = None  # Set by the writer thread when a write fails
+
+    def write(self, line: str) -> None:
+        """
+        Queues a line (including its newline) without waiting for the disk.
+
+        Raises:
+            OSError: If the log file cannot be opened, or an earlier write to it failed.
+        """
+        if self._thread is None or self._error is not None:
+            self._start()
+        self._queue.put(line)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until every line queued so far has been written and flushed.
+
+        Returns:
+            bool: False if the timeout expired first or the sink has failed.
+        """
+        if self._thread is None:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        # Checked after queuing: a failing writer sets _error before releasing queued waiters
+        if self._error is not None:
+            return False
+        return done.wait(timeout) and self._error is None
+
+    def close(self) -> None:
+        """
+        Writes the remaining lines, closes the file and stops the writer thread.
+        The sink can still be written to afterwards; the file is reopened, also after a failure.
+        """
+        with self._start_lock:
+            thread, self._thread = self._thread, None
+            if thread is None:
+                return
+            self._queue.put(_STOP)
+        thread.join()
+        if self._error is not None:
+            self._queue = queue.SimpleQueue()  # Lines the failed writer never took
+            self._error = None
+
+    def _start(self) -> None:
+        """
+        Opens the file in the calling thread, so errors reach the caller, and starts the writer.
+        """
+        with self._start_lock:
+            if self._error is not None:
+                raise OSError(f"Writing to log file '{self.path}' failed: {self._error}") from self._error
+            if self._thread is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+                self._thread = threading.Thread(target=self._run, name=f"log-sink:{self.path}", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        """
+        Writer thread: drains the queue in batches until told to stop or a write fails.
+        """
+        f = self._file
+        try:
+            while True:
+                item = self._queue.get()
+                lines: List[str] = []
+                waiters: List[threading.Event] = []
+                stop = False
+                while True:
+                    if item is _STOP:
+                        stop = True
+                    elif isinstance(item, threading.Event):
+                        waiters.append(item)
+                    else:
+                        lines.append(item)
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                try:
+                    if lines:
+                        f.write("".join(lines))
+                        if self.max_bytes and f.tell() >= self.max_bytes:
+                            f = self._rotate(f)
+                    f.flush()
+                except Exception as e:
+                    self._fail(e, waiters)
+                    return
+                for waiter in waiters:
+                    waiter.set()
+                if stop:
+                    return
+        finally:
+            try:
+                f.close()
+            except OSError:  # After a failed write, closing retries the unwritten buffer
+                pass
+
+    def _fail(self, error: Exception, waiters: List[threading.Event]) -> None:
+        """
+        Marks the sink failed and releases every flush() waiting on it; queued lines are dropped.
+        """
+        self._error = error
+        for waiter in waiters:
+            waiter.set()
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if isinstance(item, threading.Event):
+                item.set()
+
+    def _rotate(self, f):
+        """
+        Shifts path → path.1 → path.2 ..., dropping the oldest, and reopens an empty file.
+        """
+        f.close()
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                if os.path.exists(f"{self.path}.{i}"):
+                    os.replace(f"{self.path}.{i}", f"{self.path}.{i + 1}")
+            os.replace(self.path, f"{self.path}.1")
+            return open(self.path, "a", encoding="utf-8")
+        return open(self.path, "w", encoding="utf-8")
+
+
+_sinks: Dict[str, LogSink] = {}
+_sinks_lock = threading.Lock()
+
+
+def get_sink(path: str) -> LogSink:
+    """
+    Returns the shared sink for a log file, creating it on first use.
+    """
+    key = os.path.abspath(path)
+    sink = _sinks.get(key)
+    if sink is None:
+        with _sinks_lock:
+            sink = _sinks.setdefault(key, LogSink(path))
+    return sink
+
+
+def close_all() -> None:
+    """
+    Flushes and closes every sink. Registered to run at interpreter exit.
+    """
+    for sink in list(_sinks.values()):
+        sink.close()
+
+
+atexit.register(close_all)
+
+# Log file log_action writes to, if any
+_action_log: Optional[str] = os.environ.get("TASK_MANAGER_LOG") or None
+
+
+def set_action_log(path: Optional[str]) -> None:
+    """
+    Makes log_action also write its lines to `path` (None turns this off).
+    """
+    global _action_log
+    _action_log = path
+
+
+def action_sink() -> Optional[LogSink]:
+    """
+    Returns the sink log_action writes to, or None if no action log is set.
+    """
+    return get_sink(_action_log) if _action_log else None
@@ -4,10 +4,13 @@ utils/logger_context.py
 Defines a context manager for logging execution blocks with timestamps.
 Handles start, success, and error logs automatically, and writes them to a log file.
 Useful for tracking actions in long-running or critical sections of the CLI tool.
+Lines go through the shared LogSink for the file (utils/log_sink.py), so entering
+a block does not wait for the disk; a log file that cannot be opened still raises
+at __enter__.
 """
 
-import datetime
-from typing import Optional, TextIO
+from typing import Optional
+from task_manager_pro.utils.log_sink import LogSink, get_sink, timestamp
 
 class LoggerContext:
     def __init__(self, action: str = "Executing block", log_file="task_manager.log"):
@@ -20,16 +23,16 @@ class LoggerContext:
         """
         self.action = action
         self.log_file = log_file
-        self._log_handle: Optional[TextIO] = None
+        self._sink: Optional[LogSink] = None
 
     def __enter__(self):
         """
-        Enters the context block, opens the log file, and logs the start of the action.
+        Enters the context block, attaches to the log file's sink, and logs the start of the action.
 
         Returns:
             LoggerContext: Returns self for optional inline logging via .log().
         """
-        self._log_handle = open(self.log_file, "a")
+        self._sink = get_sink(self.log_file)
         self._write_log(f"🔄 Starting: {self.action}")
         print(f"🔄 [{self._timestamp()}] Starting: {self.action}")
         return self
@@ -53,8 +56,7 @@ class LoggerContext:
             self._write_log(f"✅ Finished: {self.action}")
             print(f"✅ [{self._timestamp()}] Finished: {self.action}")
         self._write_log("🟢 Session ended\n")
-        if self._log_handle:
-            self._log_handle.close()
+        self._sink = None
         return False  # Let exceptions propagate
 
     def _timestamp(self) -> str:
@@ -64,19 +66,18 @@ class LoggerContext:
         Returns:
             str: Current timestamp in 'YYYY-MM-DD HH:MM:SS' format.
         """
-        return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return timestamp()
 
     def _write_log(self, message: str):
         """
-        Writes a log message to the log file with a timestamp.
+        Queues a log message for the log file with a timestamp.
 
         Args:
             message (str): Log message to write.
         """
-        if self._log_handle is None:
-            raise RuntimeError("Log handle not initialized.")
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self._log_handle.write(f"[{timestamp}] {message}\n")
+        if self._sink is None:
+            raise RuntimeError("Log sink not initialized.")
+        self._sink.write(f"[{timestamp()}] {message}\n")
         
     def log(self, message: str):
         """
@@ -85,6 +86,6 @@ class LoggerContext:
         Args:
             message (str): Message to log.
         """
-        if self._log_handle:
+        if self._sink:
             self._write_log(f"📝 {message}")
             print(f"📝 [{self._timestamp()}] {message}")
\ No newline at end of file
@@ -0,0 +1,265 @@
+"""
+utils/metrics.py
+
+In-process instrumentation for Task Manager PRO.
+METRICS collects counters and latency histograms: log_action records one
+observation per TaskManager operation, and the storage backends record load and
+save times and bytes written. Snapshots can be exported as JSON or in the
+Prometheus text format (e.g. for node_exporter's textfile collector).
+
+Environment variables (read when this module is first imported):
+    TASK_MANAGER_METRICS   Write metrics to this path at exit (.json for JSON, otherwise Prometheus text)
+    TASK_MANAGER_PROFILE   Profile every logged operation with cProfile and dump the stats to this path at exit
+    TASK_MANAGER_QUIET     Set to 1 to drop log_action's console lines
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+# Histogram bucket upper bounds in seconds (Prometheus 'le' labels)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Prefix for every exported metric name
+NAMESPACE = "task_manager"
+
+METRIC_HELP = {
+    "operation_duration_seconds": ("histogram", "Duration of TaskManager operations."),
+    "operations_total": ("counter", "TaskManager operations by outcome."),
+    "storage_load_seconds": ("histogram", "Time spent loading data from storage."),
+    "storage_save_seconds": ("histogram", "Time spent writing data to storage."),
+    "storage_bytes_written_total": ("counter", "Bytes written to storage files."),
+}
+
+LabelSet = Tuple[Tuple[str, str], ...]
+
+
+def _format_sample(value: float) -> str:
+    """
+    Formats a sample value exactly: whole numbers without exponent or rounding, others via repr().
+    """
+    if isinstance(value, int) or value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class Histogram:
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        Counts observations per bucket, plus their total and sum.
+        """
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> Iterator[Tuple[str, int]]:
+        """
+        Yields (le, cumulative count) pairs, ending with '+Inf'.
+        """
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            yield f"{bound:g}", total
+        yield "+Inf", self.count
+
+
+class MetricsRegistry:
+    def __init__(self):
+        """
+        Holds counters and histograms keyed by metric name and labels.
+        Safe to update from several threads (e.g. the HTTP server).
+        """
+        self._lock = threading.Lock()
+        self.counters: Dict[str, Dict[LabelSet, float]] = {}
+        self.histograms: Dict[str, Dict[LabelSet, Histogram]] = {}
+
+    def inc(self, name: str, amount: float = 1, **labels: str) -> None:
+        """
+        Adds to a counter.
+        """
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self.counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """
+        Records one observation in a histogram.
+        """
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self.histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram()
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels: str):
+        """
+        Observes the wall time of a with-block in a histogram.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def counter_total(self, name: str) -> float:
+        """
+        Returns the sum of a counter across all its labels (0 if it was never incremented).
+        """
+        with self._lock:
+            return sum(self.counters.get(name, {}).values())
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns a JSON-serializable snapshot of every series.
+        """
+        with self._lock:
+            return {
+                "counters": {
+                    name: [{"labels": dict(key), "value": value} for key, value in series.items()]
+                    for name, series in self.counters.items()
+                },
+                "histograms": {
+                    name: [{"labels": dict(key), "count": h.count, "sum": h.sum,
+                            "buckets": dict(h.cumulative())} for key, h in series.items()]
+                    for name, series in self.histograms.items()
+                },
+            }
+
+    def to_prometheus(self) -> str:
+        """
+        Renders every series in the Prometheus text exposition format.
+        """
+        lines = []
+
+        def header(name: str, kind: str) -> str:
+            full = f"{NAMESPACE}_{name}"
+            lines.append(f"# HELP {full} {METRIC_HELP.get(name, (kind, name))[1]}")
+            lines.append(f"# TYPE {full} {kind}")
+            return full
+
+        def labels(key: LabelSet, *extra: Tuple[str, str]) -> str:
+            pairs = [f'{k}="{v}"' for k, v in key + extra]
+            return "{" + ",".join(pairs) + "}" if pairs else ""
+
+        with self._lock:
+            for name, series in sorted(self.counters.items()):
+                full = header(name, "counter")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{full}{labels(key)} {_format_sample(value)}")
+            for name, series in sorted(self.histograms.items()):
+                full = header(name, "histogram")
+                for key, h in sorted(series.items()):
+                    for le, count in h.cumulative():
+                        lines.append(f"{full}_bucket{labels(key, ('le', le))} {count}")
+                    lines.append(f"{full}_sum{labels(key)} {h.sum:.6f}")
+                    lines.append(f"{full}_count{labels(key)} {h.count}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str) -> None:
+        """
+        Writes a snapshot to a file: JSON if the name ends in .json, Prometheus text otherwise.
+        The file is replaced atomically, so a collector never reads a partial snapshot.
+        """
+        text = json.dumps(self.to_dict(), indent=2) if path.endswith(".json") else self.to_prometheus()
+        tmp_name = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_name, "w") as f:
+            f.write(text)
+        os.replace(tmp_name, path)
+
+
+def percentiles(values: Sequence[float], points: Iterable[int] = (50, 90, 99)) -> Dict[str, Optional[float]]:
+    """
+    Computes nearest-rank percentiles of a sample.
+
+    Returns:
+        Dict[str, Optional[float]]: e.g. {"p50": ..., "p90": ..., "p99": ...}; None values for an empty sample.
+    """
+    ordered = sorted(values)
+    result: Dict[str, Optional[float]] = {}
+    for point in points:
+        if not ordered:
+            result[f"p{point}"] = None
+            continue
+        rank = max(1, -(-point * len(ordered) // 100))  # ceil(point / 100 * n)
+        result[f"p{point}"] = ordered[rank - 1]
+    return result
+
+
+METRICS = MetricsRegistry()
+
+# When True, log_action prints nothing
+QUIET = os.environ.get("TASK_MANAGER_QUIET", "") not in ("", "0")
+
+# Active cProfile.Profile when TASK_MANAGER_PROFILE is set
+profiler = None
+_profiling = False
+
+
+def set_quiet(quiet: bool = True) -> None:
+    """
+    Turns log_action's console lines off (or back on).
+    """
+    global QUIET
+    QUIET = quiet
+
+
+def export_at_exit(path: str) -> None:
+    """
+    Writes the metrics to `path` when the interpreter exits.
+    """
+    atexit.register(METRICS.write, path)
+
+
+def enable_profiling(path: str) -> None:
+    """
+    Profiles every logged operation and dumps the combined stats to `path` at exit
+    (inspect them with `python -m pstats <path>`).
+    """
+    global profiler
+    import cProfile  # Only loaded when profiling is asked for
+
+    profiler = cProfile.Profile()
+    atexit.register(profiler.dump_stats, path)
+
+
+def profile_call(func, *args, **kwargs):
+    """
+    Runs func under the profiler. Nested logged calls run directly, since the
+    outermost call already profiles them.
+    """
+    global _profiling
+    if _profiling:
+        return func(*args, **kwargs)
+    _profiling = True
+    try:
+        return profiler.runcall(func, *args, **kwargs)
+    finally:
+        _profiling = False
+
+
+if os.environ.get("TASK_MANAGER_METRICS"):
+    export_at_exit(os.environ["TASK_MANAGER_METRICS"])
+if os.environ.get("TASK_MANAGER_PROFILE"):
+    enable_profiling(os.environ["TASK_MANAGER_PROFILE"])
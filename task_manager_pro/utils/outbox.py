@@ -0,0 +1,168 @@
+"""
+utils/outbox.py
+
+Implements a durable on-disk outbox for reminder emails.
+Interactive commands only enqueue messages (one small JSON file each, written atomically),
+so they never wait on SMTP. A separate drain step (the `drain-outbox` CLI command or a
+cron job) claims queued messages and sends them in batches through ConcurrentDispatcher.
+Messages that keep failing are moved to a dead-letter folder instead of being retried forever.
+"""
+
+import itertools
+import json
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional
+from task_manager_pro.utils.dispatch import ConcurrentDispatcher, is_transient
+from task_manager_pro.utils.ids import new_id
+
+# Default directory holding queued messages
+OUTBOX_DIR = "outbox"
+
+# Claimed messages older than this (seconds) are assumed orphaned by a crashed drain
+STALE_CLAIM_SECONDS = 600
+
+# Tie-breaker for messages queued within the same clock tick
+_sequence = itertools.count()
+
+
+class Outbox:
+    def __init__(self, directory: str = OUTBOX_DIR, max_attempts: int = 5):
+        """
+        Initializes the outbox.
+
+        Args:
+            directory (str): Folder for queued messages; created on first enqueue.
+            max_attempts (int): Drains a message may fail before it is dead-lettered.
+        """
+        self.directory = directory
+        self.failed_directory = os.path.join(directory, "failed")
+        self.max_attempts = max_attempts
+
+    def enqueue(self, to_email: str, subject: str, body: str) -> str:
+        """
+        Durably queues one email.
+
+        Args:
+            to_email (str): Recipient's email address.
+            subject (str): Subject line of the email.
+            body (str): Main body content of the email.
+
+        Returns:
+            str: The queued message's ID.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        # Time-prefixed names keep the queue in FIFO order when sorted
+        message_id = f"{time.time_ns():020d}-{next(_sequence):06d}-{new_id()}"
+        message = {"id": message_id, "to_email": to_email, "subject": subject, "body": body, "attempts": 0}
+        self._write(os.path.join(self.directory, f"{message_id}.json"), message)
+        return message_id
+
+    @staticmethod
+    def _write(path: str, message: Dict[str, Any]) -> None:
+        """
+        Writes a message file atomically via a temporary file and rename.
+        """
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(message, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def pending(self) -> List[str]:
+        """
+        Returns the file names of queued (unclaimed) messages, oldest first.
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(name for name in os.listdir(self.directory) if name.endswith(".json"))
+
+    def __len__(self) -> int:
+        return len(self.pending())
+
+    def _recover_stale_claims(self) -> None:
+        """
+        Returns messages claimed by a drain that died mid-batch to the queue.
+        """
+        now = time.time()
+        for name in os.listdir(self.directory):
+            if not name.endswith(".sending"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                if now - os.path.getmtime(path) > STALE_CLAIM_SECONDS:
+                    os.replace(path, path[: -len(".sending")])
+            except FileNotFoundError:
+                continue
+
+    def _claim(self, limit: int) -> List[Dict[str, Any]]:
+        """
+        Claims up to `limit` queued messages by renaming them, so concurrent drains
+        never send the same message twice.
+        """
+        claimed = []
+        for name in self.pending():
+            if len(claimed) >= limit:
+                break
+            path = os.path.join(self.directory, name)
+            claim_path = f"{path}.sending"
+            try:
+                os.rename(path, claim_path)
+                os.utime(claim_path)
+            except FileNotFoundError:
+                continue  # Claimed by another drain
+            with open(claim_path) as f:
+                message = json.load(f)
+            message["_path"] = claim_path
+            claimed.append(message)
+        return claimed
+
+    def drain(self, dispatcher: Optional[ConcurrentDispatcher] = None, batch_size: int = 100,
+              on_result: Optional[Callable[[Dict[str, Any], Optional[BaseException]], None]] = None) -> Dict[str, int]:
+        """
+        Sends queued messages in batches until the outbox is empty.
+
+        Args:
+            dispatcher (Optional[ConcurrentDispatcher]): Sends each batch. Defaults to a
+                sequential dispatcher over one pooled EmailSession.
+            batch_size (int): Messages claimed and sent per batch.
+            on_result (Optional[Callable]): Called with each message and its error (None if sent).
+
+        Returns:
+            Dict[str, int]: Counts of sent, retried (left queued), and dead-lettered messages.
+        """
+        stats = {"sent": 0, "retried": 0, "dead_lettered": 0}
+        if not os.path.isdir(self.directory):
+            return stats
+        dispatcher = dispatcher or ConcurrentDispatcher(concurrency=1, max_retries=0)
+        self._recover_stale_claims()
+
+        while True:
+            batch = self._claim(batch_size)
+            if not batch:
+                return stats
+            errors = dispatcher.dispatch([
+                {"to_email": m["to_email"], "subject": m["subject"], "body": m["body"]} for m in batch
+            ])
+            for message, error in zip(batch, errors):
+                path = message.pop("_path")
+                if on_result:
+                    on_result(message, error)
+                if error is None:
+                    os.remove(path)
+                    stats["sent"] += 1
+                    continue
+                message["attempts"] += 1
+                message["last_error"] = str(error)
+                if message["attempts"] >= self.max_attempts or not is_transient(error):
+                    os.makedirs(self.failed_directory, exist_ok=True)
+                    self._write(os.path.join(self.failed_directory, f"{message['id']}.json"), message)
+                    stats["dead_lettered"] += 1
+                else:
+                    self._write(os.path.join(self.directory, f"{message['id']}.json"), message)
+                    stats["retried"] += 1
+                os.remove(path)
+            if stats["retried"]:
+                # Leave retryable messages for the next drain instead of spinning on a sick server
+                return stats
@@ -0,0 +1,111 @@
+"""
+tests/smtp_stub.py
+
+A minimal in-process SMTP server for tests.
+Speaks just enough SMTP (EHLO/HELO, MAIL, RCPT, DATA, RSET, NOOP, QUIT) for smtplib,
+records every accepted message, and counts connections so tests can verify reuse.
+It can also simulate flaky servers by dropping connections, deferring or rejecting
+recipients, and answering slowly.
+"""
+
+import socketserver
+import threading
+import time
+from typing import List, Optional, Set
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    def _reply(self, line: str):
+        self.wfile.write((line + "\r\n").encode())
+
+    def handle(self):
+        server: "StubSMTPServer" = self.server.stub
+        with server.lock:
+            server.connections += 1
+        self._reply("220 stub ESMTP ready")
+        recipients: List[str] = []
+        sent_on_connection = 0
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode(errors="replace").strip()
+            verb = command[:4].upper()
+            if verb in ("EHLO", "HELO"):
+                self._reply("250 stub")
+            elif verb == "MAIL":
+                recipients = []
+                self._reply("250 OK")
+            elif verb == "RCPT":
+                address = command.split(":", 1)[1].strip().strip("<>")
+                with server.lock:
+                    defer = server.tempfail > 0 and address not in server.reject
+                    if defer:
+                        server.tempfail -= 1
+                if address in server.reject:
+                    self._reply("550 No such user")
+                elif defer:
+                    self._reply("451 Try again later")
+                else:
+                    recipients.append(address)
+                    self._reply("250 OK")
+            elif verb == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                body = []
+                while True:
+                    data_line = self.rfile.readline()
+                    if not data_line or data_line in (b".\r\n", b".\n"):
+                        break
+                    body.append(data_line)
+                if server.delay:
+                    time.sleep(server.delay)
+                with server.lock:
+                    server.messages.append({"to": recipients, "data": b"".join(body).decode(errors="replace")})
+                self._reply("250 OK queued")
+                sent_on_connection += 1
+                if server.drop_after and sent_on_connection >= server.drop_after:
+                    return  # Simulate the server hanging up
+            elif verb in ("RSET", "NOOP"):
+                self._reply("250 OK")
+            elif verb == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+
+class _ThreadingTCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class StubSMTPServer:
+    def __init__(self, drop_after: Optional[int] = None, reject: Optional[Set[str]] = None,
+                 tempfail: int = 0, delay: float = 0.0):
+        """
+        Args:
+            drop_after (Optional[int]): Close each connection after this many messages.
+            reject (Optional[Set[str]]): Recipient addresses answered with 550.
+            tempfail (int): Number of RCPT commands (server-wide) answered with 451 first.
+            delay (float): Seconds to wait before acknowledging each message.
+        """
+        self.drop_after = drop_after
+        self.reject = reject or set()
+        self.tempfail = tempfail
+        self.delay = delay
+        self.messages: List[dict] = []
+        self.connections = 0
+        self.lock = threading.Lock()
+        self._server = _ThreadingTCPServer(("127.0.0.1", 0), _SMTPHandler)
+        self._server.stub = self
+        self.host, self.port = self._server.server_address
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._server.shutdown()
+        self._server.server_close()
+        return False
@@ -0,0 +1,97 @@
+"""
+tests/test_batch.py
+
+Unit tests for TaskManager.batch(): deferred writes are persisted once when the block
+exits, and an exception inside the block rolls the in-memory state back.
+"""
+
+import pytest
+from task_manager_pro.services.task_manager import TaskManager
+from task_manager_pro.storage.json_storage import JSONStorage
+from task_manager_pro.storage.sqlite_storage import SQLiteStorage
+
+
+class CountingJSONStorage(JSONStorage):
+    """JSONStorage that counts full-file saves."""
+
+    def __init__(self, *args, **kwargs):
+        self.saves = 0
+        super().__init__(*args, **kwargs)
+
+    def save_data(self, data):
+        self.saves += 1
+        super().save_data(data)
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """
+    Runs each test inside a temporary directory so session files stay isolated.
+    """
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_batch_writes_json_file_once(workdir):
+    """
+    Test that 100 add_task calls inside a batch rewrite tasks.json only once.
+    """
+    storage = CountingJSONStorage(str(workdir / "tasks.json"))
+    manager = TaskManager(storage)
+    manager.login("satvik", "satvik@example.com")
+    storage.saves = 0
+
+    with manager.batch():
+        for i in range(100):
+            manager.add_task(f"Task {i}", "", "2099-01-01")
+        assert JSONStorage(str(workdir / "tasks.json")).load_data()["tasks"] == []
+
+    assert storage.saves == 1
+    assert len(JSONStorage(str(workdir / "tasks.json")).load_data()["tasks"]) == 100
+
+
+def test_batch_rolls_back_on_exception(workdir):
+    """
+    Test that an error inside the block discards its changes in memory and on disk.
+    """
+    storage = CountingJSONStorage(str(workdir / "tasks.json"))
+    manager = TaskManager(storage)
+    manager.login("satvik", "satvik@example.com")
+    manager.add_task("Keep", "", "2099-01-01")
+    storage.saves = 0
+
+    with pytest.raises(RuntimeError):
+        with manager.transaction():
+            manager.add_task("Discard", "", "2099-01-01")
+            manager.mark_task_complete(manager.data["tasks"][0]["id"])
+            raise RuntimeError("boom")
+
+    assert storage.saves == 0
+    assert [(t["title"], t["completed"]) for t in manager.data["tasks"]] == [("Keep", False)]
+    assert manager.index.get_task(manager.data["tasks"][0]["id"]) is manager.data["tasks"][0]
+    assert manager.current_user.username == "satvik"
+
+
+@pytest.mark.parametrize("make_storage", [
+    lambda d: SQLiteStorage(str(d / "tasks.db")),
+    lambda d: JSONStorage(str(d / "tasks.json"), journaled=True),
+])
+def test_batch_applies_record_changes_in_order(workdir, make_storage):
+    """
+    Test that backends with record-level writes replay a batch's changes in order.
+    """
+    manager = TaskManager(make_storage(workdir))
+    manager.login("satvik", "satvik@example.com")
+
+    with manager.batch():
+        manager.add_task("Read", "", "2099-01-01")
+        manager.add_task("Write", "", "2099-01-02")
+        read_id, write_id = (t["id"] for t in manager.data["tasks"])
+        manager.mark_task_complete(read_id)
+        manager.delete_task(write_id)
+        with manager.batch():  # Nested batches join the outer one
+            manager.toggle_email_reminders()
+
+    reloaded = make_storage(workdir).load_data()
+    assert [(t["title"], t["completed"]) for t in reloaded["tasks"]] == [("Read", True)]
+    assert reloaded["users"][0]["email_reminders_enabled"] is False
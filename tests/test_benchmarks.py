@@ -0,0 +1,40 @@
+"""
+tests/test_benchmarks.py
+
+Smoke tests for the benchmark tooling: the synthetic dataset generator is
+deterministic and loadable, and the suite emits a result for every operation.
+"""
+
+import json
+from datetime import date
+from benchmarks.dataset import make_dataset, write_dataset
+from benchmarks.suite import OPERATIONS, main as run_suite
+from task_manager_pro.storage.json_storage import JSONStorage
+
+
+def test_written_dataset_matches_generated_one(tmp_path):
+    """
+    Test that a streamed file loads back to exactly the in-memory dataset, and that
+    the due distribution bounds the generated dates.
+    """
+    today = date(2030, 6, 1)
+    path = str(tmp_path / "tasks.json")
+    write_dataset(path, 500, 20, seed=7, due="upcoming", today=today)
+    data = JSONStorage(path).load_data()
+
+    expected = make_dataset(500, 20, seed=7, due="upcoming", today=today)
+    assert data["tasks"] == expected["tasks"]
+    assert data["users"] == expected["users"]
+    assert all(t["due_date"] > today.isoformat() for t in data["tasks"])
+
+
+def test_suite_reports_every_operation(tmp_path):
+    """
+    Test that a tiny suite run writes machine-readable results for every operation.
+    """
+    output = tmp_path / "results.json"
+    run_suite(["--sizes", "200", "--users", "10", "--repeat", "1", "--output", str(output)])
+
+    report = json.loads(output.read_text())
+    assert [r["operation"] for r in report["results"]] == list(OPERATIONS)
+    assert all(r["mean_seconds"] >= 0 and r["peak_bytes"] > 0 for r in report["results"])
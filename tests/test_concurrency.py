@@ -0,0 +1,188 @@
+"""
+tests/test_concurrency.py
+
+Multi-process tests for JSONStorage: several writer processes share one tasks.json,
+each holding a copy loaded once (like a CLI command or the reminder job), and no
+update may be lost. Also checks that a stale full save_data() is refused, that the
+reminder job keeps settings another process changes while it is sending, and that a
+stale user record cannot hide another process's due task from the reminder job.
+"""
+
+import multiprocessing
+import os
+import time
+import pytest
+from datetime import date
+from task_manager_pro.services.reminders import ReminderEngine
+from task_manager_pro.services.task_manager import TaskManager
+from task_manager_pro.storage.interface import StorageConflictError
+from task_manager_pro.storage.json_storage import JSONStorage
+from task_manager_pro.storage.sqlite_storage import SQLiteStorage
+from task_manager_pro.utils.outbox import Outbox
+
+WRITERS = 6
+WRITES_PER_WRITER = 25
+
+
+def _writer(path: str, journaled: bool, writer: int, writes: int, start) -> None:
+    """
+    Loads the file once, then inserts tasks one at a time from that (increasingly stale) copy.
+    """
+    storage = JSONStorage(path, journaled=journaled)
+    data = storage.load_data()
+    start.wait()
+    for i in range(writes):
+        task = {"id": f"w{writer}-{i}", "title": f"Writer {writer} #{i}", "description": "",
+                "due_date": "2030-01-01", "completed": False, "user": f"user{writer}"}
+        data["tasks"].append(task)
+        storage.insert_task(data, task)
+
+
+def _run_writers(path: str, journaled: bool) -> float:
+    """
+    Runs WRITERS processes concurrently and returns the elapsed wall time.
+    """
+    start = multiprocessing.Event()
+    processes = [multiprocessing.Process(target=_writer, args=(path, journaled, w, WRITES_PER_WRITER, start))
+                 for w in range(WRITERS)]
+    for p in processes:
+        p.start()
+    began = time.perf_counter()
+    start.set()
+    for p in processes:
+        p.join(timeout=60)
+        assert p.exitcode == 0
+    return time.perf_counter() - began
+
+
+@pytest.mark.parametrize("journaled", [False, True], ids=["snapshot", "journal"])
+def test_concurrent_writers_lose_no_updates(tmp_path, journaled):
+    """
+    Test that every insert from every concurrent writer process ends up in the file.
+    """
+    path = str(tmp_path / "tasks.json")
+    JSONStorage(path).save_data({"tasks": [{"id": "seed", "title": "Seed", "user": "user0"}], "users": []})
+
+    elapsed = _run_writers(path, journaled)
+
+    ids = {t["id"] for t in JSONStorage(path).load_data()["tasks"]}
+    expected = {f"w{w}-{i}" for w in range(WRITERS) for i in range(WRITES_PER_WRITER)} | {"seed"}
+    assert ids == expected
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+    total = WRITERS * WRITES_PER_WRITER
+    print(f"{total} writes from {WRITERS} processes in {elapsed:.2f}s ({total / elapsed:.0f} writes/s)")
+
+
+def test_stale_save_data_raises_conflict(tmp_path):
+    """
+    Test that saving a full copy loaded before another writer's save is refused,
+    and that the version counter advances with each save.
+    """
+    path = str(tmp_path / "tasks.json")
+    first, second = JSONStorage(path), JSONStorage(path)
+    mine, theirs = first.load_data(), second.load_data()
+
+    theirs["tasks"].append({"id": "theirs", "title": "Theirs"})
+    second.save_data(theirs)
+    assert theirs["version"] == mine["version"] + 1
+
+    mine["tasks"].append({"id": "mine", "title": "Mine"})
+    with pytest.raises(StorageConflictError):
+        first.save_data(mine)
+    assert [t["id"] for t in first.load_data()["tasks"]] == ["theirs"]
+
+
+def test_stale_record_write_merges_with_file(tmp_path):
+    """
+    Test that a per-record write from a stale copy is merged instead of overwriting the file.
+    """
+    path = str(tmp_path / "tasks.json")
+    first, second = JSONStorage(path), JSONStorage(path)
+    mine, theirs = first.load_data(), second.load_data()
+
+    task = {"id": "theirs", "title": "Theirs"}
+    theirs["tasks"].append(task)
+    second.insert_task(theirs, task)
+    task = {"id": "mine", "title": "Mine"}
+    mine["tasks"].append(task)
+    first.insert_task(mine, task)
+
+    assert sorted(t["id"] for t in first.load_data()["tasks"]) == ["mine", "theirs"]
+
+
+def _open_storage(kind: str, path: str):
+    if kind == "sqlite":
+        return SQLiteStorage(path)
+    return JSONStorage(path, journaled=kind == "journal")
+
+
+def _disable_reminders(kind: str, path: str) -> None:
+    """
+    Turns alice's email reminders off the way TaskManager does: load, change the record, update it.
+    """
+    storage = _open_storage(kind, path)
+    data = storage.load_data()
+    user = next(u for u in data["users"] if u["username"] == "alice")
+    user["email_reminders_enabled"] = False
+    storage.update_user(data, user)
+
+
+@pytest.mark.parametrize("kind", ["snapshot", "journal", "sqlite"])
+def test_reminder_job_keeps_settings_changed_while_sending(tmp_path, kind):
+    """
+    Test that a user's setting changed by another process during the SMTP send survives
+    the reminder job recording the reminder date on the same user.
+    """
+    path = str(tmp_path / ("tasks.db" if kind == "sqlite" else "tasks.json"))
+    _open_storage(kind, path).save_data({
+        "users": [{"username": "alice", "email": "alice@example.com", "email_reminders_enabled": True,
+                   "next_due_date": "2025-03-01"}],
+        "tasks": [{"id": "a1", "title": "Report", "description": "", "due_date": "2025-03-01",
+                   "completed": False, "user": "alice"}],
+    })
+
+    def send(**email):
+        process = multiprocessing.Process(target=_disable_reminders, args=(kind, path))
+        process.start()
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    storage = _open_storage(kind, path)
+    report = ReminderEngine(storage, sender=send, today=date(2025, 3, 10)).run()
+
+    assert report["reminders_sent"] == 1
+    user = next(_open_storage(kind, path).iter_users())
+    assert user["last_reminder_date"] == "2025-03-10"
+    assert user["email_reminders_enabled"] is False
+
+
+def _add_overdue_task(kind: str, path: str) -> None:
+    """
+    Logs in as alice in a fresh TaskManager and adds a task that is already overdue.
+    """
+    outbox = Outbox(os.path.join(os.path.dirname(path), "outbox"))
+    manager = TaskManager(_open_storage(kind, path), outbox=outbox)
+    manager.login("alice")
+    manager.add_task("Overdue", "", "2020-01-01")
+
+
+@pytest.mark.parametrize("kind", ["snapshot", "journal", "sqlite"])
+def test_stale_user_record_keeps_other_process_task_due(tmp_path, monkeypatch, kind):
+    """
+    Test that a user record saved from a copy loaded before another process added a task
+    (and so carrying the old next_due_date) does not drop the user from due_users().
+    """
+    monkeypatch.chdir(tmp_path)
+    path = str(tmp_path / ("tasks.db" if kind == "sqlite" else "tasks.json"))
+    stale = TaskManager(_open_storage(kind, path), outbox=Outbox(str(tmp_path / "outbox")))
+    stale.register_user("alice", "alice@example.com")
+    stale.login("alice")
+    stale.data  # Loaded before the other process writes
+
+    process = multiprocessing.Process(target=_add_overdue_task, args=(kind, path))
+    process.start()
+    process.join(timeout=60)
+    assert process.exitcode == 0
+    stale.toggle_email_reminders()
+
+    assert [u["username"] for u in _open_storage(kind, path).due_users(date(2025, 1, 1))] == ["alice"]
@@ -0,0 +1,100 @@
+"""
+tests/test_dispatch.py
+
+Unit tests for concurrent reminder dispatch, run against a local stub SMTP server.
+Covers bounded parallelism, rate limiting, exponential-backoff retries, and that
+only successfully emailed users get their last_reminder_date updated.
+"""
+
+import time
+import pytest
+from datetime import date
+from task_manager_pro.services.reminders import ReminderEngine
+from task_manager_pro.storage.json_storage import JSONStorage
+from task_manager_pro.utils.dispatch import ConcurrentDispatcher, RateLimiter
+from task_manager_pro.utils.emailer import EmailSession
+from tests.smtp_stub import StubSMTPServer
+
+
+def _factory(server):
+    return lambda: EmailSession(host=server.host, port=server.port, username="", password="", use_tls=False)
+
+
+def _messages(n):
+    return [{"to_email": f"u{i}@example.com", "subject": "Reminder", "body": "Body"} for i in range(n)]
+
+
+def test_concurrency_overlaps_slow_sends():
+    """
+    Test that a slow server is worked around by sending on several connections at once.
+    """
+    with StubSMTPServer(delay=0.1) as server:
+        dispatcher = ConcurrentDispatcher(session_factory=_factory(server), concurrency=4)
+        start = time.perf_counter()
+        errors = dispatcher.dispatch(_messages(8))
+        elapsed = time.perf_counter() - start
+    assert errors == [None] * 8
+    assert len(server.messages) == 8
+    assert 1 < server.connections <= 4
+    assert elapsed < 0.6  # Sequential sending would take at least 0.8s
+
+
+def test_rate_limiter_spaces_out_acquisitions():
+    """
+    Test the token bucket with a fake clock: with rate 10/s, the third call waits 0.1s more.
+    """
+    now = [0.0]
+    waits = []
+    limiter = RateLimiter(rate=10, burst=1, clock=lambda: now[0], sleep=waits.append)
+    limiter.acquire()
+    limiter.acquire()
+    limiter.acquire()
+    assert waits == pytest.approx([0.1, 0.2])
+
+
+def test_transient_failures_are_retried_with_backoff():
+    """
+    Test that 451 replies are retried with doubling delays until the message is accepted.
+    """
+    delays = []
+    with StubSMTPServer(tempfail=2) as server:
+        dispatcher = ConcurrentDispatcher(session_factory=_factory(server), concurrency=1,
+                                          max_retries=3, backoff_base=0.5, sleep=delays.append)
+        errors = dispatcher.dispatch(_messages(1))
+    assert errors == [None]
+    assert delays == [0.5, 1.0]
+    assert len(server.messages) == 1
+
+
+def test_permanent_failures_are_not_retried():
+    """
+    Test that a 550 rejection is reported immediately without retries.
+    """
+    delays = []
+    with StubSMTPServer(reject={"u0@example.com"}) as server:
+        dispatcher = ConcurrentDispatcher(session_factory=_factory(server), concurrency=2,
+                                          max_retries=3, sleep=delays.append)
+        errors = dispatcher.dispatch(_messages(2))
+    assert errors[0] is not None and errors[1] is None
+    assert delays == []
+
+
+def test_only_successful_recipients_are_marked_reminded(tmp_path):
+    """
+    Test that last_reminder_date is only recorded for users whose email was accepted.
+    """
+    storage = JSONStorage(str(tmp_path / "tasks.json"))
+    storage.save_data({
+        "users": [{"username": f"u{i}", "email": f"u{i}@example.com", "email_reminders_enabled": True}
+                  for i in range(4)],
+        "tasks": [{"id": f"t{i}", "title": "Due", "description": "", "due_date": "2025-01-01",
+                   "completed": False, "user": f"u{i}"} for i in range(4)],
+    })
+    with StubSMTPServer(reject={"u1@example.com", "u3@example.com"}) as server:
+        engine = ReminderEngine(storage, today=date(2025, 1, 2), concurrency=2, max_retries=1)
+        engine.dispatcher.session_factory = _factory(server)
+        stats = engine.run()
+
+    assert stats["reminders_sent"] == 2 and stats["reminders_failed"] == 2
+    reminded = {u["username"] for u in storage.load_data()["users"] if u.get("last_reminder_date")}
+    assert reminded == {"u0", "u2"}
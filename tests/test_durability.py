@@ -0,0 +1,156 @@
+"""
+tests/test_durability.py
+
+Tests for JSONStorage durability levels: every-write fsyncs each change, none never
+fsyncs, and group commit buffers changes until group_size is reached or
+group_delay_ms passes, then writes them with a single fsync. The flush timer must
+never write changes that a TaskManager batch later rolls back.
+"""
+
+import os
+import time
+import pytest
+from task_manager_pro.services.task_manager import TaskManager
+from task_manager_pro.storage.json_storage import JSONStorage
+
+
+@pytest.fixture
+def fsyncs(monkeypatch):
+    """
+    Counts os.fsync calls.
+    """
+    calls = []
+    original = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda fd: (calls.append(fd), original(fd)))
+    return calls
+
+
+def _insert(storage, data, i):
+    task = {"id": f"t{i}", "title": f"Task {i}", "user": "alice"}
+    data["tasks"].append(task)
+    storage.insert_task(data, task)
+
+
+def _journal_lines(storage) -> int:
+    if not os.path.exists(storage.journal_file):
+        return 0
+    with open(storage.journal_file) as f:
+        return sum(1 for _ in f)
+
+
+@pytest.mark.parametrize("durability, expected", [("every-write", 5), ("none", 0)])
+def test_fsync_per_write_levels(tmp_path, fsyncs, durability, expected):
+    """
+    Test that every-write fsyncs each journaled change and none never does.
+    """
+    storage = JSONStorage(str(tmp_path / "tasks.json"), journaled=True, durability=durability)
+    data = storage.load_data()
+    fsyncs.clear()
+    for i in range(5):
+        _insert(storage, data, i)
+    assert len(fsyncs) == expected
+    assert _journal_lines(storage) == 5
+
+
+def test_group_commit_flushes_after_group_size(tmp_path, fsyncs):
+    """
+    Test that group commit writes nothing until group_size changes are buffered,
+    then writes them all with one fsync.
+    """
+    storage = JSONStorage(str(tmp_path / "tasks.json"), journaled=True, durability="group",
+                          group_size=10, group_delay_ms=60_000)
+    data = storage.load_data()
+    fsyncs.clear()
+    for i in range(9):
+        _insert(storage, data, i)
+    assert _journal_lines(storage) == 0 and not fsyncs
+
+    _insert(storage, data, 9)
+    assert _journal_lines(storage) == 10
+    assert len(fsyncs) == 1
+
+
+def test_group_commit_flushes_after_delay(tmp_path):
+    """
+    Test that a partial group is written once group_delay_ms has passed.
+    """
+    storage = JSONStorage(str(tmp_path / "tasks.json"), journaled=True, durability="group",
+                          group_size=100, group_delay_ms=20)
+    data = storage.load_data()
+    _insert(storage, data, 0)
+    deadline = time.monotonic() + 5
+    while _journal_lines(storage) == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert _journal_lines(storage) == 1
+
+
+@pytest.mark.parametrize("journaled", [False, True], ids=["snapshot", "journal"])
+def test_buffered_changes_are_visible_to_reads(tmp_path, journaled):
+    """
+    Test that loading or streaming flushes buffered changes first.
+    """
+    path = str(tmp_path / "tasks.json")
+    storage = JSONStorage(path, journaled=journaled, durability="group", group_delay_ms=60_000)
+    data = storage.load_data()
+    for i in range(3):
+        _insert(storage, data, i)
+
+    assert len(list(storage.iter_tasks(user="alice"))) == 3
+    assert len(JSONStorage(path).load_data()["tasks"]) == 3
+
+
+def test_failed_group_flush_keeps_changes_buffered(tmp_path, monkeypatch):
+    """
+    Test that a flush whose write fails keeps its entries, so the next flush writes them.
+    """
+    storage = JSONStorage(str(tmp_path / "tasks.json"), journaled=True, durability="group",
+                          group_size=100, group_delay_ms=60_000)
+    data = storage.load_data()
+    for i in range(3):
+        _insert(storage, data, i)
+
+    def failing_write(entries, data):
+        raise OSError("disk full")
+
+    write = storage._write
+    monkeypatch.setattr(storage, "_write", failing_write)
+    with pytest.raises(OSError):
+        storage.flush()
+    assert _journal_lines(storage) == 0
+
+    monkeypatch.setattr(storage, "_write", write)
+    _insert(storage, data, 3)
+    storage.flush()
+    assert _journal_lines(storage) == 4
+    assert [t["id"] for t in JSONStorage(storage.filename).load_data()["tasks"]] == ["t0", "t1", "t2", "t3"]
+
+
+@pytest.mark.parametrize("journaled", [False, True], ids=["snapshot", "journal"])
+def test_group_flush_never_writes_a_rolled_back_batch(tmp_path, monkeypatch, journaled):
+    """
+    Test that a flush timer firing while a batch is open writes only what was persisted
+    before the batch, so rolling the batch back leaves nothing of it on disk.
+    """
+    monkeypatch.chdir(tmp_path)
+    path = str(tmp_path / "tasks.json")
+    manager = TaskManager(JSONStorage(path, journaled=journaled, durability="group", group_delay_ms=20))
+    manager.login("satvik", "satvik@example.com")
+    before = manager.add_task("Before", "", "2099-01-01")
+
+    with pytest.raises(RuntimeError):
+        with manager.batch():
+            manager.add_task("inside-batch", "", "2099-01-01")
+            manager.update_task(before["id"], title="Renamed")
+            time.sleep(0.1)  # The timer flushes the buffered "Before" meanwhile
+            raise RuntimeError("abort")
+
+    titles = [t["title"] for t in JSONStorage(path).load_data()["tasks"]]
+    assert titles == ["Before"]
+
+
+def test_unknown_durability_level_is_rejected(tmp_path):
+    """
+    Test that a misspelled durability level fails fast.
+    """
+    with pytest.raises(ValueError):
+        JSONStorage(str(tmp_path / "tasks.json"), durability="sometimes")
@@ -0,0 +1,81 @@
+"""
+tests/test_email_session.py
+
+Unit tests for the pooled EmailSession, run against a local stub SMTP server.
+Checks connection reuse, the per-connection message cap, and transparent
+reconnection when the server drops the connection.
+"""
+
+import smtplib
+import pytest
+from datetime import date
+from task_manager_pro.services.reminders import ReminderEngine
+from task_manager_pro.storage.json_storage import JSONStorage
+from task_manager_pro.utils.emailer import EmailSession
+from tests.smtp_stub import StubSMTPServer
+
+
+def _session(server, **kwargs):
+    return EmailSession(host=server.host, port=server.port, username="", password="",
+                        use_tls=False, **kwargs)
+
+
+def test_session_reuses_one_connection():
+    """
+    Test that many messages go over a single SMTP connection.
+    """
+    with StubSMTPServer() as server, _session(server) as session:
+        for i in range(10):
+            session.send(f"user{i}@example.com", "Reminder", "Body")
+    assert len(server.messages) == 10
+    assert server.connections == 1
+
+
+def test_session_caps_messages_per_connection():
+    """
+    Test that the session opens a fresh connection after the configured cap.
+    """
+    with StubSMTPServer() as server, _session(server, max_messages_per_connection=4) as session:
+        for i in range(10):
+            session.send(f"user{i}@example.com", "Reminder", "Body")
+    assert len(server.messages) == 10
+    assert server.connections == 3
+
+
+def test_session_reconnects_after_server_hangup():
+    """
+    Test that a dropped connection is replaced transparently without losing messages.
+    """
+    with StubSMTPServer(drop_after=3) as server, _session(server) as session:
+        for i in range(7):
+            session.send(f"user{i}@example.com", "Reminder", "Body")
+    assert len(server.messages) == 7
+    assert server.connections == 3
+
+
+def test_session_raises_for_rejected_recipient():
+    """
+    Test that permanent failures are raised rather than retried on a new connection.
+    """
+    with StubSMTPServer(reject={"bad@example.com"}) as server, _session(server) as session:
+        with pytest.raises(smtplib.SMTPRecipientsRefused):
+            session.send("bad@example.com", "Reminder", "Body")
+        session.send("good@example.com", "Reminder", "Body")
+    assert server.connections == 1
+
+
+def test_reminder_engine_sends_over_one_session(tmp_path):
+    """
+    Test that a reminder run for many users uses a single pooled connection.
+    """
+    storage = JSONStorage(str(tmp_path / "tasks.json"))
+    storage.save_data({
+        "users": [{"username": f"u{i}", "email": f"u{i}@example.com", "email_reminders_enabled": True}
+                  for i in range(5)],
+        "tasks": [{"id": f"t{i}", "title": "Due", "description": "", "due_date": "2025-01-01",
+                   "completed": False, "user": f"u{i}"} for i in range(5)],
+    })
+    with StubSMTPServer() as server, _session(server) as session:
+        stats = ReminderEngine(storage, sender=session.send, today=date(2025, 1, 2)).run()
+    assert stats["reminders_sent"] == 5
+    assert server.connections == 1
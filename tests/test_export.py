@@ -0,0 +1,95 @@
+"""
+tests/test_export.py
+
+Unit tests for streaming task export to JSON Lines, CSV and iCalendar.
+"""
+
+import csv
+import io
+import json
+from task_manager_pro import cli
+from task_manager_pro.storage.json_storage import JSONStorage
+from task_manager_pro.utils.exporter import export_tasks, filter_tasks, render_ics
+
+TASKS = [
+    {"id": "t1", "title": "Read, then; write", "description": "Line one\nLine two", "due_date": "2030-01-31",
+     "completed": False, "created_at": "2025-01-01 09:00:00", "user": "satvik"},
+    {"id": "t2", "title": "Done", "description": "", "due_date": "2030-02-01",
+     "completed": True, "created_at": "2025-01-01 09:00:00", "user": "satvik"},
+    {"id": "t3", "title": "Other user", "description": "", "due_date": "not a date",
+     "completed": False, "created_at": "2025-01-01 09:00:00", "user": "alice"},
+]
+
+
+def test_export_jsonl_and_csv_round_trip(tmp_path):
+    """
+    Test that JSONL and CSV exports of a filtered storage stream contain the right records.
+    """
+    storage = JSONStorage(str(tmp_path / "tasks.json"))
+    storage.save_data({"tasks": TASKS, "users": []})
+
+    out = io.StringIO()
+    assert export_tasks(filter_tasks(storage.iter_tasks(user="satvik"), "pending"), out, "jsonl") == 1
+    assert [json.loads(line) for line in out.getvalue().splitlines()] == [TASKS[0]]
+
+    out = io.StringIO()
+    export_tasks(storage.iter_tasks(), out, "csv")
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert [r["id"] for r in rows] == ["t1", "t2", "t3"]
+    assert rows[0]["description"] == "Line one\nLine two"
+
+
+def test_export_ics_all_day_events():
+    """
+    Test that ICS output has one escaped all-day event per dated task, with CRLF line endings.
+    """
+    text = "".join(render_ics(iter(TASKS)))
+    assert text.startswith("BEGIN:VCALENDAR\r\n") and text.endswith("END:VCALENDAR\r\n")
+    assert text.count("BEGIN:VEVENT") == 2  # t3 has no valid due date
+    assert "DTSTART;VALUE=DATE:20300131\r\nDTEND;VALUE=DATE:20300201\r\n" in text
+    assert "SUMMARY:Read\\, then\\; write\r\n" in text
+    assert "DESCRIPTION:Line one\\nLine two\r\n" in text
+    assert "\n" not in text.replace("\r\n", "")
+
+
+def test_export_ics_folds_long_lines():
+    """
+    Test that content lines longer than 75 octets are folded with a leading space.
+    """
+    task = dict(TASKS[1], title="ü" * 100)
+    text = "".join(render_ics([task]))
+    assert all(len(line.encode()) <= 75 for line in text.split("\r\n"))
+    summary = text[text.index("SUMMARY:"):text.index("CATEGORIES")].replace("\r\n ", "")
+    assert summary == "SUMMARY:" + "ü" * 100 + "\r\n"
+
+
+def test_export_ics_skips_non_string_due_dates():
+    """
+    Test that a non-string due date (e.g. an int from an imported feed) skips the event instead of failing.
+    """
+    text = "".join(render_ics([dict(TASKS[0], id="n1", due_date=20300131), TASKS[1]]))
+    assert text.count("BEGIN:VEVENT") == 1 and "UID:n1@" not in text
+
+
+def test_ics_export_counts_only_written_events():
+    """
+    Test that export_tasks reports the events written, not the tasks read, for ICS.
+    """
+    out = io.StringIO()
+    assert export_tasks(iter(TASKS), out, "ics") == 2
+    assert out.getvalue().count("BEGIN:VEVENT") == 2
+
+
+def test_export_command_needs_a_user_or_all_users(tmp_path, monkeypatch, capsys):
+    """
+    Test that export-tasks without a session, --user or --all-users exports nothing instead of everyone's tasks.
+    """
+    monkeypatch.chdir(tmp_path)
+    JSONStorage("tasks.json").save_data({"tasks": TASKS, "users": []})
+
+    cli.main(["export-tasks"])
+    captured = capsys.readouterr()
+    assert captured.out == "" and "Please login first" in captured.err
+
+    cli.main(["export-tasks", "--all-users"])
+    assert len(capsys.readouterr().out.splitlines()) == 3
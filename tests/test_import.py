@@ -0,0 +1,92 @@
+"""
+tests/test_import.py
+
+Unit tests for bulk task import: JSONL/CSV feed parsing, row validation,
+and TaskManager.import_tasks writing everything to storage at once.
+"""
+
+import io
+import pytest
+from datetime import date
+from task_manager_pro.services.task_manager import TaskManager
+from task_manager_pro.storage.json_storage import JSONStorage
+from task_manager_pro.utils.importer import detect_format, read_rows
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """
+    A logged-in TaskManager over a fresh tasks.json whose full saves are counted.
+    """
+    monkeypatch.chdir(tmp_path)
+    storage = JSONStorage(str(tmp_path / "tasks.json"))
+    manager = TaskManager(storage)
+    manager.login("satvik", "satvik@example.com")
+    saves = []
+    original = storage.save_data
+    monkeypatch.setattr(storage, "save_data", lambda data: (saves.append(1), original(data)))
+    manager.saves = saves
+    return manager
+
+
+def test_read_rows_jsonl_and_csv():
+    """
+    Test that both feed formats stream rows as dictionaries.
+    """
+    jsonl = io.StringIO('{"title": "A", "due": "2030-01-01"}\n\n{"title": "B", "due_date": "2030-01-02"}\n')
+    csv_feed = io.StringIO("title,due,completed\nA,2030-01-01,yes\n")
+    assert [r["title"] for r in read_rows(jsonl, "jsonl")] == ["A", "B"]
+    assert list(read_rows(csv_feed, "csv")) == [{"title": "A", "due": "2030-01-01", "completed": "yes"}]
+    assert detect_format("feed.ndjson") == "jsonl"
+    with pytest.raises(ValueError):
+        detect_format("feed.txt")
+
+
+def test_import_tasks_writes_once_and_skips_invalid_rows(manager):
+    """
+    Test that valid rows are imported with fresh ids in one save, and invalid ones are skipped.
+    """
+    rows = [{"title": f"Task {i}", "due_date": "2030-01-01"} for i in range(500)]
+    rows += [{"title": "Bad date", "due": "2030-02-30"}, {"due": "2030-01-01"}, {"title": "Other", "due": "2030-01-01",
+             "user": "alice", "completed": "true"}]
+    stats = manager.import_tasks(rows, progress_every=100)
+
+    assert stats["imported"] == 501 and stats["skipped"] == 2
+    assert len(manager.saves) == 1
+    stored = JSONStorage("tasks.json").load_data()["tasks"]
+    assert len(stored) == 501 and len({t["id"] for t in stored}) == 501
+    assert stored[-1]["user"] == "alice" and stored[-1]["completed"] is True
+    assert len(manager.index.due_tasks("satvik", date(2030, 1, 1))) == 500
+
+
+def test_import_tasks_strict_imports_nothing_on_error(manager):
+    """
+    Test that strict mode aborts on the first invalid row without writing anything.
+    """
+    rows = [{"title": "Good", "due": "2030-01-01"}, {"title": "Bad", "due": "01/02/2030"}]
+    assert manager.import_tasks(rows, strict=True) is None
+    assert manager.saves == []
+    assert manager.data["tasks"] == []
+
+
+def test_import_uses_the_task_model_date_rule(manager):
+    """
+    Test that imported due dates follow the same rule as Task: padded on import, compact forms skipped.
+    """
+    stats = manager.import_tasks([{"title": "Padded", "due": "2030-1-2"}, {"title": "Compact", "due": "20300102"}])
+    assert (stats["imported"], stats["skipped"]) == (1, 1)
+    assert manager.data["tasks"][0]["due_date"] == "2030-01-02"
+
+
+def test_import_skips_mistyped_jsonl_rows(manager):
+    """
+    Test that non-string titles, users and descriptions are skipped as invalid rows, not fatal errors.
+    """
+    feed = io.StringIO('{"title": 5, "due": "2030-01-01"}\n'
+                       '{"title": "List owner", "due": "2030-01-01", "user": ["x"]}\n'
+                       '{"title": "Dict notes", "due": "2030-01-01", "description": {"a": 1}}\n'
+                       '{"title": "Good", "due": "2030-01-01"}\n')
+    stats = manager.import_tasks(read_rows(feed, "jsonl"))
+    assert (stats["imported"], stats["skipped"]) == (1, 3)
+    assert [t["title"] for t in manager.data["tasks"]] == ["Good"]
+    assert manager.import_tasks([{"title": 5, "due": "2030-01-01"}], strict=True) is None
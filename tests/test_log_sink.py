@@ -0,0 +1,121 @@
+"""
+tests/test_log_sink.py
+
+Tests for the queue-based LogSink: lines arrive in order, the file rotates by size,
+LoggerContext and log_action write through the shared sink, and queued lines are
+flushed when the interpreter exits.
+"""
+
+import os
+import subprocess
+import sys
+import pytest
+from task_manager_pro.utils import log_sink, metrics
+from task_manager_pro.utils.decorators import log_action
+from task_manager_pro.utils.log_sink import LogSink, get_sink
+from task_manager_pro.utils.logger_context import LoggerContext
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_lines_are_written_in_order(tmp_path):
+    """
+    Test that every queued line is in the file, in order, once flush() returns.
+    """
+    sink = LogSink(str(tmp_path / "app.log"))
+    for i in range(1000):
+        sink.write(f"line {i}\n")
+    assert sink.flush(timeout=5)
+    assert (tmp_path / "app.log").read_text().splitlines() == [f"line {i}" for i in range(1000)]
+    sink.close()
+
+
+def test_rotation_keeps_bounded_backups(tmp_path):
+    """
+    Test that the file is rotated past max_bytes and only backup_count old files are kept.
+    """
+    path = tmp_path / "app.log"
+    sink = LogSink(str(path), max_bytes=1000, backup_count=2)
+    for i in range(205):
+        sink.write(f"{i:09d}\n")
+        sink.flush(timeout=5)  # One write per batch, so every rotation point is hit
+    sink.close()
+
+    assert sorted(os.listdir(tmp_path)) == ["app.log", "app.log.1", "app.log.2"]
+    assert all(os.path.getsize(tmp_path / name) <= 1000 for name in os.listdir(tmp_path))
+    assert path.read_text().splitlines() == [f"{i:09d}" for i in range(200, 205)]
+
+
+def test_logger_context_and_log_action_share_the_sink(tmp_path, monkeypatch, capsys):
+    """
+    Test that LoggerContext blocks and logged operations end up in the same log file.
+    """
+    path = str(tmp_path / "task_manager.log")
+    monkeypatch.setattr(metrics, "QUIET", True)
+    log_sink.set_action_log(path)
+    try:
+        @log_action
+        def add_task():
+            return "ok"
+
+        with LoggerContext("Nightly import", log_file=path) as log:
+            log.log("halfway")
+            add_task()
+    finally:
+        log_sink.set_action_log(None)
+    get_sink(path).flush(timeout=5)
+
+    text = open(path).read()
+    for fragment in ("Starting: Nightly import", "📝 halfway", "▶ Executing: Add Task",
+                     "✔ Completed: Add Task (", "✅ Finished: Nightly import"):
+        assert fragment in text
+    assert "Executing" not in capsys.readouterr().out
+
+
+def test_logger_context_requires_entering():
+    """
+    Test that writing outside the with-block still fails loudly.
+    """
+    with pytest.raises(RuntimeError):
+        LoggerContext("Not entered")._write_log("x")
+
+
+def test_queued_lines_are_flushed_at_exit(tmp_path):
+    """
+    Test that lines still queued when the interpreter exits are written anyway.
+    """
+    path = tmp_path / "exit.log"
+    script = ("from task_manager_pro.utils.log_sink import get_sink\n"
+              f"sink = get_sink({str(path)!r})\n"
+              "for i in range(5000):\n"
+              "    sink.write(f'{i}\\n')\n")
+    subprocess.run([sys.executable, "-c", script], cwd=REPO_ROOT, check=True)
+    assert path.read_text().splitlines()[-1] == "4999"
+
+
+def test_unusable_path_raises_on_first_write(tmp_path):
+    """
+    Test that a log file that cannot be opened fails at the caller instead of in the writer thread.
+    """
+    path = str(tmp_path / "missing" / "app.log")
+    sink = LogSink(path)
+    with pytest.raises(OSError):
+        sink.write("x\n")
+    assert sink.flush(timeout=1)  # Nothing was queued
+    with pytest.raises(OSError):
+        with LoggerContext("Bad path", log_file=path):
+            pass
+
+
+@pytest.mark.skipif(not os.path.exists("/dev/full"), reason="needs /dev/full")
+def test_failed_write_releases_flush_and_raises():
+    """
+    Test that a write error (disk full) marks the sink failed instead of leaving lines queued forever.
+    """
+    sink = LogSink("/dev/full", max_bytes=0)
+    sink.write("x\n")
+    assert sink.flush(timeout=5) is False
+    assert sink.flush() is False  # No timeout, still returns
+    with pytest.raises(OSError):
+        sink.write("y\n")
+    sink.close()
@@ -0,0 +1,138 @@
+"""
+tests/test_metrics.py
+
+Tests for the instrumentation in utils/metrics.py and log_action: per-operation
+latency histograms and counters, storage timings and bytes written, the Prometheus
+and JSON exports, quiet mode and the cProfile hook.
+"""
+
+import cProfile
+import json
+import pstats
+import pytest
+from task_manager_pro.storage.json_storage import JSONStorage
+from task_manager_pro.utils import metrics
+from task_manager_pro.utils.decorators import log_action
+from task_manager_pro.utils.metrics import METRICS, MetricsRegistry
+
+
+@pytest.fixture(autouse=True)
+def fresh_metrics(monkeypatch):
+    """
+    Starts every test with empty metrics, console logging on and no profiler.
+    """
+    METRICS.reset()
+    monkeypatch.setattr(metrics, "QUIET", False)
+    monkeypatch.setattr(metrics, "profiler", None)
+    yield
+    METRICS.reset()
+
+
+@log_action
+def add_numbers(a, b):
+    return a + b
+
+
+@log_action
+def fail():
+    raise ValueError("boom")
+
+
+def test_log_action_records_duration_and_outcome(capsys):
+    """
+    Test that each call is observed in the operation histogram and counted by outcome.
+    """
+    assert add_numbers(1, 2) == 3
+    add_numbers(3, 4)
+    with pytest.raises(ValueError):
+        fail()
+
+    snapshot = METRICS.to_dict()
+    durations = {s["labels"]["operation"]: s for s in snapshot["histograms"]["operation_duration_seconds"]}
+    assert durations["add_numbers"]["count"] == 2
+    assert durations["add_numbers"]["buckets"]["+Inf"] == 2
+    counts = {(s["labels"]["operation"], s["labels"]["status"]): s["value"]
+              for s in snapshot["counters"]["operations_total"]}
+    assert counts == {("add_numbers", "ok"): 2, ("fail", "error"): 1}
+    assert "✔ Completed: Add Numbers (" in capsys.readouterr().out
+
+
+def test_quiet_mode_prints_nothing(capsys):
+    """
+    Test that quiet mode drops the console lines but still records metrics.
+    """
+    metrics.set_quiet()
+    add_numbers(1, 2)
+    assert capsys.readouterr().out == ""
+    assert METRICS.to_dict()["counters"]["operations_total"][0]["value"] == 1
+
+
+def test_prometheus_export_has_cumulative_buckets(tmp_path):
+    """
+    Test the Prometheus text format: cumulative buckets, +Inf, _sum and _count lines.
+    """
+    registry = MetricsRegistry()
+    for value in (0.0004, 0.003, 0.003, 20):
+        registry.observe("storage_load_seconds", value, backend="json")
+    registry.inc("storage_bytes_written_total", 512, backend="json")
+    text = registry.to_prometheus()
+
+    assert "# TYPE task_manager_storage_load_seconds histogram" in text
+    assert 'task_manager_storage_load_seconds_bucket{backend="json",le="0.0005"} 1' in text
+    assert 'task_manager_storage_load_seconds_bucket{backend="json",le="0.005"} 3' in text
+    assert 'task_manager_storage_load_seconds_bucket{backend="json",le="+Inf"} 4' in text
+    assert 'task_manager_storage_load_seconds_count{backend="json"} 4' in text
+    assert 'task_manager_storage_bytes_written_total{backend="json"} 512' in text
+
+    registry.write(str(tmp_path / "metrics.json"))
+    assert json.loads((tmp_path / "metrics.json").read_text())["counters"]["storage_bytes_written_total"]
+
+
+def test_prometheus_export_prints_large_counters_exactly():
+    """
+    Test that counters past 10^6 are printed in full rather than rounded to 6 significant digits.
+    """
+    registry = MetricsRegistry()
+    registry.inc("storage_bytes_written_total", 12_345_678, backend="json")
+    registry.inc("storage_bytes_written_total", 2.5, backend="sqlite")
+    text = registry.to_prometheus()
+    assert 'task_manager_storage_bytes_written_total{backend="json"} 12345678\n' in text
+    assert 'task_manager_storage_bytes_written_total{backend="sqlite"} 2.5\n' in text
+
+
+def test_storage_records_load_save_and_bytes(tmp_path):
+    """
+    Test that JSONStorage reports load and save times and the bytes it wrote.
+    """
+    storage = JSONStorage(str(tmp_path / "tasks.json"))
+    METRICS.reset()
+    data = storage.load_data()
+    data["tasks"].append({"id": "t1", "title": "Write me"})
+    storage.save_data(data)
+
+    snapshot = METRICS.to_dict()
+    assert snapshot["histograms"]["storage_load_seconds"][0]["count"] == 1
+    assert snapshot["histograms"]["storage_save_seconds"][0]["count"] == 1
+    written = snapshot["counters"]["storage_bytes_written_total"][0]["value"]
+    assert written == (tmp_path / "tasks.json").stat().st_size
+
+
+def test_profiler_hook_profiles_logged_calls(monkeypatch):
+    """
+    Test that with a profiler enabled, logged calls run under it.
+    """
+    profiler = cProfile.Profile()
+    monkeypatch.setattr(metrics, "profiler", profiler)
+    add_numbers(1, 2)
+    functions = {name for (_, _, name) in pstats.Stats(profiler).stats}
+    assert "add_numbers" in functions
+
+
+def test_percentiles_use_nearest_rank():
+    """
+    Test nearest-rank percentiles, including the empty sample.
+    """
+    values = [float(v) for v in range(1, 101)]
+    assert metrics.percentiles(values) == {"p50": 50.0, "p90": 90.0, "p99": 99.0}
+    assert metrics.percentiles([3.0]) == {"p50": 3.0, "p90": 3.0, "p99": 3.0}
+    assert metrics.percentiles([]) == {"p50": None, "p90": None, "p99": None}
@@ -0,0 +1,94 @@
+"""
+tests/test_outbox.py
+
+Unit tests for the on-disk reminder email outbox.
+Checks that TaskManager only queues emails (and skips unchanged digests),
+that draining sends them in batches through a local stub SMTP server,
+and that failures are retried or dead-lettered.
+"""
+
+from task_manager_pro.services.task_manager import TaskManager
+from task_manager_pro.storage.json_storage import JSONStorage
+from task_manager_pro.utils.dispatch import ConcurrentDispatcher
+from task_manager_pro.utils.emailer import EmailSession
+from task_manager_pro.utils.outbox import Outbox
+from tests.smtp_stub import StubSMTPServer
+
+
+def _dispatcher(server, **kwargs):
+    factory = lambda: EmailSession(host=server.host, port=server.port, username="", password="", use_tls=False)
+    return ConcurrentDispatcher(session_factory=factory, max_retries=0, **kwargs)
+
+
+def test_task_manager_queues_instead_of_sending(tmp_path, monkeypatch):
+    """
+    Test that due reminders for an interactive command land in the outbox.
+    """
+    monkeypatch.chdir(tmp_path)
+    outbox = Outbox(str(tmp_path / "outbox"))
+    manager = TaskManager(JSONStorage(str(tmp_path / "tasks.json")), outbox=outbox)
+    manager.login("satvik", "satvik@example.com")
+    manager.add_task("Overdue", "Already late", "2020-01-01")
+    manager.list_tasks("all")
+
+    assert len(outbox) == 1
+
+
+def test_drain_sends_in_fifo_batches(tmp_path):
+    """
+    Test that draining empties the queue in order, reusing connections across a batch.
+    """
+    outbox = Outbox(str(tmp_path / "outbox"))
+    for i in range(5):
+        outbox.enqueue(f"u{i}@example.com", "Reminder", f"Body {i}")
+
+    with StubSMTPServer() as server:
+        stats = outbox.drain(_dispatcher(server, concurrency=1), batch_size=2)
+
+    assert stats == {"sent": 5, "retried": 0, "dead_lettered": 0}
+    assert len(outbox) == 0
+    assert [m["to"] for m in server.messages] == [[f"u{i}@example.com"] for i in range(5)]
+    assert server.connections == 3
+
+
+def test_drain_retries_transient_and_dead_letters_permanent(tmp_path):
+    """
+    Test that deferred messages stay queued while rejected ones move to outbox/failed.
+    """
+    outbox = Outbox(str(tmp_path / "outbox"), max_attempts=2)
+    outbox.enqueue("bad@example.com", "Reminder", "Body")
+    outbox.enqueue("later@example.com", "Reminder", "Body")
+
+    with StubSMTPServer(reject={"bad@example.com"}, tempfail=1) as server:
+        first = outbox.drain(_dispatcher(server))
+        second = outbox.drain(_dispatcher(server))
+
+    assert first == {"sent": 0, "retried": 1, "dead_lettered": 1}
+    assert second == {"sent": 1, "retried": 0, "dead_lettered": 0}
+    assert len(outbox) == 0
+    assert len(list((tmp_path / "outbox" / "failed").iterdir())) == 1
+
+
+def test_unchanged_digest_is_not_queued_twice(tmp_path, monkeypatch):
+    """
+    Test that repeated read-only commands skip an identical digest but resend once it changes.
+    """
+    monkeypatch.chdir(tmp_path)
+    outbox = Outbox(str(tmp_path / "outbox"))
+    storage = JSONStorage(str(tmp_path / "tasks.json"))
+    manager = TaskManager(storage, outbox=outbox)
+    manager.login("satvik", "satvik@example.com")
+    manager.add_task("Overdue", "Already late", "2020-01-01")
+    manager.list_tasks("all")
+    manager.list_tasks("pending")
+    assert len(outbox) == 1
+
+    # A fresh process sees the stored digest hash too
+    TaskManager(storage, outbox=outbox).list_tasks("all")
+    assert len(outbox) == 1
+
+    manager.add_task("Also overdue", "Later still", "2020-02-01")
+    manager.list_tasks("all")
+    assert len(outbox) == 2
+    user = storage.load_data()["users"][0]
+    assert user["last_digest_hash"] and user["last_digest_at"]
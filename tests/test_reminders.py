@@ -0,0 +1,137 @@
+"""
+tests/test_reminders.py
+
+Unit tests for the reminder engine behind send_reminders.py.
+Checks single-pass grouping of due tasks, digest eligibility rules,
+that reminder dates are recorded so users are not reminded twice a day, and the
+per-run telemetry report.
+"""
+
+import json
+import pytest
+from datetime import date
+from task_manager_pro import send_reminders
+from task_manager_pro.services.reminders import ReminderEngine, group_due_tasks
+from task_manager_pro.storage.json_storage import JSONStorage
+from task_manager_pro.storage.sqlite_storage import SQLiteStorage
+
+TODAY = date(2025, 3, 10)
+
+
+def _task(task_id, user, due, completed=False):
+    return {"id": task_id, "title": task_id, "description": "", "due_date": due,
+            "completed": completed, "user": user}
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = JSONStorage(str(tmp_path / "tasks.json"))
+    storage.save_data({
+        "users": [
+            {"username": "alice", "email": "alice@example.com", "email_reminders_enabled": True},
+            {"username": "bob", "email": "bob@example.com", "email_reminders_enabled": False},
+            {"username": "carol", "email": None, "email_reminders_enabled": True},
+            {"username": "dave", "email": "dave@example.com", "email_reminders_enabled": True},
+        ],
+        "tasks": [
+            _task("a1", "alice", "2025-03-01"),
+            _task("a2", "alice", "2025-03-10"),
+            _task("a3", "alice", "2025-03-11"),
+            _task("a4", "alice", "2025-02-01", completed=True),
+            _task("b1", "bob", "2025-03-01"),
+            _task("c1", "carol", "2025-03-01"),
+            _task("d1", "dave", "2025-04-01"),
+        ],
+    })
+    return storage
+
+
+def test_group_due_tasks_single_pass():
+    """
+    Test that only pending tasks due on or before today are grouped, per user.
+    """
+    grouped = group_due_tasks([
+        _task("a1", "alice", "2025-03-10"),
+        _task("a2", "alice", "2025-03-11"),
+        _task("b1", "bob", "2025-01-01", completed=True),
+        _task("b2", "bob", "2025-01-01"),
+    ], TODAY)
+    assert {u: [t["id"] for t in ts] for u, ts in grouped.items()} == {"alice": ["a1"], "bob": ["b2"]}
+
+
+def test_engine_sends_one_digest_per_eligible_user(storage):
+    """
+    Test that only users with email, reminders enabled and due tasks receive a digest.
+    """
+    sent = []
+    stats = ReminderEngine(storage, sender=lambda **kw: sent.append(kw), today=TODAY).run()
+
+    assert [m["to_email"] for m in sent] == ["alice@example.com"]
+    assert "a1" in sent[0]["body"] and "a2" in sent[0]["body"] and "a3" not in sent[0]["body"]
+    # Dave has nothing due yet, so only alice's pending tasks are read
+    assert stats["users"] == 3 and stats["tasks"] == 3 and stats["reminders_sent"] == 1
+    assert stats["due_tasks"] == 2 and stats["overdue_tasks"] == 1  # a2 is due today, not overdue
+    assert stats["tasks_per_second"] > 0
+
+
+def test_engine_reminds_at_most_once_per_day(storage):
+    """
+    Test that last_reminder_date is persisted and suppresses a second run on the same day.
+    """
+    sent = []
+    ReminderEngine(storage, sender=lambda **kw: sent.append(kw), today=TODAY).run()
+    ReminderEngine(storage, sender=lambda **kw: sent.append(kw), today=TODAY).run()
+
+    assert len(sent) == 1
+    alice = next(u for u in storage.load_data()["users"] if u["username"] == "alice")
+    assert alice["last_reminder_date"] == "2025-03-10"
+
+
+def test_run_report_has_stage_timings_and_smtp_telemetry(storage):
+    """
+    Test the telemetry in a run's stats: stages, email outcomes, latency percentiles and bytes saved.
+    """
+    def flaky_sender(**kw):
+        if kw["to_email"] == "dave@example.com":
+            raise ValueError("mailbox full")
+
+    storage.update_task({}, _task("d1", "dave", "2025-03-01"))
+    stats = ReminderEngine(storage, sender=flaky_sender, today=TODAY).run()
+
+    assert list(stats["stages_seconds"]) == ["load_users", "scan", "send", "save"]
+    assert sum(stats["stages_seconds"].values()) <= stats["elapsed_seconds"]
+    assert (stats["emails_attempted"], stats["reminders_sent"], stats["reminders_failed"]) == (2, 1, 1)
+    assert stats["send_attempts"] == 2
+    assert set(stats["smtp_latency_ms"]) == {"p50", "p90", "p99", "max"}
+    assert stats["smtp_latency_ms"]["p50"] <= stats["smtp_latency_ms"]["max"]
+    assert stats["bytes_saved"] > 0
+
+
+def test_send_reminders_writes_report_and_history(storage, tmp_path, monkeypatch):
+    """
+    Test that the cron script writes the JSON report and appends one history line per run.
+    """
+    monkeypatch.setattr(send_reminders, "ReminderEngine",
+                        lambda storage, **kw: ReminderEngine(storage, sender=lambda **m: None, today=TODAY))
+    report, history = tmp_path / "report.json", tmp_path / "history.jsonl"
+    args = ["--file", storage.filename, "--report", str(report), "--history", str(history)]
+    send_reminders.main(args)
+    send_reminders.main(args)
+
+    assert json.loads(report.read_text())["reminders_sent"] == 0  # Second run: already reminded today
+    runs = [json.loads(line) for line in history.read_text().splitlines()]
+    assert [r["reminders_sent"] for r in runs] == [1, 0]
+
+
+def test_send_reminders_reads_the_selected_backend(storage, tmp_path, monkeypatch):
+    """
+    Test that --storage sqlite makes the cron script read tasks.db instead of tasks.json.
+    """
+    monkeypatch.setattr(send_reminders, "ReminderEngine",
+                        lambda storage, **kw: ReminderEngine(storage, sender=lambda **m: None, today=TODAY))
+    path = str(tmp_path / "tasks.db")
+    SQLiteStorage(path).save_data(storage.load_data())
+
+    stats = send_reminders.main(["--storage", "sqlite", "--file", path, "--report", ""])
+
+    assert stats["storage"] == "SQLiteStorage" and stats["reminders_sent"] == 1
@@ -0,0 +1,152 @@
+"""
+tests/test_schedule.py
+
+Tests for per-user next_due_date scheduling: TaskManager keeps it current as tasks
+change, both storage backends answer due_users() from it (JSON from the snapshot's
+sorted schedule, SQLite from an indexed column), records written before scheduling
+are still treated as due, and the reminder job only reads users who have something due.
+"""
+
+import json
+import sqlite3
+import pytest
+from datetime import date
+from task_manager_pro.services.reminders import ReminderEngine
+from task_manager_pro.services.task_manager import TaskManager
+from task_manager_pro.storage.json_storage import JSONStorage
+from task_manager_pro.storage.sqlite_storage import SQLiteStorage
+from task_manager_pro.utils.outbox import Outbox
+from task_manager_pro.utils.session import save_session
+
+TODAY = date(2030, 6, 1)
+
+
+@pytest.fixture(params=["json", "journal", "sqlite"])
+def storage(request, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    if request.param == "sqlite":
+        storage = SQLiteStorage(str(tmp_path / "tasks.db"))
+        yield storage
+        storage.close()
+    else:
+        yield JSONStorage(str(tmp_path / "tasks.json"), journaled=request.param == "journal")
+
+
+def _manager(storage, tmp_path, username):
+    save_session(username)
+    manager = TaskManager(storage, outbox=Outbox(str(tmp_path / "outbox")))
+    manager.register_user(username, f"{username}@example.com")
+    manager.login(username)
+    return manager
+
+
+def test_task_changes_keep_next_due_date_current(storage, tmp_path):
+    """
+    Test that add, update, complete and delete each leave the earliest pending due date on the user.
+    """
+    manager = _manager(storage, tmp_path, "alice")
+
+    def next_due():
+        return next(u for u in storage.load_data()["users"] if u["username"] == "alice")["next_due_date"]
+
+    assert next_due() is None
+    late = manager.add_task("Late", "", "2030-07-01")
+    assert next_due() == "2030-07-01"
+    early = manager.add_task("Early", "", "2030-05-01")
+    assert next_due() == "2030-05-01"
+    manager.update_task(late["id"], due="2030-04-01")
+    assert next_due() == "2030-04-01"
+    manager.mark_task_complete(late["id"])
+    assert next_due() == "2030-05-01"
+    manager.delete_task(early["id"])
+    assert next_due() is None
+
+
+def test_update_task_normalizes_unpadded_due_dates(storage, tmp_path):
+    """
+    Test that an unpadded due date set by update_task is stored padded and still scheduled.
+    """
+    manager = _manager(storage, tmp_path, "alice")
+    task = manager.add_task("Task", "", "2030-07-01")
+    manager.update_task(task["id"], due="2020-1-5")
+
+    assert task["due_date"] == "2020-01-05"
+    assert [t["id"] for t in manager.index.due_tasks("alice", TODAY)] == [task["id"]]
+    assert [u["username"] for u in storage.due_users(TODAY)] == ["alice"]
+    with pytest.raises(ValueError):
+        manager.update_task(task["id"], title="Renamed", due="2020-13-01")
+    assert task["title"] == "Task"
+
+
+def test_due_users_reads_only_scheduled_users(storage, tmp_path):
+    """
+    Test that due_users() returns users due on or before today, and that a user record
+    written with an outdated next_due_date cannot change that.
+    """
+    for username, due in (("alice", "2030-05-01"), ("bob", "2030-06-01"), ("carol", "2030-06-02")):
+        _manager(storage, tmp_path, username).add_task("Task", "", due)
+    _manager(storage, tmp_path, "dave")  # No tasks
+
+    assert {u["username"] for u in storage.due_users(TODAY)} == {"alice", "bob"}
+    assert storage.due_users(date(2030, 1, 1)) == []
+
+    alice = next(u for u in storage.load_data()["users"] if u["username"] == "alice")
+    carol = next(u for u in storage.load_data()["users"] if u["username"] == "carol")
+    storage.update_user({}, dict(alice, next_due_date=None))
+    storage.update_user({}, dict(carol, next_due_date="2030-05-15"))
+    assert {u["username"] for u in storage.due_users(TODAY)} == {"alice", "bob"}
+
+
+def test_unscheduled_records_are_due_until_rescheduled(tmp_path, monkeypatch):
+    """
+    Test that users written before scheduling are always read, and reschedule_users() fixes that.
+    """
+    monkeypatch.chdir(tmp_path)
+    with open(tmp_path / "tasks.json", "w") as f:  # As written before schedules existed
+        json.dump({
+            "users": [{"username": "alice", "email": "alice@example.com", "email_reminders_enabled": True},
+                      {"username": "bob", "email": "bob@example.com", "email_reminders_enabled": True}],
+            "tasks": [{"id": "a1", "title": "Soon", "due_date": "2030-07-01", "completed": False, "user": "alice"}],
+        }, f)
+    storage = JSONStorage(str(tmp_path / "tasks.json"))
+    assert [u["username"] for u in storage.due_users(TODAY)] == ["alice", "bob"]
+
+    assert TaskManager(storage, outbox=Outbox(str(tmp_path / "outbox"))).reschedule_users() == 2
+    assert storage.due_users(TODAY) == []
+    assert storage.due_users(date(2030, 7, 1))[0]["username"] == "alice"
+
+
+def test_sqlite_migrates_databases_without_the_column(tmp_path):
+    """
+    Test that an older users table gains next_due_date, filled from the stored records.
+    """
+    path = str(tmp_path / "tasks.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE users (username TEXT PRIMARY KEY, record TEXT NOT NULL)")
+    conn.executemany("INSERT INTO users VALUES (?, ?)", [
+        ("alice", json.dumps({"username": "alice", "next_due_date": "2030-05-01"})),
+        ("bob", json.dumps({"username": "bob", "next_due_date": None})),
+        ("carol", json.dumps({"username": "carol"})),
+    ])
+    conn.commit()
+    conn.close()
+
+    storage = SQLiteStorage(path)
+    assert [u["username"] for u in storage.due_users(TODAY)] == ["alice", "carol"]
+    storage.close()
+
+
+def test_reminder_job_skips_users_with_nothing_due(storage, tmp_path):
+    """
+    Test that the job only reads due users and their pending tasks.
+    """
+    _manager(storage, tmp_path, "alice").add_task("Overdue", "", "2030-05-01")
+    bob = _manager(storage, tmp_path, "bob")
+    for i in range(5):
+        bob.add_task(f"Later {i}", "", "2030-12-01")
+
+    sent = []
+    stats = ReminderEngine(storage, sender=lambda **kw: sent.append(kw), today=TODAY).run()
+
+    assert [m["to_email"] for m in sent] == ["alice@example.com"]
+    assert (stats["users"], stats["tasks"]) == (1, 1)
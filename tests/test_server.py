@@ -0,0 +1,99 @@
+"""
+tests/test_server.py
+
+Tests for the HTTP service mode: the JSON API over one in-memory TaskManager,
+with every write persisted through the storage backend.
+"""
+
+import pytest
+from task_manager_pro.storage.json_storage import JSONStorage
+from task_manager_pro.storage.sqlite_storage import SQLiteStorage
+from task_manager_pro.utils.outbox import Outbox
+
+flask = pytest.importorskip("flask")
+from task_manager_pro.server import create_app  # noqa: E402
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def storage_factory(request, tmp_path, monkeypatch):
+    """
+    Returns a callable opening the same data file, for each backend.
+    """
+    monkeypatch.chdir(tmp_path)
+    if request.param == "sqlite":
+        return lambda: SQLiteStorage(str(tmp_path / "tasks.db"))
+    return lambda: JSONStorage(str(tmp_path / "tasks.json"))
+
+
+def test_api_task_lifecycle_is_persisted(storage_factory, tmp_path):
+    """
+    Test creating a user and task, updating, completing and deleting it over HTTP.
+    """
+    client = create_app(storage_factory(), outbox=Outbox(str(tmp_path / "outbox"))).test_client()
+
+    assert client.put("/users/satvik", json={"email": "satvik@example.com"}).status_code == 201
+    response = client.post("/users/satvik/tasks", json={"title": "Read", "due_date": "2030-01-01"})
+    assert response.status_code == 201
+    task_id = response.get_json()["id"]
+
+    assert client.patch(f"/users/satvik/tasks/{task_id}", json={"title": "Read more"}).get_json()["title"] == "Read more"
+    assert [t["id"] for t in client.get("/users/satvik/tasks/due?date=2030-01-01").get_json()] == [task_id]
+    assert client.patch(f"/users/satvik/tasks/{task_id}", json={"completed": True}).get_json()["completed"] is True
+    assert client.get("/users/satvik/tasks?status=pending").get_json() == []
+    assert client.post("/users/satvik/toggle-email-reminders").get_json() == {"email_reminders_enabled": False}
+
+    stored = storage_factory().load_data()
+    assert stored["tasks"][0]["title"] == "Read more" and stored["tasks"][0]["completed"] is True
+    assert stored["users"][0]["email_reminders_enabled"] is False
+
+    assert client.delete(f"/users/satvik/tasks/{task_id}").status_code == 200
+    assert storage_factory().load_data()["tasks"] == []
+
+
+def test_api_rejects_bad_input_and_foreign_tasks(storage_factory, tmp_path):
+    """
+    Test 400/404 responses for invalid bodies, unknown users and other users' tasks.
+    """
+    client = create_app(storage_factory(), outbox=Outbox(str(tmp_path / "outbox"))).test_client()
+    client.put("/users/alice")
+    client.put("/users/bob")
+    task_id = client.post("/users/alice/tasks", json={"title": "Mine", "due_date": "2030-01-01"}).get_json()["id"]
+
+    assert client.post("/users/alice/tasks", json={"title": "Bad", "due_date": "2030-13-01"}).status_code == 400
+    assert client.post("/users/alice/tasks", data="not json").status_code == 400
+    assert client.get("/users/carol/tasks").status_code == 404
+    assert client.get(f"/users/bob/tasks/{task_id}").status_code == 404
+    assert client.delete(f"/users/bob/tasks/{task_id}").status_code == 404
+    assert len(storage_factory().load_data()["tasks"]) == 1
+    assert client.put("/users/bob", json=["x"]).status_code == 400
+    assert client.put("/users/bob", json={"email": 5}).status_code == 400
+    assert client.patch(f"/users/alice/tasks/{task_id}", json=["x"]).status_code == 400
+
+
+def test_api_rejects_mistyped_task_fields(storage_factory, tmp_path):
+    """
+    Test that POST and PATCH return 400 for non-string fields or a non-boolean completed flag.
+    """
+    client = create_app(storage_factory(), outbox=Outbox(str(tmp_path / "outbox"))).test_client()
+    client.put("/users/alice")
+    task = client.post("/users/alice/tasks", json={"title": "Mine", "due_date": "2030-01-01"}).get_json()
+
+    for body in ({"title": "x", "due_date": 20250101}, {"title": ["a"], "due_date": "2030-01-01"},
+                 {"title": 5, "due_date": "2030-01-01"}, {"title": "   ", "due_date": "2030-01-01"},
+                 {"title": "x", "description": {"a": 1}, "due_date": "2030-01-01"}):
+        assert client.post("/users/alice/tasks", json=body).status_code == 400, body
+    for body in ({"due_date": 20250101}, {"title": ["a"]}, {"title": 5}, {"description": {"a": 1}},
+                 {"completed": "no"}, {"completed": 1}):
+        assert client.patch(f"/users/alice/tasks/{task['id']}", json=body).status_code == 400, body
+    assert client.get("/users/alice/tasks").get_json() == [task]
+
+
+def test_api_leaves_process_stdout_alone(storage_factory, tmp_path, capsys):
+    """
+    Test that handlers do not swap sys.stdout: TaskManager messages reach the server's console.
+    """
+    client = create_app(storage_factory(), outbox=Outbox(str(tmp_path / "outbox"))).test_client()
+    assert client.put("/users/dana", json={"email": "dana@example.com"}).get_json()["email"] == "dana@example.com"
+    assert client.post("/users/dana/tasks", json={"title": "Plan", "due_date": "2030-01-01"}).status_code == 201
+    out = capsys.readouterr().out
+    assert "Registered dana" in out and "Task 'Plan' added" in out
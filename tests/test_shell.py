@@ -0,0 +1,65 @@
+"""
+tests/test_shell.py
+
+Tests for `task-manager shell`: commands parsed by the regular CLI parser run
+against one loaded TaskManager, and a script's changes are saved once.
+"""
+
+import io
+import pytest
+from task_manager_pro.cli import build_parser, main
+from task_manager_pro.services.task_manager import TaskManager
+from task_manager_pro.shell import run_shell
+from task_manager_pro.storage.json_storage import JSONStorage
+from task_manager_pro.utils.outbox import Outbox
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    """
+    A JSONStorage in a temporary working directory that counts full saves.
+    """
+    monkeypatch.chdir(tmp_path)
+    storage = JSONStorage(str(tmp_path / "tasks.json"))
+    storage.saves = 0
+    original = storage.save_data
+
+    def counting_save(data):
+        storage.saves += 1
+        original(data)
+
+    monkeypatch.setattr(storage, "save_data", counting_save)
+    return storage
+
+
+def test_script_runs_commands_and_saves_once(storage, tmp_path, capsys):
+    """
+    Test that a piped script runs every command against one manager and writes the file once.
+    """
+    script = io.StringIO(
+        "# comments and blank lines are skipped\n\n"
+        "login --username satvik\n"
+        + "".join(f"add-task --title 'Task {i}' --desc 'd' --due 2030-01-01\n" for i in range(50))
+        + "list-tasks --summary\n"
+        "not-a-command\n"
+        "serve\n"
+        "exit\n"
+        "add-task --title 'After exit' --desc d --due 2030-01-01\n"
+    )
+    manager = TaskManager(storage, outbox=Outbox(str(tmp_path / "outbox")))
+    stats = run_shell(manager, build_parser(), stream=script)
+
+    assert stats == {"commands": 54, "failed": 2}
+    assert storage.saves == 1
+    stored = JSONStorage("tasks.json").load_data()
+    assert len(stored["tasks"]) == 50 and stored["users"][0]["username"] == "satvik"
+    assert "Total: 50" in capsys.readouterr().out
+
+
+def test_shell_command_reads_script_file(storage, tmp_path):
+    """
+    Test the `shell <script>` entry point end to end through cli.main().
+    """
+    (tmp_path / "script.txt").write_text("login --username satvik\nadd-task --title A --desc d --due 2030-01-01\n")
+    main(["shell", "script.txt"])
+    assert [t["title"] for t in JSONStorage("tasks.json").load_data()["tasks"]] == ["A"]
@@ -0,0 +1,38 @@
+"""
+tests/test_startup.py
+
+Guards CLI start-up time: importing the CLI must not pull in the email stack,
+python-dotenv or Flask, which are only needed once a message is sent or the server starts.
+"""
+
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_cli_import_defers_heavy_modules():
+    """
+    Test that a fresh interpreter importing task_manager_pro.cli loads none of the deferred modules.
+    """
+    code = (
+        "import sys, task_manager_pro.cli; "
+        "print(sorted(m for m in ('smtplib', 'email.mime.multipart', 'dotenv', 'flask', 'concurrent.futures') "
+        "if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+
+
+def test_email_settings_resolve_lazily(monkeypatch):
+    """
+    Test that the emailer's configuration constants are still readable as module attributes.
+    """
+    from task_manager_pro.utils import emailer
+
+    monkeypatch.setattr(emailer, "_settings", None)
+    monkeypatch.setenv("SMTP_SERVER", "mail.example.com")
+    monkeypatch.setenv("SMTP_PORT", "2525")
+    assert emailer.SMTP_SERVER == "mail.example.com"
+    assert emailer.SMTP_PORT == 2525
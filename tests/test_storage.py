@@ -0,0 +1,129 @@
+"""
+tests/test_storage.py
+
+Unit tests for the storage backends in the Task Manager PRO application.
+Checks that SQLiteStorage round-trips data, that per-record writes
+issued by TaskManager only touch the affected rows, and that the JSON
+journal is replayed and compacted correctly.
+"""
+
+import json
+import pytest
+from task_manager_pro.services.task_manager import TaskManager
+from task_manager_pro.storage.json_storage import JSONStorage
+from task_manager_pro.storage.sqlite_storage import SQLiteStorage
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """
+    Runs each test inside a temporary directory so session files stay isolated.
+    """
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_sqlite_save_and_load_round_trip(workdir):
+    """
+    Test that save_data followed by load_data returns the same records in order.
+    """
+    storage = SQLiteStorage(str(workdir / "tasks.db"))
+    data = {
+        "users": [{"username": "satvik", "email": None, "email_reminders_enabled": True}],
+        "tasks": [
+            {"id": "b", "title": "Second", "description": "", "due_date": "2025-01-02",
+             "completed": False, "created_at": "2025-01-01 10:00:00", "user": "satvik"},
+            {"id": "a", "title": "First", "description": "", "due_date": "2025-01-01",
+             "completed": True, "created_at": "2025-01-01 09:00:00", "user": "satvik"},
+        ],
+    }
+    storage.save_data(data)
+    assert storage.load_data() == data
+
+
+def test_sqlite_record_level_writes(workdir):
+    """
+    Test that insert/update/delete only change the targeted rows.
+    """
+    storage = SQLiteStorage(str(workdir / "tasks.db"))
+    task = {"id": "t1", "title": "Read", "description": "", "due_date": "2025-12-01",
+            "completed": False, "user": "satvik"}
+    storage.insert_task({}, task)
+    storage.insert_task({}, dict(task, id="t2", title="Write"))
+
+    task["completed"] = True
+    storage.update_task({}, task)
+    storage.delete_task({}, "t2")
+
+    assert storage.load_data()["tasks"] == [task]
+
+
+def test_task_manager_persists_through_sqlite(workdir):
+    """
+    Test that TaskManager mutations are visible to a freshly opened SQLiteStorage.
+    """
+    manager = TaskManager(SQLiteStorage(str(workdir / "tasks.db")))
+    manager.login("satvik", "satvik@example.com")
+    manager.add_task("Read", "Read book", "2099-12-01")
+    task_id = manager.data["tasks"][0]["id"]
+    manager.mark_task_complete(task_id)
+    manager.toggle_email_reminders()
+
+    reloaded = SQLiteStorage(str(workdir / "tasks.db")).load_data()
+    assert reloaded["tasks"][0]["completed"] is True
+    assert reloaded["users"][0]["email_reminders_enabled"] is False
+
+    manager.delete_task(task_id)
+    assert SQLiteStorage(str(workdir / "tasks.db")).load_data()["tasks"] == []
+
+
+def test_journaled_json_appends_instead_of_rewriting(workdir):
+    """
+    Test that journaled mode leaves the snapshot untouched and replays the journal on load.
+    """
+    storage = JSONStorage(str(workdir / "tasks.json"), journaled=True)
+    snapshot_before = (workdir / "tasks.json").read_text()
+
+    manager = TaskManager(storage)
+    manager.login("satvik", "satvik@example.com")
+    manager.add_task("Read", "Read book", "2099-12-01")
+    manager.add_task("Write", "Write notes", "2099-12-02")
+    manager.delete_task(manager.data["tasks"][1]["id"])
+
+    assert (workdir / "tasks.json").read_text() == snapshot_before
+    # insert_user, insert_task + update_user (next_due_date set), insert_task, delete_task
+    assert len((workdir / "tasks.journal").read_text().splitlines()) == 5
+
+    reloaded = JSONStorage(str(workdir / "tasks.json")).load_data()
+    assert [t["title"] for t in reloaded["tasks"]] == ["Read"]
+    assert reloaded["users"][0]["username"] == "satvik"
+
+
+def test_journal_ignores_torn_final_line(workdir):
+    """
+    Test that a partially written journal entry is skipped, including after later appends.
+    """
+    storage = JSONStorage(str(workdir / "tasks.json"), journaled=True)
+    storage.insert_task({}, {"id": "t1", "title": "Read", "user": "satvik"})
+    with open(workdir / "tasks.journal", "a") as f:
+        f.write('{"op": "insert_task", "task": {"id": "t2"')
+
+    assert [t["id"] for t in storage.load_data()["tasks"]] == ["t1"]
+
+    storage.insert_task({}, {"id": "t3", "title": "Write", "user": "satvik"})
+    assert [t["id"] for t in storage.load_data()["tasks"]] == ["t1", "t3"]
+
+
+def test_journal_compacts_past_threshold(workdir):
+    """
+    Test that the journal is folded into the snapshot once it exceeds the threshold.
+    """
+    storage = JSONStorage(str(workdir / "tasks.json"), journaled=True, compact_threshold=200)
+    for i in range(5):
+        storage.insert_task({}, {"id": f"t{i}", "title": "Task", "user": "satvik"})
+    storage.wait_for_compaction()
+    storage.compact()
+
+    assert not (workdir / "tasks.journal").exists()
+    snapshot = json.loads((workdir / "tasks.json").read_text())
+    assert [t["id"] for t in snapshot["tasks"]] == [f"t{i}" for i in range(5)]
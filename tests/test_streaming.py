@@ -0,0 +1,108 @@
+"""
+tests/test_streaming.py
+
+Tests for the streaming, bounded-memory loader in JSONStorage.
+Checks that streamed records match a full load (including journal replay),
+and measures with tracemalloc that peak memory for reading one user's tasks,
+running list-tasks, and running the reminder job stays flat as the file grows.
+"""
+
+import io
+import json
+import tracemalloc
+from datetime import date
+from task_manager_pro.services.reminders import ReminderEngine
+from task_manager_pro.services.task_manager import TaskManager
+from task_manager_pro.storage.json_storage import JSONStorage, iter_json_array
+from task_manager_pro.utils.outbox import Outbox
+from task_manager_pro.utils.session import save_session
+
+
+def _write_dataset(path, n_tasks, n_users=50):
+    """
+    Writes a dataset where user0 always owns exactly 10 tasks, whatever the file size.
+    """
+    tasks = []
+    for i in range(n_tasks):
+        user = "user0" if i < 10 else f"user{1 + i % (n_users - 1)}"
+        tasks.append({"id": f"t{i}", "title": f"Task {i}", "description": "x" * 40,
+                      "due_date": "2030-01-01", "completed": i % 3 == 0, "user": user})
+    users = [{"username": f"user{i}", "email": None, "email_reminders_enabled": True} for i in range(n_users)]
+    storage = JSONStorage(str(path))
+    storage.save_data({"tasks": tasks, "users": users})
+    return storage
+
+
+def _peak(func) -> int:
+    """
+    Returns the peak traced memory (bytes) while running func.
+    """
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_iter_json_array_handles_any_chunk_boundary():
+    """
+    Test that records are decoded correctly whatever the read chunk size.
+    """
+    data = {"tasks": [{"id": str(i), "title": "a]},{\"b", "n": i * 1.5} for i in range(50)],
+            "users": [{"username": "alice"}], "version": 12345}
+    text = json.dumps(data, indent=4)
+    for chunk_size in (1, 7, 64, 1 << 20):
+        assert list(iter_json_array(io.StringIO(text), "tasks", chunk_size)) == data["tasks"]
+        assert list(iter_json_array(io.StringIO(text), "users", chunk_size)) == data["users"]
+
+
+def test_streamed_records_include_journal_changes(tmp_path):
+    """
+    Test that iter_tasks/iter_users apply pending journal entries like load_data does.
+    """
+    _write_dataset(tmp_path / "tasks.json", 20, n_users=3)
+    journaled = JSONStorage(str(tmp_path / "tasks.json"), journaled=True)
+    journaled.delete_task({}, "t1")
+    journaled.update_task({}, {"id": "t2", "title": "Changed", "user": "user0", "completed": True})
+    journaled.insert_task({}, {"id": "new", "title": "New", "user": "user0", "completed": False})
+    journaled.update_user({}, {"username": "user1", "email": "u1@example.com"})
+
+    loaded = journaled.load_data()
+    assert sorted(t["id"] for t in journaled.iter_tasks()) == sorted(t["id"] for t in loaded["tasks"])
+    assert [t["title"] for t in journaled.iter_tasks(user="user0") if t["id"] in ("t2", "new")] == ["Changed", "New"]
+    assert list(journaled.iter_users()) == loaded["users"]
+
+
+def test_user_filtered_stream_memory_is_flat(tmp_path):
+    """
+    Test that reading one user's tasks uses about the same memory for a 10x larger file,
+    and far less than json.load of the whole file.
+    """
+    small = _write_dataset(tmp_path / "small.json", 2_000)
+    large = _write_dataset(tmp_path / "large.json", 20_000)
+
+    peak_small = _peak(lambda: list(small.iter_tasks(user="user0")))
+    peak_large = _peak(lambda: list(large.iter_tasks(user="user0")))
+    peak_full = _peak(large.load_data)
+
+    assert peak_large < peak_small * 1.5
+    assert peak_large * 10 < peak_full
+
+
+def test_list_tasks_and_reminder_job_memory_is_flat(tmp_path, monkeypatch):
+    """
+    Test that a lazy TaskManager's list-tasks and the reminder job keep a flat memory peak.
+    """
+    monkeypatch.chdir(tmp_path)
+    save_session("user0")
+    peaks = {}
+    for name, n_tasks in (("small", 2_000), ("large", 20_000)):
+        storage = _write_dataset(tmp_path / f"{name}.json", n_tasks)
+        outbox = Outbox(str(tmp_path / "outbox"))
+        peaks[f"list_{name}"] = _peak(lambda: TaskManager(storage, outbox=outbox, lazy=True).list_tasks("all"))
+        engine = ReminderEngine(storage, sender=lambda **kw: None, today=date(2030, 1, 1))
+        peaks[f"job_{name}"] = _peak(engine.run)
+
+    assert peaks["list_large"] < peaks["list_small"] * 1.5
+    assert peaks["job_large"] < peaks["job_small"] * 1.5
@@ -0,0 +1,140 @@
+"""
+tests/test_task_index.py
+
+Unit tests for the TaskIndex lookup layer used by TaskManager.
+Validates id/user/username lookups and that the indexes stay in sync
+with the underlying task list after additions and order-preserving removals.
+"""
+
+import pytest
+from datetime import date
+from task_manager_pro.services import task_index
+from task_manager_pro.services.task_index import TaskIndex, due_ordinal
+
+
+def _task(task_id, user, due="2099-01-01", completed=False):
+    return {"id": task_id, "title": task_id, "description": "", "due_date": due,
+            "completed": completed, "user": user}
+
+
+@pytest.fixture
+def data():
+    return {
+        "users": [{"username": "alice"}, {"username": "bob"}],
+        "tasks": [_task("a1", "alice"), _task("b1", "bob"), _task("a2", "alice"), _task("b2", "bob")],
+    }
+
+
+def test_lookups(data):
+    """
+    Test task-by-id, tasks-by-user and user-by-username lookups.
+    """
+    index = TaskIndex(data)
+    assert index.get_task("b1")["user"] == "bob"
+    assert index.get_task("missing") is None
+    assert [t["id"] for t in index.tasks_for_user("alice")] == ["a1", "a2"]
+    assert index.tasks_for_user("nobody") == []
+    assert index.get_user("bob") is data["users"][1]
+
+
+def test_remove_keeps_list_and_indexes_in_sync(data):
+    """
+    Test that removal keeps every remaining task reachable and the list in its original order.
+    """
+    index = TaskIndex(data)
+    removed = index.remove_task("a1")
+
+    assert removed["id"] == "a1"
+    assert index.remove_task("a1") is None
+    assert [t["id"] for t in data["tasks"]] == ["b1", "a2", "b2"]
+    assert [t["id"] for t in index.tasks_for_user("alice")] == ["a2"]
+
+    index.remove_task("b2")
+    index.remove_task("a2")
+    assert [t["id"] for t in data["tasks"]] == ["b1"]
+    assert index.get_task("b1") is data["tasks"][0]
+
+
+def test_removal_order_survives_tombstone_compaction(monkeypatch):
+    """
+    Test that positions stay right across many removals, appends and slot renumbering.
+    """
+    monkeypatch.setattr(task_index, "MAX_TOMBSTONES", 4)
+    data = {"users": [], "tasks": [_task(f"t{i}", "alice") for i in range(20)]}
+    index = TaskIndex(data)
+    expected = [t["id"] for t in data["tasks"]]
+    for i in (3, 0, 19, 7, 8, 12, 5, 1, 18, 10):
+        index.remove_task(f"t{i}")
+        expected.remove(f"t{i}")
+        index.add_task(_task(f"n{i}", "alice"))
+        expected.append(f"n{i}")
+        assert [t["id"] for t in data["tasks"]] == expected
+    for task_id in ("n3", "t2", "n10"):
+        index.remove_task(task_id)
+        expected.remove(task_id)
+    assert [t["id"] for t in data["tasks"]] == expected
+
+
+def test_add_task_and_user(data):
+    """
+    Test that added records are appended to the data lists and indexed.
+    """
+    index = TaskIndex(data)
+    index.add_user({"username": "carol"})
+    index.add_task(_task("c1", "carol"))
+
+    assert data["users"][-1]["username"] == "carol"
+    assert data["tasks"][-1]["id"] == "c1"
+    assert [t["id"] for t in index.tasks_for_user("carol")] == ["c1"]
+
+
+def test_due_tasks_range_query():
+    """
+    Test that due_tasks returns only pending tasks due on or before the date, earliest first,
+    and reflects completion, due-date changes and deletion.
+    """
+    data = {"users": [], "tasks": [
+        _task("late", "alice", due="2025-03-10"),
+        _task("early", "alice", due="2025-03-01"),
+        _task("done", "alice", due="2025-02-01", completed=True),
+        _task("future", "alice", due="2025-04-01"),
+        _task("other", "bob", due="2025-01-01"),
+    ]}
+    index = TaskIndex(data)
+    today = date(2025, 3, 10)
+    assert [t["id"] for t in index.due_tasks("alice", today)] == ["early", "late"]
+
+    task = index.get_task("future")
+    task["due_date"] = "2025-02-15"
+    index.refresh_task(task)
+    task = index.get_task("early")
+    task["completed"] = True
+    index.refresh_task(task)
+    index.remove_task("late")
+
+    assert [t["id"] for t in index.due_tasks("alice", today)] == ["future"]
+    assert index.due_tasks("carol", today) == []
+
+
+def test_same_day_tasks_are_ordered_by_id():
+    """
+    Test that tasks due on the same day stay ordered by id through inserts, removals and rebuilds.
+    """
+    data = {"users": [], "tasks": [_task(task_id, "alice", due="2025-03-01") for task_id in ("c", "a", "d")]}
+    index = TaskIndex(data)
+    index.add_task(_task("b", "alice", due="2025-03-01"))
+    index.remove_task("c")
+    assert [t["id"] for t in index.due_tasks("alice", date(2025, 3, 1))] == ["a", "b", "d"]
+    assert [t["id"] for t in TaskIndex(data).due_tasks("alice", date(2025, 3, 1))] == ["a", "b", "d"]
+    assert index.next_due_date("alice") == "2025-03-01"
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2025-03-01", date(2025, 3, 1)), ("2025-3-1", date(2025, 3, 1)), ("2025-03-1", date(2025, 3, 1)),
+    ("20250301", None), ("2025-W09-6", None), ("2025-02-30", None), (None, None), (20250301, None),
+])
+def test_due_ordinal_follows_the_task_date_rule(value, expected):
+    """
+    Test that due_ordinal() accepts exactly the dates Task accepts, padded or not.
+    """
+    assert due_ordinal(value) == (expected.toordinal() if expected else None)
@@ -45,4 +45,58 @@ def test_task_dict_conversion():
     task = Task("Dict Task", "With dict", "2025-05-01")
     task_dict = task.to_dict()
     assert task_dict["title"] == "Dict Task"
-    assert "created_at" in task_dict
\ No newline at end of file
+    assert "created_at" in task_dict
+
+
+def test_task_from_dict_round_trip_is_lossless():
+    """
+    Test that from_dict() keeps id, owner, creation time and unknown keys,
+    so a stored record survives a round trip unchanged.
+    """
+    record = {
+        "id": "abc123",
+        "title": "Stored",
+        "description": "From disk",
+        "due_date": "2025-05-01",
+        "completed": True,
+        "created_at": "2024-12-31 08:15:00",
+        "user": "alice",
+        "priority": "high",
+    }
+    task = Task.from_dict(record)
+    assert task.id == "abc123"
+    assert task.user == "alice"
+    assert task.created_at == "2024-12-31 08:15:00"
+    assert task.to_dict() == record
+
+
+def test_task_uses_slots():
+    """
+    Test that Task instances carry no per-instance __dict__.
+    """
+    task = Task("Slim", "No dict", "2025-05-01")
+    assert not hasattr(task, "__dict__")
+
+
+def test_task_rejects_invalid_due_date():
+    """
+    Test that creating a task with a malformed due date raises ValueError.
+    """
+    with pytest.raises(ValueError):
+        Task("Bad", "Date", "2025-13-45")
+
+
+@pytest.mark.parametrize("due", ["20250501", "2025-W18-4", "2025-05-01T00:00", "2025-13-01", ""])
+def test_task_due_date_follows_strict_format(due):
+    """
+    Test that the model rejects compact, week and datetime forms that date.fromisoformat() would accept.
+    """
+    with pytest.raises(ValueError):
+        Task("Bad", "Date", due)
+
+
+def test_task_due_date_is_zero_padded():
+    """
+    Test that an unpadded but valid 'YYYY-M-D' date is accepted and stored zero-padded.
+    """
+    assert Task("Pad", "Date", "2025-5-1").due_date == "2025-05-01"